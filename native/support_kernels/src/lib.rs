@@ -0,0 +1,114 @@
+//! 지지 조건 분석기(SupportAnalyzer) 핫 커널
+//!
+//! strategy/support_analyzer.py의 numba 커널과 같은 계산을 미리 컴파일해 두어
+//! 장 시작 직후 첫 호출에도 JIT 컴파일 지연이 없도록 합니다.
+//! 외부 크레이트 없이 C ABI 함수만 내보내고, 파이썬 쪽은 support_kernels/__init__.py가
+//! ctypes로 불러 NumPy 배열(float64, C 연속)을 넘깁니다.
+//!
+//! 설치: `pip install native/support_kernels` (Rust 툴체인 필요)
+//! 미설치 시 SupportAnalyzer는 numba 또는 NumPy 구현을 사용합니다.
+
+use std::slice;
+
+/// 포인터/길이로 받은 배열을 슬라이스로 변환 (길이 0이면 포인터를 읽지 않음)
+unsafe fn as_slice<'a, T>(ptr: *const T, len: usize) -> &'a [T] {
+    if len == 0 || ptr.is_null() {
+        &[]
+    } else {
+        slice::from_raw_parts(ptr, len)
+    }
+}
+
+/// 마지막 시점 RSI (최근 period개 변화량의 단순 평균 기준)
+///
+/// 반환값: 0 = 성공(*out에 RSI 기록), -1 = 종가 개수가 period + 1 미만
+///
+/// # Safety
+/// close는 n개의 f64를 읽을 수 있어야 하고 out은 쓰기 가능한 f64 주소여야 합니다.
+#[no_mangle]
+pub unsafe extern "C" fn sk_rsi_last(close: *const f64, n: usize, period: usize, out: *mut f64) -> i32 {
+    if period == 0 || n <= period || out.is_null() {
+        return -1;
+    }
+    let close = as_slice(close, n);
+
+    let mut gain = 0.0;
+    let mut loss = 0.0;
+    for i in n - period..n {
+        let delta = close[i] - close[i - 1];
+        // NaN 변화량은 상승/하락 어느 쪽에도 포함하지 않음
+        if delta > 0.0 {
+            gain += delta;
+        } else if delta < 0.0 {
+            loss -= delta;
+        }
+    }
+
+    let avg_gain = gain / period as f64;
+    let avg_loss = loss / period as f64;
+    *out = if avg_loss == 0.0 {
+        if avg_gain == 0.0 { 50.0 } else { 100.0 }
+    } else {
+        100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    };
+    0
+}
+
+/// 구간 최솟값 (out[j] = min(values[j..j + window])) - 단조 덱으로 원소당 상수 시간
+fn rolling_min(values: &[f64], window: usize) -> Vec<f64> {
+    let n = values.len();
+    let mut out = Vec::with_capacity(n + 1 - window);
+    let mut queue = vec![0usize; n];
+    let mut head = 0;
+    let mut tail = 0;
+    for (i, &value) in values.iter().enumerate() {
+        while tail > head && values[queue[tail - 1]] >= value {
+            tail -= 1;
+        }
+        queue[tail] = i;
+        tail += 1;
+        if queue[head] + window <= i {
+            head += 1;
+        }
+        if i + 1 >= window {
+            out.push(values[queue[head]]);
+        }
+    }
+    out
+}
+
+/// 앞뒤 lookback 구간의 최저점인 저점 인덱스를 out에 기록하고 개수 반환
+///
+/// # Safety
+/// lows는 n개의 f64를 읽을 수 있어야 하고, out은 n - 2 * lookback개(n이 더 작으면 0개)의
+/// i64를 쓸 수 있어야 합니다.
+#[no_mangle]
+pub unsafe extern "C" fn sk_find_pivots(lows: *const f64, n: usize, lookback: usize, out: *mut i64) -> usize {
+    let span = match lookback.checked_mul(2) {
+        Some(span) if lookback > 0 && n > span && !out.is_null() => span,
+        _ => return 0,
+    };
+    let lows = as_slice(lows, n);
+    let out = slice::from_raw_parts_mut(out, n - span);
+
+    let window_min = rolling_min(lows, lookback); // window_min[j] = min(lows[j..j + lookback])
+    let mut count = 0;
+    for i in lookback..n - lookback {
+        let current = lows[i];
+        if current <= window_min[i - lookback] && current <= window_min[i + 1] {
+            out[count] = i as i64;
+            count += 1;
+        }
+    }
+    count
+}
+
+/// 허용 오차 내 지지선 존재 여부 (1 = 있음, 0 = 없음)
+///
+/// # Safety
+/// levels는 n개의 f64를 읽을 수 있어야 합니다.
+#[no_mangle]
+pub unsafe extern "C" fn sk_near_support(price: f64, levels: *const f64, n: usize, tolerance: f64) -> i32 {
+    let levels = as_slice(levels, n);
+    levels.iter().any(|&level| (price - level).abs() / level <= tolerance) as i32
+}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+SupportAnalyzer 핫 커널 (Rust)
+native/support_kernels/src/lib.rs의 C ABI 함수를 ctypes로 불러 strategy/support_analyzer.py의
+numba 커널과 같은 시그니처로 제공합니다. 입력 배열은 C 연속 float64로 변환해 넘깁니다.
+"""
+
+import ctypes
+import glob
+import os
+
+import numpy as np
+
+
+def _load_library() -> ctypes.CDLL:
+    """패키지 디렉터리에 설치된 공유 라이브러리 로드"""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for pattern in ('_support_kernels*.so', '_support_kernels*.dylib', '_support_kernels*.pyd', '_support_kernels*.dll'):
+        candidates = glob.glob(os.path.join(package_dir, pattern))
+        if candidates:
+            return ctypes.CDLL(candidates[0])
+    raise ImportError("support_kernels 공유 라이브러리를 찾을 수 없습니다 (pip install native/support_kernels)")
+
+
+_lib = _load_library()
+
+_f64_p = ctypes.POINTER(ctypes.c_double)
+_i64_p = ctypes.POINTER(ctypes.c_int64)
+
+_lib.sk_rsi_last.argtypes = (_f64_p, ctypes.c_size_t, ctypes.c_size_t, _f64_p)
+_lib.sk_rsi_last.restype = ctypes.c_int32
+_lib.sk_find_pivots.argtypes = (_f64_p, ctypes.c_size_t, ctypes.c_size_t, _i64_p)
+_lib.sk_find_pivots.restype = ctypes.c_size_t
+_lib.sk_near_support.argtypes = (ctypes.c_double, _f64_p, ctypes.c_size_t, ctypes.c_double)
+_lib.sk_near_support.restype = ctypes.c_int32
+
+
+def _as_f64(values) -> np.ndarray:
+    """커널 입력용 C 연속 float64 배열 (float32 입력은 float64로 변환)"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def rsi_last(close, period: int) -> float:
+    """마지막 시점 RSI (최근 period개 변화량의 단순 평균 기준)"""
+    close = _as_f64(close)
+    if period <= 0:
+        raise ValueError("period는 1 이상이어야 합니다")
+    result = ctypes.c_double()
+    if _lib.sk_rsi_last(close.ctypes.data_as(_f64_p), close.shape[0], period, ctypes.byref(result)) != 0:
+        raise ValueError("종가 개수는 period + 1 이상이어야 합니다")
+    return result.value
+
+
+def find_pivots(lows, lookback: int) -> np.ndarray:
+    """앞뒤 lookback 구간의 최저점인 저점 인덱스"""
+    lows = _as_f64(lows)
+    if lookback <= 0:
+        return np.empty(0, dtype=np.int64)
+    out = np.empty(max(lows.shape[0] - 2 * lookback, 0), dtype=np.int64)
+    count = _lib.sk_find_pivots(lows.ctypes.data_as(_f64_p), lows.shape[0], lookback, out.ctypes.data_as(_i64_p))
+    return out[:count]
+
+
+def near_support(price: float, levels, tolerance: float) -> bool:
+    """허용 오차 내 지지선 존재 여부"""
+    levels = _as_f64(levels)
+    return bool(_lib.sk_near_support(price, levels.ctypes.data_as(_f64_p), levels.shape[0], tolerance))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+support_kernels(Rust) 결과가 strategy/support_analyzer.py의 파이썬/NumPy 구현과 같은지 확인합니다.
+실행: pip install native/support_kernels && python -m pytest native/support_kernels/tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+support_kernels = pytest.importorskip("support_kernels")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from strategy.support_analyzer import _near_support_np, _rsi_last_py, _support_pivots_window  # noqa: E402
+
+
+def _price_series(rng, n, integer=False):
+    """랜덤 워크 가격 (integer=True면 원 단위로 반올림해 같은 값이 자주 나오도록)"""
+    prices = 10000 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    return np.round(prices) if integer else prices
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("integer", [False, True])
+def test_rsi_last_matches_python(seed, integer):
+    rng = np.random.default_rng(seed)
+    close = _price_series(rng, int(rng.integers(15, 200)), integer)
+    for period in (1, 5, 14):
+        assert support_kernels.rsi_last(close, period) == _rsi_last_py(close, period)
+
+
+def test_rsi_last_flat_and_float32():
+    flat = np.full(30, 1000.0)
+    assert support_kernels.rsi_last(flat, 14) == _rsi_last_py(flat, 14) == 50.0
+
+    rising = np.arange(30, dtype=np.float32)
+    assert support_kernels.rsi_last(rising, 14) == _rsi_last_py(rising.astype(np.float64), 14) == 100.0
+
+
+def test_rsi_last_rejects_short_input():
+    with pytest.raises(ValueError):
+        support_kernels.rsi_last(np.arange(14.0), 14)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("integer", [False, True])
+def test_find_pivots_matches_window(seed, integer):
+    rng = np.random.default_rng(seed)
+    lows = _price_series(rng, int(rng.integers(50, 500)), integer)
+    for lookback in (1, 3, 20):
+        result = support_kernels.find_pivots(lows, lookback)
+        assert result.dtype == np.int64
+        np.testing.assert_array_equal(result, _support_pivots_window(lows, lookback))
+
+
+def test_find_pivots_short_input():
+    assert support_kernels.find_pivots(np.arange(40.0), 20).size == 0
+    np.testing.assert_array_equal(
+        support_kernels.find_pivots(np.full(41, 5.0), 20), _support_pivots_window(np.full(41, 5.0), 20)
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_near_support_matches_numpy(seed):
+    rng = np.random.default_rng(seed)
+    levels = _price_series(rng, int(rng.integers(1, 600)))
+    for price in rng.uniform(levels.min() * 0.9, levels.max() * 1.1, 50):
+        for tolerance in (0.001, 0.01, 0.02):
+            assert support_kernels.near_support(price, levels, tolerance) == _near_support_np(price, levels, tolerance)
+
+
+def test_near_support_edges():
+    levels = np.array([1000.0, 2000.0])
+    assert support_kernels.near_support(1020.0, levels, 0.02) == _near_support_np(1020.0, levels, 0.02)
+    assert support_kernels.near_support(1000.0, np.empty(0), 0.02) is False
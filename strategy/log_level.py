@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+로그 레벨 확인 (Log Level)
+디버그 메시지 포맷 비용을 줄이기 위해 utils.enhanced_logging의 DEBUG 출력 여부를 확인합니다.
+"""
+
+import logging
+from typing import List, Optional
+
+import utils.enhanced_logging as enhanced_logging
+
+
+_debug_loggers: Optional[List[logging.Logger]] = None
+
+
+def _find_debug_loggers() -> List[logging.Logger]:
+    """enhanced_logging이 실제로 쓰는 로거 목록 (모듈 전역에 보관된 Logger 객체)"""
+    return [value for value in vars(enhanced_logging).values() if isinstance(value, logging.Logger)]
+
+
+def debug_enabled() -> bool:
+    """log_debug 출력 여부 - 꺼져 있으면 디버그 메시지 포맷 자체를 생략
+    
+    enhanced_logging이 레벨 확인 함수를 제공하면 그대로 사용하고, 아니면 모듈이 보관한 로거의 레벨을 확인합니다.
+    어느 로거로 출력하는지 알 수 없으면 기존처럼 항상 출력하도록 True를 반환합니다.
+    """
+    global _debug_loggers
+    
+    is_debug_enabled = getattr(enhanced_logging, 'is_debug_enabled', None)
+    if callable(is_debug_enabled):
+        return bool(is_debug_enabled())
+    
+    if _debug_loggers is None:
+        _debug_loggers = _find_debug_loggers()
+    if not _debug_loggers:
+        return True
+    return any(logger.isEnabledFor(logging.DEBUG) for logger in _debug_loggers)
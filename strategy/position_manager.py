@@ -4,23 +4,129 @@
 투매폭 매수 후 포지션의 손절/익절을 관리합니다.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+import heapq
 import json
+import os
+import sys
+import time
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow 미설치 시 JSON 스냅샷 사용
+    pa = None
+    feather = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 시 NumPy 경로 사용
+    njit = None
+
+from utils.calculator import TumepokCalculator
 from utils.enhanced_logging import log_info, log_error, log_debug, log_warning
+from .log_level import debug_enabled
+
+
+# 수수료 포함 수익률 계산식은 TumepokCalculator가 단일 기준 - 틱마다 속성 조회하지 않도록 바인딩
+_calculate_profit_rate = TumepokCalculator.calculate_profit_rate
+
+# 내부 시각은 time.monotonic_ns() 정수로 보관하고, 저장/조회 시에만 datetime으로 변환
+_NS_PER_SEC = 1_000_000_000
+_NS_PER_DAY = 86400 * _NS_PER_SEC
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """monotonic ns -> datetime"""
+    return datetime.fromtimestamp((ns + _WALL_OFFSET_NS) / _NS_PER_SEC)
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """datetime -> monotonic ns"""
+    return int(dt.timestamp() * _NS_PER_SEC) - _WALL_OFFSET_NS
+
+
+# 매도 신호 비트 (bit0: 손절, bit1: 트레일링) - 둘 다 켜지면 손절 우선
+_SIGNAL_NAMES = (None, "STOP_LOSS", "TRAILING_SELL", "STOP_LOSS")
+
+
+def _trail_threshold_mult(trailing_sell_rate: float) -> float:
+    """트레일링 매도 기준 배수: 현재가 <= 고점 * 배수 이면 매도 (-1% -> 0.99)"""
+    return (100 - abs(trailing_sell_rate)) / 100
+
+
+def _scan_sell_signals_numpy(pr, cur, th, ta, sl, tm, out):
+    """매도 조건 스캔 (NumPy)"""
+    stop = pr <= sl
+    trail = ta & (th > 0) & (cur <= th * tm)
+    np.bitwise_or(stop, trail.astype(np.int8) << 1, out=out, casting='unsafe')
+
+
+if njit is not None:
+    # 분기 없는 비트 인코딩 (나눗셈 없이 곱셈 비교)
+    @njit("void(float64[:], float64[:], float64[:], boolean[:], float64[:], float64[:], int8[:])",
+          cache=True, fastmath=True, parallel=True)
+    def _scan_sell_signals(pr, cur, th, ta, sl, tm, out):
+        """매도 조건 스캔 (Numba, 임포트 시 컴파일)"""
+        for i in prange(pr.shape[0]):
+            out[i] = np.int8(pr[i] <= sl[i]) | (np.int8(ta[i] & (th[i] > 0) & (cur[i] <= th[i] * tm[i])) << 1)
+else:
+    _scan_sell_signals = _scan_sell_signals_numpy
+
+
+_STAGE_POOL_SIZE = 1024
 
 
 class BuyStageInfo:
     """매수 단계 정보"""
     
+    __slots__ = ('stage', 'price', 'quantity', 'amount', 'buy_time_ns')
+    
+    # 해제된 객체 재사용 풀 (백테스트처럼 생성/삭제가 잦을 때 할당 감소)
+    _pool: List['BuyStageInfo'] = []
+    
     def __init__(self, stage: str, price: float, quantity: int, amount: float):
+        self.reinit(stage, price, quantity, amount)
+    
+    def reinit(self, stage: str, price: float, quantity: int, amount: float):
+        """필드 재설정"""
         self.stage = stage  # 1차, 2차, 3차
         self.price = price
         self.quantity = quantity
         self.amount = amount
-        self.buy_time = datetime.now()
+        self.buy_time_ns = time.monotonic_ns()
+    
+    @classmethod
+    def acquire(cls, stage: str, price: float, quantity: int, amount: float) -> 'BuyStageInfo':
+        """풀에서 꺼내 재설정 (풀이 비어 있으면 새로 생성)"""
+        if cls._pool:
+            stage_info = cls._pool.pop()
+            stage_info.reinit(stage, price, quantity, amount)
+            return stage_info
+        return cls(stage, price, quantity, amount)
+    
+    def release(self):
+        """풀로 반환 (반환 후에는 사용하지 말 것)"""
+        if len(self._pool) < _STAGE_POOL_SIZE:
+            self.stage = None
+            self._pool.append(self)
+    
+    @property
+    def buy_time(self) -> datetime:
+        return _ns_to_datetime(self.buy_time_ns)
+    
+    @buy_time.setter
+    def buy_time(self, value: datetime):
+        self.buy_time_ns = _datetime_to_ns(value)
     
     def to_dict(self) -> dict:
         return {
@@ -33,7 +139,7 @@ class BuyStageInfo:
     
     @classmethod
     def from_dict(cls, data: dict):
-        stage_info = cls(
+        stage_info = cls.acquire(
             stage=data['stage'],
             price=data['price'],
             quantity=data['quantity'],
@@ -46,6 +152,12 @@ class BuyStageInfo:
 class PositionInfo:
     """포지션 정보"""
     
+    __slots__ = ('stock_code', 'buy_stages', 'total_quantity', 'total_amount',
+                 'weighted_avg_price', 'current_price', 'profit_rate', 'profit_amount',
+                 'trailing_activated', 'trailing_high', 'trailing_trigger_rate',
+                 '_trailing_sell_rate', '_trail_threshold_mult', 'stop_loss_rate', 'status',
+                 'create_time_ns', 'last_update_ns')
+    
     def __init__(self, stock_code: str):
         self.stock_code = stock_code
         self.buy_stages: List[BuyStageInfo] = []
@@ -67,8 +179,24 @@ class PositionInfo:
         
         # 상태
         self.status = "HOLDING"  # HOLDING, TRAILING, SOLD
-        self.create_time = datetime.now()
-        self.last_update = datetime.now()
+        self.create_time_ns = time.monotonic_ns()
+        self.last_update_ns = self.create_time_ns
+    
+    @property
+    def create_time(self) -> datetime:
+        return _ns_to_datetime(self.create_time_ns)
+    
+    @create_time.setter
+    def create_time(self, value: datetime):
+        self.create_time_ns = _datetime_to_ns(value)
+    
+    @property
+    def last_update(self) -> datetime:
+        return _ns_to_datetime(self.last_update_ns)
+    
+    @last_update.setter
+    def last_update(self, value: datetime):
+        self.last_update_ns = _datetime_to_ns(value)
     
     def add_buy_stage(self, stage_info: BuyStageInfo):
         """매수 단계 추가"""
@@ -79,7 +207,8 @@ class PositionInfo:
         # 가중평균 매입가 재계산
         self.calculate_weighted_avg_price()
         
-        log_debug(f"{self.stock_code} {stage_info.stage} 매수 추가: {stage_info.quantity}주 @ {stage_info.price:,}원")
+        if debug_enabled():
+            log_debug(f"{self.stock_code} {stage_info.stage} 매수 추가: {stage_info.quantity}주 @ {stage_info.price:,}원")
     
     def calculate_weighted_avg_price(self):
         """가중평균 매입가 계산"""
@@ -91,12 +220,11 @@ class PositionInfo:
     def update_current_price(self, current_price: float):
         """현재가 업데이트"""
         self.current_price = current_price
-        self.last_update = datetime.now()
+        self.last_update_ns = time.monotonic_ns()
         
         # 수익률 계산 (수수료 포함)
         if self.weighted_avg_price > 0:
-            from utils.calculator import TumepokCalculator
-            self.profit_rate = TumepokCalculator.calculate_profit_rate(self.weighted_avg_price, current_price)
+            self.profit_rate = _calculate_profit_rate(self.weighted_avg_price, current_price)
             self.profit_amount = (current_price - self.weighted_avg_price) * self.total_quantity
         
         # 트레일링 스탑 관리
@@ -114,6 +242,15 @@ class PositionInfo:
         if self.trailing_activated and self.current_price > self.trailing_high:
             self.trailing_high = self.current_price
     
+    @property
+    def trailing_sell_rate(self) -> float:
+        return self._trailing_sell_rate
+    
+    @trailing_sell_rate.setter
+    def trailing_sell_rate(self, value: float):
+        self._trailing_sell_rate = value
+        self._trail_threshold_mult = _trail_threshold_mult(value)
+    
     def check_sell_conditions(self) -> Optional[str]:
         """매도 조건 확인"""
         # 손절 확인
@@ -121,13 +258,17 @@ class PositionInfo:
             return "STOP_LOSS"
         
         # 트레일링 매도 확인
-        if self.trailing_activated:
-            trailing_drop_rate = ((self.trailing_high - self.current_price) / self.trailing_high) * 100
-            if trailing_drop_rate >= abs(self.trailing_sell_rate):
-                return "TRAILING_SELL"
+        if self.trailing_activated and self.current_price <= self.trailing_high * self._trail_threshold_mult:
+            return "TRAILING_SELL"
         
         return None
     
+    def release_stages(self):
+        """매수 단계 객체를 풀로 반환"""
+        for stage_info in self.buy_stages:
+            stage_info.release()
+        self.buy_stages.clear()
+    
     def get_sell_quantity(self) -> int:
         """매도 수량 반환"""
         return self.total_quantity
@@ -181,40 +322,355 @@ class PositionInfo:
         return position
 
 
+def _row_property(array_name: str, cast):
+    """PositionView용: 매니저 SoA 배열의 현재 행 값을 읽는 프로퍼티"""
+    def getter(self):
+        pm = self._pm
+        return cast(getattr(pm, array_name)[pm._idx[self._code]])
+    return property(getter)
+
+
+class PositionView:
+    """PositionManager SoA 배열 위의 포지션 조회 뷰
+    
+    PositionInfo와 같은 이름으로 값을 읽을 수 있는 읽기 전용 객체입니다.
+    포지션이 제거된 뒤 접근하면 KeyError가 발생합니다.
+    """
+    
+    __slots__ = ('_pm', '_code')
+    
+    def __init__(self, pm: 'PositionManager', stock_code: str):
+        self._pm = pm
+        self._code = stock_code
+    
+    @property
+    def stock_code(self) -> str:
+        return self._code
+    
+    @property
+    def buy_stages(self) -> List[BuyStageInfo]:
+        return self._pm._stages[self._pm._idx[self._code]]
+    
+    @property
+    def status(self) -> str:
+        return self._pm._status[self._pm._idx[self._code]]
+    
+    weighted_avg_price = _row_property('_wavg', float)
+    current_price = _row_property('_current', float)
+    profit_rate = _row_property('_profit_rate', float)
+    profit_amount = _row_property('_profit_amount', float)
+    total_quantity = _row_property('_quantity', int)
+    total_amount = _row_property('_total_amount', float)
+    trailing_activated = _row_property('_trailing_activated', bool)
+    trailing_high = _row_property('_trailing_high', float)
+    trailing_trigger_rate = _row_property('_trigger', float)
+    trailing_sell_rate = _row_property('_trailing_sell', float)
+    stop_loss_rate = _row_property('_stop_loss', float)
+    create_time_ns = _row_property('_create_ns', int)
+    last_update_ns = _row_property('_last_update_ns', int)
+    
+    @property
+    def create_time(self) -> datetime:
+        return _ns_to_datetime(self.create_time_ns)
+    
+    @property
+    def last_update(self) -> datetime:
+        return _ns_to_datetime(self.last_update_ns)
+    
+    def update_current_price(self, current_price: float):
+        """현재가 업데이트 (매니저 일괄 경로 사용)"""
+        self._pm.update_position(self._code, current_price)
+    
+    def check_sell_conditions(self) -> Optional[str]:
+        """매도 조건 확인"""
+        signals = self._pm._sell_signals(np.array([self._pm._idx[self._code]]))
+        return signals[0][1] if signals else None
+    
+    def get_sell_quantity(self) -> int:
+        """매도 수량 반환"""
+        return self.total_quantity
+    
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return self._pm._row_to_position(self._pm._idx[self._code]).to_dict()
+
+
 class PositionManager:
-    """포지션 관리자"""
+    """포지션 관리자
+    
+    포지션 값은 종목별 행으로 구성된 SoA 배열에 보관하고,
+    조회 시에는 PositionView를 돌려줍니다.
+    """
+    
+    _INITIAL_CAPACITY = 64
+    _DATAFRAME_COLUMNS = ['종목코드', '매입가', '현재가', '수량', '수익률(%)', '수익금액', '트레일링', '상태']
+    
+    # 화면 표시용 포맷 (DataFrame 자체는 숫자형 유지)
+    DISPLAY_FORMATTERS = {
+        '매입가': '{:,.0f}'.format,
+        '현재가': '{:,.0f}'.format,
+        '수량': '{:,}'.format,
+        '수익률(%)': '{:+.2f}'.format,
+        '수익금액': '{:+,.0f}'.format,
+    }
+    
+    # SoA 배열 (이름, dtype)
+    _ARRAY_SPECS = (
+        ('_wavg', np.float64),
+        ('_current', np.float64),
+        ('_profit_rate', np.float64),
+        ('_profit_amount', np.float64),
+        ('_quantity', np.int64),
+        ('_total_amount', np.float64),
+        ('_trigger', np.float64),
+        ('_trailing_high', np.float64),
+        ('_trailing_activated', np.bool_),
+        ('_stop_loss', np.float64),
+        ('_trailing_sell', np.float64),
+        ('_trail_mult', np.float64),
+        ('_create_ns', np.int64),
+        ('_last_update_ns', np.int64),
+    )
     
     def __init__(self):
-        self.positions: Dict[str, PositionInfo] = {}
-        
         # 기본 설정
         self.stop_loss_rate = -2.0
         self.trailing_trigger_rate = 2.0
         self.trailing_sell_rate = -1.0
         
+        # 종목코드 flyweight: 한 번 부여한 정수 ID는 재사용하지 않음
+        self._code_to_id: Dict[str, int] = {}
+        self._id_to_code: List[str] = []
+        self._row_of_id = np.full(self._INITIAL_CAPACITY, -1, dtype=np.int64)
+        
+        # 포지션 저장소: SoA 배열 + 행별 리스트 (행 순서 = 추가 순서)
+        self._codes: List[str] = []
+        self._idx: Dict[str, int] = {}
+        self._stages: List[List[BuyStageInfo]] = []
+        self._status: List[str] = []
+        self._allocate_arrays(self._INITIAL_CAPACITY)
+        
+        # 만료 정리용 (last_update_ns, code_id) 최소 힙 - 오래된 항목은 pop 시 지연 삭제
+        self._expiry_heap: List[Tuple[int, int]] = []
+        
+        # DataFrame 캐시 (변경 시에만 재생성)
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_dirty = True
+        
+        # 수익/통계 캐시 (None이면 재계산 필요)
+        self._profit_cache: Optional[dict] = None
+        self._stats_cache: Optional[dict] = None
+        
         log_info("포지션 관리자 초기화 완료")
     
+    @property
+    def positions(self) -> Dict[str, PositionView]:
+        """종목코드별 포지션 뷰 (호환용, 호출마다 새 dict)"""
+        return {code: PositionView(self, code) for code in self._codes}
+    
+    def _mark_dirty(self):
+        """포지션 변경 시 DataFrame/통계 캐시 무효화"""
+        self._df_dirty = True
+        self._profit_cache = None
+        self._stats_cache = None
+    
+    def _allocate_arrays(self, capacity: int):
+        """SoA 배열 할당"""
+        for name, dtype in self._ARRAY_SPECS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def _ensure_capacity(self, size: int):
+        """배열 용량 확보 (부족하면 2배로 확장)"""
+        capacity = len(self._wavg)
+        if size <= capacity:
+            return
+        
+        while capacity < size:
+            capacity *= 2
+        
+        for name, _ in self._ARRAY_SPECS:
+            old = getattr(self, name)
+            new = np.resize(old, capacity)
+            new[len(old):] = 0
+            setattr(self, name, new)
+    
+    def get_code_id(self, stock_code: str) -> int:
+        """종목코드의 정수 ID 조회 (없으면 intern 후 새로 부여)"""
+        code_id = self._code_to_id.get(stock_code)
+        if code_id is None:
+            stock_code = sys.intern(stock_code)
+            code_id = len(self._id_to_code)
+            self._code_to_id[stock_code] = code_id
+            self._id_to_code.append(stock_code)
+            if code_id >= len(self._row_of_id):
+                grown = np.full(len(self._row_of_id) * 2, -1, dtype=np.int64)
+                grown[:len(self._row_of_id)] = self._row_of_id
+                self._row_of_id = grown
+        return code_id
+    
+    def _append_row(self, stock_code: str) -> int:
+        """새 포지션 행 추가 (현재 설정값 적용, 만료 힙 등록은 호출자가 처리)"""
+        code_id = self.get_code_id(stock_code)
+        stock_code = self._id_to_code[code_id]
+        
+        i = len(self._codes)
+        self._ensure_capacity(i + 1)
+        self._codes.append(stock_code)
+        self._idx[stock_code] = i
+        self._row_of_id[code_id] = i
+        self._stages.append([])
+        self._status.append("HOLDING")
+        
+        for name, _ in self._ARRAY_SPECS:
+            getattr(self, name)[i] = 0
+        self._apply_settings_to_row(i)
+        now_ns = time.monotonic_ns()
+        self._create_ns[i] = now_ns
+        self._last_update_ns[i] = now_ns
+        
+        self._mark_dirty()
+        return i
+    
+    def _apply_settings_to_row(self, i: int):
+        """매니저 설정값을 행에 적용"""
+        self._stop_loss[i] = self.stop_loss_rate
+        self._trigger[i] = self.trailing_trigger_rate
+        self._trailing_sell[i] = self.trailing_sell_rate
+        self._trail_mult[i] = _trail_threshold_mult(self.trailing_sell_rate)
+    
+    def _push_expiry(self, code_id: int, last_update_ns: int):
+        """만료 힙에 갱신 시각 기록 (오래된 항목이 쌓이면 현재 포지션 기준으로 재구성)"""
+        heap = self._expiry_heap
+        if len(heap) > 4 * len(self._codes) + 64:
+            self._rebuild_expiry_heap()
+        heapq.heappush(heap, (last_update_ns, code_id))
+    
+    def _rebuild_expiry_heap(self):
+        """현재 포지션 기준으로 만료 힙 재구성"""
+        n = len(self._codes)
+        code_to_id = self._code_to_id
+        heap = self._expiry_heap
+        heap[:] = [(ts, code_to_id[code]) for code, ts in zip(self._codes, self._last_update_ns[:n].tolist())]
+        heapq.heapify(heap)
+    
+    def _remove_row(self, stock_code: str):
+        """SoA 배열에서 행 제거 (삽입 순서 유지)"""
+        i = self._idx.pop(stock_code, None)
+        if i is None:
+            return
+        
+        n = len(self._codes)
+        for name, _ in self._ARRAY_SPECS:
+            arr = getattr(self, name)
+            arr[i:n - 1] = arr[i + 1:n]
+        
+        del self._codes[i]
+        del self._stages[i]
+        del self._status[i]
+        self._row_of_id[self._code_to_id[stock_code]] = -1
+        for j in range(i, n - 1):
+            code = self._codes[j]
+            self._idx[code] = j
+            self._row_of_id[self._code_to_id[code]] = j
+        self._mark_dirty()
+    
+    def _sell_signals(self, rows) -> List[Tuple[str, str]]:
+        """지정한 행(slice 또는 인덱스 배열)의 매도 신호 계산"""
+        pr = self._profit_rate[rows]
+        out = np.empty(pr.shape[0], dtype=np.int8)
+        
+        # 손절 / 트레일링 매도 조건을 한 번에 계산
+        _scan_sell_signals(pr, self._current[rows], self._trailing_high[rows],
+                           self._trailing_activated[rows], self._stop_loss[rows],
+                           self._trail_mult[rows], out)
+        
+        hits = np.flatnonzero(out)
+        if hits.size == 0:
+            return []
+        
+        codes = self._codes
+        row_ids = np.arange(len(codes))[rows]
+        return [(codes[row_ids[k]], _SIGNAL_NAMES[out[k]]) for k in hits]
+    
+    def _clear_positions(self):
+        """전체 포지션 제거 (매수 단계 객체는 풀로 반환)"""
+        for stages in self._stages:
+            for stage_info in stages:
+                stage_info.release()
+        
+        self._codes = []
+        self._idx = {}
+        self._stages = []
+        self._status = []
+        self._row_of_id[:] = -1
+        self._expiry_heap = []
+        self._allocate_arrays(self._INITIAL_CAPACITY)
+        self._mark_dirty()
+    
+    def _row_to_position(self, i: int) -> PositionInfo:
+        """행 값을 PositionInfo 레코드로 변환 (저장/내보내기용)"""
+        position = PositionInfo(self._codes[i])
+        position.buy_stages = list(self._stages[i])
+        position.total_quantity = int(self._quantity[i])
+        position.total_amount = float(self._total_amount[i])
+        position.weighted_avg_price = float(self._wavg[i])
+        position.current_price = float(self._current[i])
+        position.profit_rate = float(self._profit_rate[i])
+        position.profit_amount = float(self._profit_amount[i])
+        position.trailing_activated = bool(self._trailing_activated[i])
+        position.trailing_high = float(self._trailing_high[i])
+        position.trailing_trigger_rate = float(self._trigger[i])
+        position.trailing_sell_rate = float(self._trailing_sell[i])
+        position.stop_loss_rate = float(self._stop_loss[i])
+        position.status = self._status[i]
+        position.create_time_ns = int(self._create_ns[i])
+        position.last_update_ns = int(self._last_update_ns[i])
+        return position
+    
+    def _append_position(self, position: PositionInfo):
+        """PositionInfo 레코드를 새 행으로 추가 (매수 단계 객체 소유권 이전)"""
+        i = self._append_row(position.stock_code)
+        self._stages[i] = position.buy_stages
+        self._status[i] = position.status
+        self._quantity[i] = position.total_quantity
+        self._total_amount[i] = position.total_amount
+        self._wavg[i] = position.weighted_avg_price
+        self._current[i] = position.current_price
+        self._profit_rate[i] = position.profit_rate
+        self._profit_amount[i] = position.profit_amount
+        self._trailing_activated[i] = position.trailing_activated
+        self._trailing_high[i] = position.trailing_high
+        self._trigger[i] = position.trailing_trigger_rate
+        self._trailing_sell[i] = position.trailing_sell_rate
+        self._trail_mult[i] = position._trail_threshold_mult
+        self._stop_loss[i] = position.stop_loss_rate
+        self._create_ns[i] = position.create_time_ns
+        self._last_update_ns[i] = position.last_update_ns
+    
     def add_position(self, stock_code: str, stage: str, price: float, 
                     quantity: int, amount: float) -> bool:
         """포지션 추가 또는 기존 포지션에 매수 단계 추가"""
         try:
             # 기존 포지션이 있는지 확인
-            if stock_code not in self.positions:
-                self.positions[stock_code] = PositionInfo(stock_code)
-            
-            position = self.positions[stock_code]
-            
-            # 설정값 적용
-            position.stop_loss_rate = self.stop_loss_rate
-            position.trailing_trigger_rate = self.trailing_trigger_rate
-            position.trailing_sell_rate = self.trailing_sell_rate
-            
-            # 매수 단계 정보 생성
-            stage_info = BuyStageInfo(stage, price, quantity, amount)
+            i = self._idx.get(stock_code)
+            if i is None:
+                i = self._append_row(stock_code)
+                stock_code = self._codes[i]
+                self._push_expiry(self._code_to_id[stock_code], int(self._last_update_ns[i]))
+            else:
+                # 설정값 적용
+                self._apply_settings_to_row(i)
             
-            # 포지션에 추가
-            position.add_buy_stage(stage_info)
+            # 매수 단계 추가 및 가중평균 매입가 재계산
+            self._stages[i].append(BuyStageInfo.acquire(stage, price, quantity, amount))
+            self._quantity[i] += quantity
+            self._total_amount[i] += amount
+            total_amount = self._total_amount[i]
+            self._wavg[i] = total_amount / self._quantity[i] if total_amount > 0 else 0.0
+            self._mark_dirty()
             
+            if debug_enabled():
+                log_debug(f"{stock_code} {stage} 매수 추가: {quantity}주 @ {price:,}원")
             log_info(f"포지션 추가: {stock_code} {stage} {quantity}주 @ {price:,}원")
             return True
             
@@ -225,34 +681,106 @@ class PositionManager:
     def update_position(self, stock_code: str, current_price: float) -> Optional[str]:
         """포지션 업데이트 및 매도 신호 확인"""
         try:
-            if stock_code not in self.positions:
+            if stock_code not in self._idx:
                 return None
             
-            position = self.positions[stock_code]
-            position.update_current_price(current_price)
-            
-            # 매도 조건 확인
-            sell_signal = position.check_sell_conditions()
+            sell_signals = self.update_prices_by_id(
+                np.array([self._code_to_id[stock_code]], dtype=np.int64),
+                np.array([current_price], dtype=np.float64))
             
-            if sell_signal:
-                log_info(f"{stock_code} 매도 신호: {sell_signal} (수익률: {position.profit_rate:.2f}%)")
-            
-            return sell_signal
+            return sell_signals[0][1] if sell_signals else None
             
         except Exception as e:
             log_error(f"포지션 업데이트 실패 {stock_code}: {str(e)}")
             return None
     
+    def update_prices(self, codes, prices) -> List[Tuple[str, str]]:
+        """여러 종목 현재가 일괄 업데이트 및 매도 신호 확인
+        
+        Args:
+            codes: 종목코드 목록
+            prices: codes와 같은 순서의 현재가 배열
+            
+        Returns:
+            [(종목코드, 매도신호), ...]
+        """
+        code_to_id = self._code_to_id
+        ids = np.fromiter((code_to_id.get(code, -1) for code in codes), dtype=np.int64)
+        return self.update_prices_by_id(ids, prices)
+    
+    def update_prices_by_id(self, code_ids, prices) -> List[Tuple[str, str]]:
+        """정수 ID(get_code_id) 기준 현재가 일괄 업데이트 및 매도 신호 확인"""
+        try:
+            code_ids = np.asarray(code_ids, dtype=np.int64)
+            prices = np.asarray(prices, dtype=np.float64)
+            
+            known = (code_ids >= 0) & (code_ids < len(self._id_to_code))
+            idx = np.full(code_ids.shape, -1, dtype=np.int64)
+            idx[known] = self._row_of_id[code_ids[known]]
+            held = idx >= 0
+            if not held.any():
+                return []
+            
+            idx = idx[held]
+            new_prices = prices[held]
+            
+            # 같은 종목이 여러 번 들어오면 마지막 체결가를 현재가로 사용
+            self._current[idx] = new_prices
+            rows = np.unique(idx)
+            self._last_update_ns[rows] = now_ns = time.monotonic_ns()
+            
+            current = self._current[rows]
+            wavg = self._wavg[rows]
+            valid = wavg > 0
+            
+            # 수익률 계산 (수수료 포함, 공식은 TumepokCalculator 기준)
+            profit_rate = self._profit_rate[rows]
+            for k in np.flatnonzero(valid):
+                profit_rate[k] = _calculate_profit_rate(float(wavg[k]), float(current[k]))
+            self._profit_rate[rows] = profit_rate
+            profit_amount = (current - wavg) * self._quantity[rows]
+            self._profit_amount[rows[valid]] = profit_amount[valid]
+            
+            # 트레일링 스탑 발동 / 고점 갱신
+            activated = self._trailing_activated[rows]
+            newly_activated = ~activated & (profit_rate >= self._trigger[rows])
+            self._trailing_high[rows[newly_activated]] = current[newly_activated]
+            self._trailing_activated[rows] = activated | newly_activated
+            active = self._trailing_activated[idx]
+            np.maximum.at(self._trailing_high, idx[active], new_prices[active])
+            
+            codes = self._codes
+            code_to_id = self._code_to_id
+            for row in rows.tolist():
+                self._push_expiry(code_to_id[codes[row]], now_ns)
+            for k in np.flatnonzero(newly_activated):
+                log_info(f"{codes[rows[k]]} 트레일링 스탑 발동: {profit_rate[k]:.2f}%")
+            
+            self._mark_dirty()
+            
+            # 신호가 있을 때만 메시지 포맷 (틱마다 문자열을 만들지 않음)
+            sell_signals = self._sell_signals(rows)
+            for stock_code, sell_signal in sell_signals:
+                log_info(f"{stock_code} 매도 신호: {sell_signal} (수익률: {self._profit_rate[self._idx[stock_code]]:.2f}%)")
+            
+            return sell_signals
+            
+        except Exception as e:
+            log_error(f"포지션 일괄 업데이트 실패: {str(e)}")
+            return []
+    
     def remove_position(self, stock_code: str, reason: str = "SOLD") -> bool:
         """포지션 제거"""
         try:
-            if stock_code in self.positions:
-                position = self.positions[stock_code]
-                position.status = reason
+            i = self._idx.get(stock_code)
+            if i is not None:
+                self._status[i] = reason
                 
-                log_info(f"포지션 제거: {stock_code} (사유: {reason}, 수익률: {position.profit_rate:.2f}%)")
+                log_info(f"포지션 제거: {stock_code} (사유: {reason}, 수익률: {self._profit_rate[i]:.2f}%)")
                 
-                del self.positions[stock_code]
+                for stage_info in self._stages[i]:
+                    stage_info.release()
+                self._remove_row(stock_code)
                 return True
             else:
                 log_warning(f"제거할 포지션이 없음: {stock_code}")
@@ -262,91 +790,126 @@ class PositionManager:
             log_error(f"포지션 제거 실패 {stock_code}: {str(e)}")
             return False
     
-    def get_position(self, stock_code: str) -> Optional[PositionInfo]:
+    def get_position(self, stock_code: str) -> Optional[PositionView]:
         """포지션 정보 조회"""
-        return self.positions.get(stock_code)
+        if stock_code not in self._idx:
+            return None
+        return PositionView(self, self._codes[self._idx[stock_code]])
     
-    def get_all_positions(self) -> Dict[str, PositionInfo]:
+    def get_all_positions(self) -> Dict[str, PositionView]:
         """모든 포지션 조회"""
-        return self.positions.copy()
+        return self.positions
     
     def get_positions_dataframe(self) -> pd.DataFrame:
-        """포지션을 DataFrame으로 변환"""
+        """포지션을 DataFrame으로 변환
+        
+        숫자 컬럼은 숫자형 그대로 반환하며, 변경이 없으면 캐시된 DataFrame을 재사용합니다.
+        화면 표시는 get_positions_styler() 또는 get_positions_display_dataframe()을 사용하세요.
+        """
         try:
-            if not self.positions:
-                return pd.DataFrame(columns=[
-                    '종목코드', '매입가', '현재가', '수량', '수익률(%)', 
-                    '수익금액', '트레일링', '상태'
-                ])
-            
-            data = []
-            for stock_code, position in self.positions.items():
-                data.append({
-                    '종목코드': stock_code,
-                    '매입가': f"{position.weighted_avg_price:,.0f}",
-                    '현재가': f"{position.current_price:,.0f}",
-                    '수량': f"{position.total_quantity:,}",
-                    '수익률(%)': f"{position.profit_rate:+.2f}",
-                    '수익금액': f"{position.profit_amount:+,.0f}",
-                    '트레일링': "활성" if position.trailing_activated else "대기",
-                    '상태': position.status
-                })
-            
-            return pd.DataFrame(data)
+            if not self._df_dirty and self._df_cache is not None:
+                return self._df_cache
+            
+            n = len(self._codes)
+            if n == 0:
+                df = pd.DataFrame(columns=self._DATAFRAME_COLUMNS)
+            else:
+                # 문자열 컬럼은 pyarrow가 있으면 Arrow 기반 string 배열 사용
+                string_dtype = 'string[pyarrow]' if pa is not None else object
+                df = pd.DataFrame({
+                    '종목코드': pd.array(self._codes, dtype=string_dtype),
+                    '매입가': self._wavg[:n].copy(),
+                    '현재가': self._current[:n].copy(),
+                    '수량': self._quantity[:n].copy(),
+                    '수익률(%)': self._profit_rate[:n].copy(),
+                    '수익금액': self._profit_amount[:n].copy(),
+                    '트레일링': pd.array(np.where(self._trailing_activated[:n], "활성", "대기"), dtype=string_dtype),
+                    '상태': pd.array(self._status, dtype=string_dtype)
+                }, copy=False)
+            
+            self._df_cache = df
+            self._df_dirty = False
+            return df
             
         except Exception as e:
             log_error(f"포지션 DataFrame 생성 실패: {str(e)}")
             return pd.DataFrame()
     
+    def get_positions_styler(self):
+        """화면 표시용 Styler (숫자 컬럼은 숫자형 유지, 포맷만 적용)"""
+        try:
+            return self.get_positions_dataframe().style.format(self.DISPLAY_FORMATTERS)
+            
+        except Exception as e:
+            log_error(f"포지션 Styler 생성 실패: {str(e)}")
+            return None
+    
+    def get_positions_display_dataframe(self) -> pd.DataFrame:
+        """화면 표시용 문자열 포맷 DataFrame"""
+        try:
+            df = self.get_positions_dataframe().copy()
+            for column, formatter in self.DISPLAY_FORMATTERS.items():
+                if column in df:
+                    df[column] = df[column].map(formatter)
+            return df
+            
+        except Exception as e:
+            log_error(f"포지션 표시용 DataFrame 생성 실패: {str(e)}")
+            return pd.DataFrame()
+    
     def get_total_profit(self) -> dict:
-        """전체 수익 정보"""
+        """전체 수익 정보 (포지션 변경이 없으면 캐시 반환)"""
         try:
-            total_profit_amount = 0.0
-            total_profit_rate = 0.0
-            total_positions = len(self.positions)
-            
-            if total_positions > 0:
-                for position in self.positions.values():
-                    total_profit_amount += position.profit_amount
-                    total_profit_rate += position.profit_rate
+            if self._profit_cache is None:
+                n = len(self._codes)
+                profit_rate = self._profit_rate[:n]
                 
-                avg_profit_rate = total_profit_rate / total_positions
-            else:
-                avg_profit_rate = 0.0
+                total_positions = n
+                total_profit_amount = float(self._profit_amount[:n].sum())
+                avg_profit_rate = float(profit_rate.mean()) if n else 0.0
+                profitable_positions = int(np.count_nonzero(profit_rate > 0))
+                loss_positions = int(np.count_nonzero(profit_rate < 0))
+                
+                self._profit_cache = {
+                    'total_profit_amount': total_profit_amount,
+                    'avg_profit_rate': avg_profit_rate,
+                    'total_positions': total_positions,
+                    'profitable_positions': profitable_positions,
+                    'loss_positions': loss_positions
+                }
             
-            return {
-                'total_profit_amount': total_profit_amount,
-                'avg_profit_rate': avg_profit_rate,
-                'total_positions': total_positions,
-                'profitable_positions': len([p for p in self.positions.values() if p.profit_rate > 0]),
-                'loss_positions': len([p for p in self.positions.values() if p.profit_rate < 0])
-            }
+            return dict(self._profit_cache)
             
         except Exception as e:
             log_error(f"전체 수익 계산 실패: {str(e)}")
             return {}
     
     def get_statistics(self) -> dict:
-        """포지션 관리 통계"""
+        """포지션 관리 통계 (포지션 변경이 없으면 캐시 반환)"""
         try:
-            total_positions = len(self.positions)
-            trailing_positions = len([p for p in self.positions.values() if p.trailing_activated])
-            
-            profit_info = self.get_total_profit()
-            
-            return {
-                'total_positions': total_positions,
-                'trailing_positions': trailing_positions,
-                'profit_positions': profit_info.get('profitable_positions', 0),
-                'loss_positions': profit_info.get('loss_positions', 0),
-                'total_profit_amount': profit_info.get('total_profit_amount', 0),
-                'avg_profit_rate': profit_info.get('avg_profit_rate', 0),
-                'settings': {
-                    'stop_loss_rate': self.stop_loss_rate,
-                    'trailing_trigger_rate': self.trailing_trigger_rate,
-                    'trailing_sell_rate': self.trailing_sell_rate
+            if self._stats_cache is None:
+                total_positions = len(self._codes)
+                trailing_positions = int(np.count_nonzero(self._trailing_activated[:total_positions]))
+                
+                profit_info = self.get_total_profit()
+                
+                self._stats_cache = {
+                    'total_positions': total_positions,
+                    'trailing_positions': trailing_positions,
+                    'profit_positions': profit_info.get('profitable_positions', 0),
+                    'loss_positions': profit_info.get('loss_positions', 0),
+                    'total_profit_amount': profit_info.get('total_profit_amount', 0),
+                    'avg_profit_rate': profit_info.get('avg_profit_rate', 0),
+                    'settings': {
+                        'stop_loss_rate': self.stop_loss_rate,
+                        'trailing_trigger_rate': self.trailing_trigger_rate,
+                        'trailing_sell_rate': self.trailing_sell_rate
+                    }
                 }
-            }
+            
+            stats = dict(self._stats_cache)
+            stats['settings'] = dict(stats['settings'])
+            return stats
             
         except Exception as e:
             log_error(f"포지션 통계 조회 실패: {str(e)}")
@@ -367,13 +930,15 @@ class PositionManager:
                 self.trailing_sell_rate = trailing_sell_rate
             
             # 기존 포지션에도 설정 적용
-            for position in self.positions.values():
-                if stop_loss_rate is not None:
-                    position.stop_loss_rate = stop_loss_rate
-                if trailing_trigger_rate is not None:
-                    position.trailing_trigger_rate = trailing_trigger_rate
-                if trailing_sell_rate is not None:
-                    position.trailing_sell_rate = trailing_sell_rate
+            n = len(self._codes)
+            if stop_loss_rate is not None:
+                self._stop_loss[:n] = stop_loss_rate
+            if trailing_trigger_rate is not None:
+                self._trigger[:n] = trailing_trigger_rate
+            if trailing_sell_rate is not None:
+                self._trailing_sell[:n] = trailing_sell_rate
+                self._trail_mult[:n] = _trail_threshold_mult(trailing_sell_rate)
+            self._mark_dirty()
             
             log_info("포지션 관리자 설정 업데이트 완료")
             
@@ -383,10 +948,9 @@ class PositionManager:
     def force_sell_position(self, stock_code: str, reason: str = "MANUAL") -> bool:
         """강제 매도"""
         try:
-            if stock_code in self.positions:
-                position = self.positions[stock_code]
-                
-                log_info(f"강제 매도: {stock_code} (사유: {reason}, 수익률: {position.profit_rate:.2f}%)")
+            i = self._idx.get(stock_code)
+            if i is not None:
+                log_info(f"강제 매도: {stock_code} (사유: {reason}, 수익률: {self._profit_rate[i]:.2f}%)")
                 
                 self.remove_position(stock_code, reason)
                 return True
@@ -398,15 +962,32 @@ class PositionManager:
             log_error(f"강제 매도 실패 {stock_code}: {str(e)}")
             return False
     
+    @staticmethod
+    def _snapshot_paths(filepath: str) -> Tuple[str, str]:
+        """Feather 스냅샷 경로 (포지션 테이블, 매수 단계 테이블)"""
+        base = os.path.splitext(filepath)[0]
+        return f"{base}.feather", f"{base}_stages.feather"
+    
     def save_positions(self, filepath: str) -> bool:
-        """포지션 데이터 저장"""
+        """포지션 데이터 저장
+        
+        pyarrow가 있으면 filepath 옆에 Feather 스냅샷(.feather, _stages.feather)으로,
+        없으면 filepath에 JSON으로 저장합니다.
+        """
         try:
-            data = {}
-            for stock_code, position in self.positions.items():
-                data[stock_code] = position.to_dict()
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if feather is not None:
+                self._save_feather(filepath)
+            else:
+                data = {}
+                for i, stock_code in enumerate(self._codes):
+                    data[stock_code] = self._row_to_position(i).to_dict()
+                
+                if orjson is not None:
+                    with open(filepath, 'wb') as f:
+                        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
             
             log_info(f"포지션 데이터 저장 완료: {filepath}")
             return True
@@ -415,19 +996,68 @@ class PositionManager:
             log_error(f"포지션 데이터 저장 실패: {str(e)}")
             return False
     
+    def _save_feather(self, filepath: str):
+        """SoA 배열을 Feather 테이블로 저장"""
+        positions_path, stages_path = self._snapshot_paths(filepath)
+        n = len(self._codes)
+        
+        positions_table = pa.table({
+            'code': pa.array(self._codes, type=pa.string()),
+            'wavg': self._wavg[:n],
+            'current': self._current[:n],
+            'profit_rate': self._profit_rate[:n],
+            'profit_amount': self._profit_amount[:n],
+            'quantity': self._quantity[:n],
+            'total_amount': self._total_amount[:n],
+            'trailing_activated': self._trailing_activated[:n],
+            'trailing_high': self._trailing_high[:n],
+            'trailing_trigger_rate': self._trigger[:n],
+            'trailing_sell_rate': self._trailing_sell[:n],
+            'stop_loss_rate': self._stop_loss[:n],
+            'status': pa.array(self._status, type=pa.string()),
+            'create_time': pa.array([_ns_to_datetime(ns) for ns in self._create_ns[:n].tolist()],
+                                    type=pa.timestamp('us')),
+            'last_update': pa.array([_ns_to_datetime(ns) for ns in self._last_update_ns[:n].tolist()],
+                                    type=pa.timestamp('us')),
+        })
+        
+        stages = [(code, s) for code, stage_list in zip(self._codes, self._stages) for s in stage_list]
+        stages_table = pa.table({
+            'code': pa.array([code for code, _ in stages], type=pa.string()),
+            'stage': pa.array([s.stage for _, s in stages], type=pa.string()),
+            'price': pa.array([s.price for _, s in stages], type=pa.float64()),
+            'quantity': pa.array([s.quantity for _, s in stages], type=pa.int64()),
+            'amount': pa.array([s.amount for _, s in stages], type=pa.float64()),
+            'buy_time': pa.array([s.buy_time for _, s in stages], type=pa.timestamp('us')),
+        })
+        
+        feather.write_feather(positions_table, positions_path)
+        feather.write_feather(stages_table, stages_path)
+    
     def load_positions(self, filepath: str) -> bool:
-        """포지션 데이터 로드"""
+        """포지션 데이터 로드 (Feather 스냅샷이 있으면 우선 사용)"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.positions.clear()
+            positions_path, stages_path = self._snapshot_paths(filepath)
+            if feather is not None and os.path.exists(positions_path):
+                self._load_feather(positions_path, stages_path)
+            else:
+                if orjson is not None:
+                    with open(filepath, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                
+                self._clear_positions()
+                
+                for stock_code, position_data in data.items():
+                    position = PositionInfo.from_dict(position_data)
+                    position.stock_code = stock_code
+                    self._append_position(position)
             
-            for stock_code, position_data in data.items():
-                position = PositionInfo.from_dict(position_data)
-                self.positions[stock_code] = position
+            self._rebuild_expiry_heap()
             
-            log_info(f"포지션 데이터 로드 완료: {len(self.positions)}개 포지션")
+            log_info(f"포지션 데이터 로드 완료: {len(self._codes)}개 포지션")
             return True
             
         except FileNotFoundError:
@@ -437,18 +1067,60 @@ class PositionManager:
             log_error(f"포지션 데이터 로드 실패: {str(e)}")
             return False
     
+    def _load_feather(self, positions_path: str, stages_path: str):
+        """Feather 스냅샷에서 포지션 복원 (컬럼 단위로 배열에 적재)"""
+        table = feather.read_table(positions_path)
+        
+        self._clear_positions()
+        for stock_code in table.column('code').to_pylist():
+            self._append_row(stock_code)
+        
+        n = len(self._codes)
+        column_map = (
+            ('wavg', '_wavg'), ('current', '_current'), ('profit_rate', '_profit_rate'),
+            ('profit_amount', '_profit_amount'), ('quantity', '_quantity'),
+            ('total_amount', '_total_amount'), ('trailing_activated', '_trailing_activated'),
+            ('trailing_high', '_trailing_high'), ('trailing_trigger_rate', '_trigger'),
+            ('trailing_sell_rate', '_trailing_sell'), ('stop_loss_rate', '_stop_loss'),
+        )
+        for column, array_name in column_map:
+            getattr(self, array_name)[:n] = table.column(column).to_numpy()
+        self._trail_mult[:n] = (100 - np.abs(self._trailing_sell[:n])) / 100
+        self._status = table.column('status').to_pylist()
+        self._create_ns[:n] = [_datetime_to_ns(dt) for dt in table.column('create_time').to_pylist()]
+        self._last_update_ns[:n] = [_datetime_to_ns(dt) for dt in table.column('last_update').to_pylist()]
+        
+        if os.path.exists(stages_path):
+            stages = feather.read_table(stages_path).to_pylist()
+            for row in stages:
+                i = self._idx.get(row['code'])
+                if i is None:
+                    continue
+                stage_info = BuyStageInfo.acquire(row['stage'], row['price'], row['quantity'], row['amount'])
+                stage_info.buy_time = row['buy_time']
+                self._stages[i].append(stage_info)
+    
     def cleanup_old_positions(self, days: int = 30) -> int:
         """오래된 포지션 정리"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_ns = time.monotonic_ns() - days * _NS_PER_DAY
             removed_count = 0
             
-            positions_to_remove = []
-            for stock_code, position in self.positions.items():
-                if position.last_update < cutoff_date:
-                    positions_to_remove.append(stock_code)
-            
-            for stock_code in positions_to_remove:
+            # 힙 머리에서 cutoff 이전 항목만 꺼내 확인
+            heap = self._expiry_heap
+            while heap and heap[0][0] < cutoff_ns:
+                ts, code_id = heapq.heappop(heap)
+                stock_code = self._id_to_code[code_id]
+                i = self._idx.get(stock_code)
+                if i is None:
+                    continue
+                
+                last_update_ns = int(self._last_update_ns[i])
+                if last_update_ns != ts:
+                    # 이후 갱신된 항목 - 현재 시각으로 다시 등록
+                    heapq.heappush(heap, (last_update_ns, code_id))
+                    continue
+                
                 self.remove_position(stock_code, "EXPIRED")
                 removed_count += 1
             
@@ -464,24 +1136,25 @@ class PositionManager:
     def get_position_summary(self, stock_code: str) -> dict:
         """포지션 요약 정보"""
         try:
-            if stock_code not in self.positions:
+            i = self._idx.get(stock_code)
+            if i is None:
                 return {}
             
-            position = self.positions[stock_code]
+            stages = self._stages[i]
             
             return {
                 'stock_code': stock_code,
-                'buy_stages_count': len(position.buy_stages),
-                'buy_stages': [stage.stage for stage in position.buy_stages],
-                'total_quantity': position.total_quantity,
-                'weighted_avg_price': position.weighted_avg_price,
-                'current_price': position.current_price,
-                'profit_rate': position.profit_rate,
-                'profit_amount': position.profit_amount,
-                'trailing_activated': position.trailing_activated,
-                'trailing_high': position.trailing_high,
-                'status': position.status,
-                'holding_days': (datetime.now() - position.create_time).days
+                'buy_stages_count': len(stages),
+                'buy_stages': [stage.stage for stage in stages],
+                'total_quantity': int(self._quantity[i]),
+                'weighted_avg_price': float(self._wavg[i]),
+                'current_price': float(self._current[i]),
+                'profit_rate': float(self._profit_rate[i]),
+                'profit_amount': float(self._profit_amount[i]),
+                'trailing_activated': bool(self._trailing_activated[i]),
+                'trailing_high': float(self._trailing_high[i]),
+                'status': self._status[i],
+                'holding_days': (time.monotonic_ns() - int(self._create_ns[i])) // _NS_PER_DAY
             }
             
         except Exception as e:
@@ -491,14 +1164,11 @@ class PositionManager:
     def check_all_positions(self) -> List[Tuple[str, str]]:
         """모든 포지션의 매도 조건 확인"""
         try:
-            sell_signals = []
+            n = len(self._codes)
+            if n == 0:
+                return []
             
-            for stock_code, position in self.positions.items():
-                sell_signal = position.check_sell_conditions()
-                if sell_signal:
-                    sell_signals.append((stock_code, sell_signal))
-            
-            return sell_signals
+            return self._sell_signals(slice(0, n))
             
         except Exception as e:
             log_error(f"전체 포지션 확인 실패: {str(e)}")
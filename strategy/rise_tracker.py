@@ -4,22 +4,69 @@
 급등주의 연속상승 패턴을 추적하고 투매폭 진입 시점을 판단합니다.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterable, Iterator, Optional, Tuple, List
 import json
+import os
+import time
+from bisect import bisect_right
+from functools import lru_cache
 
 from config.constants import TUMEPOK_MATRIX
 from utils.enhanced_logging import log_info, log_error, log_debug, log_warning
+from .log_level import debug_enabled
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 투매폭 매트릭스 구간 경계 (import 시 한 번만 정렬/추출)
+_MATRIX_ROWS = sorted(TUMEPOK_MATRIX, key=lambda row: row['rise_min'])
+_RISE_MIN = tuple(row['rise_min'] for row in _MATRIX_ROWS)
+_RISE_MAX = tuple(row['rise_max'] for row in _MATRIX_ROWS)
+_DROP_MIN = tuple(row['drop_min'] for row in _MATRIX_ROWS)
+_DROP_MAX = tuple(row['drop_max'] for row in _MATRIX_ROWS)
+_DROP_MID = tuple((lo + hi) / 2 for lo, hi in zip(_DROP_MIN, _DROP_MAX))
+
+# 범위를 벗어나는 상승률에 쓰는 마지막 구간 값
+_LAST_DROP_MIN = TUMEPOK_MATRIX[-1]['drop_min']
+_LAST_DROP_MAX = TUMEPOK_MATRIX[-1]['drop_max']
+_LAST_DROP_MID = (_LAST_DROP_MIN + _LAST_DROP_MAX) / 2
+
+
+@lru_cache(maxsize=1)
+def _get_config():
+    """투매폭 설정 로드 (프로세스당 한 번만 파일을 읽음)"""
+    from config.tumepok_config import TumepokConfig
+    return TumepokConfig()
+
+
+# 매수 단계 비트마스크 (bought_stages는 아래 비트의 OR 값)
+BUY_STAGE_BITS = {"1차": 1, "2차": 2, "3차": 4}
 
 
 class TrackingInfo:
     """추적 정보 데이터 클래스"""
     
-    def __init__(self, stock_code: str, start_price: float, start_date: str = None):
+    __slots__ = (
+        'stock_code', 'stock_name', 'start_date', '_start_date_obj', 'start_price',
+        'high_price', 'current_price', 'rise_days', 'rise_rate', 'daily_change_rate', 'drop_rate',
+        'target_drop_min', 'target_drop_max', 'target_drop_1st', 'target_drop_2nd', 'target_drop_3rd',
+        '_status', '_status_listener', 'waiting_days', 'bought_stages', 'last_update', '_needs_status_check',
+        '_dp_dates', '_dp_prices', '_dp_is_high', 'last_log_minute'
+    )
+    
+    def __init__(self, stock_code: str, start_price: float, start_date: str = None, _now: datetime = None):
+        now = _now or datetime.now()
         self.stock_code = stock_code
         self.stock_name = ""  # 종목명
-        self.start_date = start_date or datetime.now().strftime('%Y-%m-%d')
+        self.start_date = start_date or now.strftime('%Y-%m-%d')
+        # 등록 날짜는 변하지 않으므로 한 번만 파싱
+        self._start_date_obj = datetime.strptime(self.start_date, '%Y-%m-%d').date()
         self.start_price = start_price
         # 첫날에는 고점을 시작가로 초기화하되, 실시간 데이터로 적극 업데이트
         self.high_price = start_price
@@ -33,44 +80,87 @@ class TrackingInfo:
         self.target_drop_1st = 0.0  # 1차선
         self.target_drop_2nd = 0.0  # 2차선
         self.target_drop_3rd = 0.0  # 3차선
-        self.status = "TRACKING"  # TRACKING, WAITING, READY, COMPLETED
+        self._status_listener = None  # 상태 변경 통지 콜백 (RiseTracker 상태 인덱스)
+        self._status = "TRACKING"  # TRACKING, WAITING, READY, COMPLETED
         self.waiting_days = 0
-        self.bought_stages = set()
-        self.last_update = datetime.now()
+        self.bought_stages = 0  # 매수 완료 단계 비트마스크 (BUY_STAGE_BITS)
+        self.last_update = now
+        self.last_log_minute = -1  # 마지막 실시간 업데이트 로그 5분 구간 (저장하지 않음)
+        # 고점 갱신/생성 직후에는 다음 틱에서 상태 판단이 필요
+        self._needs_status_check = True
         
-        # 일별 가격 기록
-        self.daily_prices = []
+        # 일별 가격 기록 (날짜/가격/고점갱신 여부를 병렬 리스트로 보관)
+        self._dp_dates: List[str] = []
+        self._dp_prices: List[float] = []
+        self._dp_is_high: List[bool] = []
         self.add_daily_price(start_price, self.start_date)
         
         # 투매폭 계산
         self.update_tumepok_calculation()
     
-    def add_daily_price(self, price: float, date: str = None):
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @status.setter
+    def status(self, new_status: str):
+        old_status = self._status
+        self._status = new_status
+        if self._status_listener is not None and old_status != new_status:
+            self._status_listener(self.stock_code, old_status, new_status)
+    
+    def add_daily_price(self, price: float, date: str = None, _now: datetime = None):
         """일별 가격 추가"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = (_now or datetime.now()).strftime('%Y-%m-%d')
         
-        self.daily_prices.append({
-            'date': date,
-            'price': price,
-            'is_high': False
-        })
+        self._dp_dates.append(date)
+        self._dp_prices.append(price)
+        self._dp_is_high.append(False)
     
-    def update_price(self, current_price: float, daily_change_rate: float = None, high_price: float = None) -> str:
-        """가격 업데이트 및 상태 변경"""
-        self.current_price = current_price
+    @property
+    def daily_prices(self) -> List[dict]:
+        """일별 가격 기록 (조회용 사본)"""
+        return [
+            {'date': date, 'price': price, 'is_high': is_high}
+            for date, price, is_high in zip(self._dp_dates, self._dp_prices, self._dp_is_high)
+        ]
+    
+    @daily_prices.setter
+    def daily_prices(self, records: List[dict]):
+        self._dp_dates = [record['date'] for record in records]
+        self._dp_prices = [record['price'] for record in records]
+        self._dp_is_high = [record.get('is_high', False) for record in records]
+    
+    def update_price(self, current_price: float, daily_change_rate: float = None, high_price: float = None,
+                     _now: datetime = None) -> str:
+        """가격 업데이트 및 상태 변경 (_now: 호출측에서 읽은 현재 시각 재사용)"""
+        now = _now or datetime.now()
+        return self._update_price_fast(now, now.strftime('%Y-%m-%d'), current_price, daily_change_rate, high_price)
+    
+    def _update_price_fast(self, now: datetime, today: str, current_price: float,
+                           daily_change_rate: float = None, high_price: float = None) -> str:
+        """가격 업데이트 (호출측에서 현재 시각/날짜 문자열을 전달)"""
         if daily_change_rate is not None:
             self.daily_change_rate = daily_change_rate
-        self.last_update = datetime.now()
+        self.last_update = now
+
+        # 같은 날 가격/고가 변동이 없으면 하락률·상태 계산 생략
+        if (current_price == self.current_price
+                and (high_price is None or high_price <= self.high_price)
+                and not self._needs_status_check
+                and self._dp_dates and self._dp_dates[-1] == today):
+            return "NO_CHANGE"
+
+        self.current_price = current_price
         
         # 연속상승일 계산 (등록 날짜 기준)
-        start_date = datetime.strptime(self.start_date, '%Y-%m-%d')
-        today_date = datetime.now()
-        self.rise_days = (today_date.date() - start_date.date()).days + 1
+        self.rise_days = (now.date() - self._start_date_obj).days + 1
         
         # 고점 업데이트 로직 개선
         high_updated = False
         is_first_day = self.rise_days == 1
+        debug = debug_enabled()
 
         # 고점 갱신 조건: 새로운 가격이 기존 고점보다 높을 때만
         # 1. 키움 API 실시간 고가 데이터 우선 사용
@@ -80,66 +170,60 @@ class TrackingInfo:
                 old_high = self.high_price
                 self.high_price = high_price
                 high_updated = True
-                log_debug(f"{self.stock_code} 키움 고가 데이터로 고점 갱신: {old_high:,}원 → {high_price:,}원 ({'첫날' if is_first_day else '신고점'})")
+                if debug:
+                    log_debug(f"{self.stock_code} 키움 고가 데이터로 고점 갱신: {old_high:,}원 → {high_price:,}원 ({'첫날' if is_first_day else '신고점'})")
 
             # 키움 고가와 현재가가 같고, 기존 고점보다 높으면 고점 갱신
             elif high_price == current_price and current_price > self.high_price:
                 old_high = self.high_price
                 self.high_price = current_price
                 high_updated = True
-                log_debug(f"{self.stock_code} 현재가=키움고가로 고점 갱신: {old_high:,}원 → {current_price:,}원")
+                if debug:
+                    log_debug(f"{self.stock_code} 현재가=키움고가로 고점 갱신: {old_high:,}원 → {current_price:,}원")
 
             # 기존 고점보다 낮거나 같으면 고점 유지
             else:
-                log_debug(f"{self.stock_code} 고점 유지: 키움고가 {high_price:,}원 <= 기존고점 {self.high_price:,}원")
+                if debug:
+                    log_debug(f"{self.stock_code} 고점 유지: 키움고가 {high_price:,}원 <= 기존고점 {self.high_price:,}원")
         else:
             # 2. 키움 고가 데이터가 없으면 현재가로 고점 갱신 여부 확인
             if current_price > self.high_price:
                 old_high = self.high_price
                 self.high_price = current_price
                 high_updated = True
-                log_debug(f"{self.stock_code} 현재가로 고점 갱신: {old_high:,}원 → {current_price:,}원 ({'첫날' if is_first_day else '신고점'})")
+                if debug:
+                    log_debug(f"{self.stock_code} 현재가로 고점 갱신: {old_high:,}원 → {current_price:,}원 ({'첫날' if is_first_day else '신고점'})")
             else:
-                log_debug(f"{self.stock_code} 고점 유지: 현재가 {current_price:,}원 <= 기존고점 {self.high_price:,}원")
+                if debug:
+                    log_debug(f"{self.stock_code} 고점 유지: 현재가 {current_price:,}원 <= 기존고점 {self.high_price:,}원")
         
         # 당일 가격 기록 업데이트 (고점 갱신 여부와 관계없이)
-        today = datetime.now().strftime('%Y-%m-%d')
-        if not self.daily_prices or self.daily_prices[-1]['date'] != today:
+        if not self._dp_dates or self._dp_dates[-1] != today:
             # 새로운 날의 첫 가격 기록
             self.add_daily_price(current_price, today)
-            if high_updated:
-                self.daily_prices[-1]['is_high'] = True
         else:
             # 같은 날의 가격 업데이트
-            self.daily_prices[-1]['price'] = current_price
-            if high_updated:
-                self.daily_prices[-1]['is_high'] = True
+            self._dp_prices[-1] = current_price
+        if high_updated:
+            self._dp_is_high[-1] = True
         
         # 고점 갱신된 경우 추가 처리
         if high_updated:
-            # 투매폭 재계산
+            # 투매폭 재계산 (하락률도 새 고점 기준으로 갱신)
             self.update_tumepok_calculation()
+            self.drop_rate = self._calculate_drop_rate(current_price)
             
-            log_debug(f"{self.stock_code} 고점 갱신: {current_price:,}원 ({self.rise_days}일차)")
+            if debug:
+                log_debug(f"{self.stock_code} 고점 갱신: {current_price:,}원 ({self.rise_days}일차)")
+            self._needs_status_check = True
             return "HIGH_UPDATED"
         
-        # 하락률 계산: 시작가 기준으로 고점에서 현재가까지의 하락폭
-        # 투매폭 전략의 핵심: 시작가 대비 상승률에서 현재 등락률을 뺀 값
-        # 예: 30% 상승했다가 20%만 남았으면 10% 하락
-        if self.start_price > 0:
-            # 방법 1: 상승률 - 현재 등락률 (시작가 기준)
-            current_rise_from_start = ((current_price - self.start_price) / self.start_price) * 100
-            self.drop_rate = self.rise_rate - current_rise_from_start
-
-            # 음수가 되면 0으로 처리 (상승 중인 경우)
-            if self.drop_rate < 0:
-                self.drop_rate = 0.0
-        else:
-            self.drop_rate = 0.0
+        self.drop_rate = self._calculate_drop_rate(current_price)
         
         # 상태별 처리
+        self._needs_status_check = False
         if self.status == "TRACKING":
-            return self.check_tumepok_entry()
+            return self.check_tumepok_entry(today)
         elif self.status == "WAITING":
             return self.check_waiting_period()
         elif self.status == "READY":
@@ -147,34 +231,46 @@ class TrackingInfo:
         
         return "CONTINUE"
     
+    def _calculate_drop_rate(self, current_price: float) -> float:
+        """하락률 계산: 시작가 기준으로 고점에서 현재가까지의 하락폭
+        
+        투매폭 전략의 핵심: 시작가 대비 상승률에서 현재 등락률을 뺀 값
+        예: 30% 상승했다가 20%만 남았으면 10% 하락
+        """
+        if self.start_price <= 0:
+            return 0.0
+        
+        current_rise_from_start = ((current_price - self.start_price) / self.start_price) * 100
+        drop_rate = self.rise_rate - current_rise_from_start
+        
+        # 음수가 되면 0으로 처리 (상승 중인 경우)
+        return drop_rate if drop_rate > 0 else 0.0
+    
     def update_tumepok_calculation(self):
         """투매폭 계산 업데이트 - 누적 상승률 기준"""
         # 누적 상승률 계산 (급등 시작점 대비)
         self.rise_rate = ((self.high_price - self.start_price) / self.start_price) * 100
         
-        # 투매폭 매트릭스에서 적정 하락폭 찾기 (누적 상승률 기준)
-        for matrix_row in TUMEPOK_MATRIX:
-            if matrix_row['rise_min'] <= self.rise_rate <= matrix_row['rise_max']:
-                self.target_drop_min = matrix_row['drop_min']
-                self.target_drop_max = matrix_row['drop_max']
-                
-                # 1차선, 2차선, 3차선 계산
-                self.target_drop_1st = self.target_drop_min  # 1차선 (약매수)
-                self.target_drop_2nd = (self.target_drop_min + self.target_drop_max) / 2  # 2차선 (보통매수)
-                self.target_drop_3rd = self.target_drop_max  # 3차선 (강매수)
-                break
+        # 투매폭 매트릭스에서 적정 하락폭 찾기 (누적 상승률 기준, 이진 탐색)
+        i = bisect_right(_RISE_MIN, self.rise_rate) - 1
+        if i >= 0 and self.rise_rate <= _RISE_MAX[i]:
+            drop_min, drop_mid, drop_max = _DROP_MIN[i], _DROP_MID[i], _DROP_MAX[i]
         else:
             # 범위를 벗어나는 경우 마지막 구간 사용
-            last_row = TUMEPOK_MATRIX[-1]
-            self.target_drop_min = last_row['drop_min']
-            self.target_drop_max = last_row['drop_max']
-            self.target_drop_1st = self.target_drop_min
-            self.target_drop_2nd = (self.target_drop_min + self.target_drop_max) / 2
-            self.target_drop_3rd = self.target_drop_max
+            drop_min, drop_mid, drop_max = _LAST_DROP_MIN, _LAST_DROP_MID, _LAST_DROP_MAX
+        
+        self.target_drop_min = drop_min
+        self.target_drop_max = drop_max
+        
+        # 1차선, 2차선, 3차선
+        self.target_drop_1st = drop_min  # 1차선 (약매수)
+        self.target_drop_2nd = drop_mid  # 2차선 (보통매수) = (최소+최대)/2
+        self.target_drop_3rd = drop_max  # 3차선 (강매수)
         
-        log_debug(f"{self.stock_code} 투매폭 계산: 누적상승률 {self.rise_rate:.1f}% -> 1차선 {self.target_drop_1st:.1f}%, 2차선 {self.target_drop_2nd:.1f}%, 3차선 {self.target_drop_3rd:.1f}%")
+        if debug_enabled():
+            log_debug(f"{self.stock_code} 투매폭 계산: 누적상승률 {self.rise_rate:.1f}% -> 1차선 {self.target_drop_1st:.1f}%, 2차선 {self.target_drop_2nd:.1f}%, 3차선 {self.target_drop_3rd:.1f}%")
     
-    def check_tumepok_entry(self) -> str:
+    def check_tumepok_entry(self, today: str = None) -> str:
         """투매폭 진입 조건 확인"""
         # 최대 연속상승일 초과 시 추적 종료
         if self.rise_days > 7:
@@ -189,7 +285,7 @@ class TrackingInfo:
             return "TUMEPOK_READY"
         
         # 3일 대기 시작 조건 확인 (고점 갱신 없이 하루 지남)
-        if self.should_start_waiting():
+        if self.should_start_waiting(today):
             self.status = "WAITING"
             self.waiting_days = 1
             log_info(f"{self.stock_code} 반등 대기 시작")
@@ -220,48 +316,56 @@ class TrackingInfo:
         
         return "WAITING"
     
-    def should_start_waiting(self) -> bool:
+    def should_start_waiting(self, today: str = None) -> bool:
         """대기 시작 조건 확인"""
         # 마지막 고점 갱신 후 하루가 지났는지 확인
-        if len(self.daily_prices) < 2:
+        if len(self._dp_dates) < 2:
             return False
         
         # 오늘 고점 갱신이 없었는지 확인
-        today = datetime.now().strftime('%Y-%m-%d')
-        for price_info in reversed(self.daily_prices):
-            if price_info['date'] == today:
-                return not price_info['is_high']
-        
-        return True
+        if today is None:
+            today = datetime.now().strftime('%Y-%m-%d')
+        # daily_prices는 날짜순으로만 추가되므로 오늘 기록이 있다면 항상 마지막 항목
+        return self._dp_dates[-1] != today or not self._dp_is_high[-1]
     
     def get_buy_stage(self, current_price: float) -> str:
         """매수 단계 판단"""
         if self.status != "READY":
             return "WAIT"
         
-        # 하락률 계산: 상승률 - 현재 등락률 (일관된 계산 방식)
-        current_change_rate = ((current_price - self.start_price) / self.start_price) * 100
-        drop_rate = self.rise_rate - current_change_rate
+        # 하락률: 최근 update_price에서 계산한 값 재사용 (다른 가격이면 같은 방식으로 계산)
+        if current_price == self.current_price:
+            drop_rate = self.drop_rate
+        else:
+            drop_rate = self._calculate_drop_rate(current_price)
         
         # 3차 매수 (강매수) - 최대 하락폭
-        if drop_rate >= self.target_drop_max and "3차" not in self.bought_stages:
+        if drop_rate >= self.target_drop_max and not (self.bought_stages & 4):
             return "3차"
         
-        # 2차 매수 (보통매수) - 중간 하락폭
-        mid_drop = (self.target_drop_min + self.target_drop_max) / 2
-        if drop_rate >= mid_drop and "2차" not in self.bought_stages:
+        # 2차 매수 (보통매수) - 중간 하락폭 (2차선 = (최소+최대)/2)
+        if drop_rate >= self.target_drop_2nd and not (self.bought_stages & 2):
             return "2차"
         
         # 1차 매수 (약매수) - 최소 하락폭
-        if drop_rate >= self.target_drop_min and "1차" not in self.bought_stages:
+        if drop_rate >= self.target_drop_min and not (self.bought_stages & 1):
             return "1차"
         
         return "WAIT"
     
     def add_bought_stage(self, stage: str):
         """매수 단계 추가"""
-        self.bought_stages.add(stage)
-        log_debug(f"{self.stock_code} {stage} 매수 완료")
+        self.bought_stages |= BUY_STAGE_BITS[stage]
+        if debug_enabled():
+            log_debug(f"{self.stock_code} {stage} 매수 완료")
+    
+    def has_bought_stage(self, stage: str) -> bool:
+        """해당 단계 매수 여부"""
+        return bool(self.bought_stages & BUY_STAGE_BITS.get(stage, 0))
+    
+    def get_bought_stage_list(self) -> List[str]:
+        """매수 완료 단계 목록 (1차, 2차, 3차 순)"""
+        return [stage for stage, bit in BUY_STAGE_BITS.items() if self.bought_stages & bit]
     
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -283,7 +387,8 @@ class TrackingInfo:
             'target_drop_3rd': self.target_drop_3rd,
             'status': self.status,
             'waiting_days': self.waiting_days,
-            'bought_stages': list(self.bought_stages),
+            'bought_stages': self.get_bought_stage_list(),  # 구버전 호환용 목록 형식
+            'bought_stages_mask': self.bought_stages,
             'last_update': self.last_update.isoformat(),
             'daily_prices': self.daily_prices
         }
@@ -311,7 +416,13 @@ class TrackingInfo:
         tracking_info.target_drop_3rd = data.get('target_drop_3rd', data['target_drop_max'])
         tracking_info.status = data['status']
         tracking_info.waiting_days = data['waiting_days']
-        tracking_info.bought_stages = set(data['bought_stages'])
+        if 'bought_stages_mask' in data:
+            tracking_info.bought_stages = int(data['bought_stages_mask'])
+        else:
+            # 구버전 데이터: 단계 목록 형식
+            tracking_info.bought_stages = 0
+            for stage in data.get('bought_stages', []):
+                tracking_info.bought_stages |= BUY_STAGE_BITS.get(stage, 0)
         tracking_info.last_update = datetime.fromisoformat(data['last_update'])
         tracking_info.daily_prices = data.get('daily_prices', [])
         
@@ -321,14 +432,52 @@ class TrackingInfo:
 class RiseTracker:
     """연속상승 추적기"""
     
+    _TRACKING_COLUMNS = [
+        '종목코드', '종목명', '등록날짜', '시작가', '고점', '현재가', '등락률',
+        '상승률', '하락률', '연속상승일', '1차선', '2차선', '3차선', '매수단계', '상태', '매도'
+    ]
+    # 추적 종목이 없을 때 반환하는 빈 DataFrame (매번 생성하지 않도록 캐시)
+    _EMPTY_TRACKING_DATAFRAME = pd.DataFrame(columns=_TRACKING_COLUMNS)
+    
+    # 실시간 업데이트 병합 후 일괄 처리 주기 (ms)
+    PENDING_FLUSH_INTERVAL_MS = 200
+    # 변경 데이터 지연 저장 주기 (ms)
+    SAVE_DEBOUNCE_MS = 500
+    # 저널 기록 후 전체 스냅샷 저장 주기 (ms) - 그 사이 변경은 저널 재생으로 복구
+    SNAPSHOT_INTERVAL_MS = 30000
+    # 저널 파일 경로 = 저장 파일 경로 + 접미사
+    JOURNAL_SUFFIX = '.journal'
+    _INDEX_INITIAL_CAPACITY = 32
+    
     def __init__(self):
         self.tracking_stocks: Dict[str, TrackingInfo] = {}
         
+        # 실시간 업데이트 병합 버퍼 (종목별 마지막 값만 유지)
+        self._pending: Dict[str, Tuple[str, float, Optional[float], Optional[float]]] = {}
+        self._flush_scheduled = False
+        self.on_flush = None  # 일괄 처리 결과 콜백: on_flush(results)
+        
+        # 지연 저장 상태 (마지막으로 저장/로드한 파일에 병합 저장)
+        self._data_filepath: Optional[str] = None
+        self._dirty: set = set()
+        self._save_due: Optional[float] = None  # 예약된 저장 시각 (time.monotonic 기준, 없으면 None)
+        self._journal_fh = None  # 저널 파일 핸들 (추가 모드, 첫 기록 시 열기)
+        
+        # 마지막으로 만든 추적현황 DataFrame과 그 행 (행이 같으면 DataFrame 재사용)
+        self._tracking_df: Optional[pd.DataFrame] = None
+        self._tracking_df_rows: Optional[List[tuple]] = None
+        
+        # 상태별 종목 인덱스 (TrackingInfo.status 변경 시 자동 갱신)
+        self._status_index: Dict[str, set] = {"TRACKING": set(), "WAITING": set(), "READY": set(), "COMPLETED": set()}
+        
+        # 마지막 업데이트 시각 인덱스 (tracking_stocks와 동기화, 정리 시 일괄 비교용)
+        self._codes: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._last_update_ns = np.empty(self._INDEX_INITIAL_CAPACITY, dtype='datetime64[ns]')
+        
         # 설정 파일에서 max_tracking_stocks 값 읽기
         try:
-            from config.tumepok_config import TumepokConfig
-            config = TumepokConfig()
-            self.max_tracking_stocks = config.get('max_tracking_stocks', 20)
+            self.max_tracking_stocks = _get_config().get('max_tracking_stocks', 20)
             log_info(f"연속상승 추적기 초기화 완료 - 최대 추적 종목: {self.max_tracking_stocks}개")
         except Exception as e:
             self.max_tracking_stocks = 20
@@ -352,6 +501,7 @@ class RiseTracker:
             tracking_info.stock_name = stock_name
             tracking_info.daily_change_rate = daily_change_rate
             self.tracking_stocks[stock_code] = tracking_info
+            self._index_add(stock_code, tracking_info)
             
             log_info(f"추적 종목 추가: {stock_name}({stock_code}) (시작가: {start_price:,}원, 등락률: {daily_change_rate:.1f}%)")
             return True
@@ -365,6 +515,7 @@ class RiseTracker:
         try:
             if stock_code in self.tracking_stocks:
                 del self.tracking_stocks[stock_code]
+                self._index_remove(stock_code)
                 log_info(f"추적 종목 제거: {stock_code}")
                 return True
             else:
@@ -375,14 +526,16 @@ class RiseTracker:
             log_error(f"추적 종목 제거 실패 {stock_code}: {str(e)}")
             return False
     
-    def update_price(self, stock_code: str, current_price: float, daily_change_rate: float = None, high_price: float = None) -> str:
+    def update_price(self, stock_code: str, current_price: float, daily_change_rate: float = None, high_price: float = None,
+                     _now: datetime = None) -> str:
         """실시간 가격 업데이트"""
         try:
             if stock_code not in self.tracking_stocks:
                 return "NOT_TRACKING"
             
             tracking_info = self.tracking_stocks[stock_code]
-            result = tracking_info.update_price(current_price, daily_change_rate, high_price)
+            result = tracking_info.update_price(current_price, daily_change_rate, high_price, _now)
+            self._last_update_ns[self._rows[stock_code]] = tracking_info.last_update
             
             # 추적 완료된 종목 자동 제거
             if tracking_info.status == "COMPLETED":
@@ -394,6 +547,132 @@ class RiseTracker:
             log_error(f"가격 업데이트 실패 {stock_code}: {str(e)}")
             return "ERROR"
     
+    def update_prices_batch(self, updates: List[Tuple[str, float, Optional[float], Optional[float]]]) -> List[Tuple[str, str]]:
+        """틱 단위 일괄 가격 업데이트
+        
+        Args:
+            updates: (종목코드, 현재가, 등락률, 고가) 목록. 같은 종목이 여러 번 있으면 마지막 값만 반영
+        
+        Returns:
+            (종목코드, 결과) 목록 - 추적 중인 종목만 포함
+        """
+        results = []
+        try:
+            # 같은 틱 안의 중복 업데이트는 마지막 값만 사용
+            latest = {}
+            for stock_code, current_price, daily_change_rate, high_price in updates:
+                latest[stock_code] = (current_price, daily_change_rate, high_price)
+            
+            # 현재 시각/날짜 문자열은 틱당 한 번만 계산
+            now = datetime.now()
+            today = now.strftime('%Y-%m-%d')
+            
+            completed = []
+            for stock_code, (current_price, daily_change_rate, high_price) in latest.items():
+                tracking_info = self.tracking_stocks.get(stock_code)
+                if tracking_info is None:
+                    continue
+                
+                try:
+                    result = tracking_info._update_price_fast(now, today, current_price, daily_change_rate, high_price)
+                except Exception as e:
+                    log_error(f"가격 업데이트 실패 {stock_code}: {str(e)}")
+                    result = "ERROR"
+                
+                self._last_update_ns[self._rows[stock_code]] = tracking_info.last_update
+                results.append((stock_code, result))
+                if tracking_info.status == "COMPLETED":
+                    completed.append(stock_code)
+            
+            # 추적 완료된 종목 자동 제거
+            for stock_code in completed:
+                self.remove_stock(stock_code)
+            
+        except Exception as e:
+            log_error(f"일괄 가격 업데이트 실패: {str(e)}")
+        
+        return results
+    
+    def push_update(self, stock_code: str, current_price: float, daily_change_rate: float = None, high_price: float = None):
+        """실시간 가격 업데이트 예약 - 같은 주기 안에서는 종목별 마지막 값만 처리"""
+        self._pending[stock_code] = (stock_code, current_price, daily_change_rate, high_price)
+        
+        if self._flush_scheduled:
+            return
+        
+        try:
+            from PyQt5.QtCore import QTimer
+            QTimer.singleShot(self.PENDING_FLUSH_INTERVAL_MS, self.flush_pending_updates)
+            self._flush_scheduled = True
+        except ImportError:
+            # Qt 이벤트 루프가 없으면 즉시 처리
+            self.flush_pending_updates()
+    
+    def flush_pending_updates(self) -> List[Tuple[str, str]]:
+        """예약된 실시간 업데이트 일괄 처리"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return []
+        
+        pending, self._pending = self._pending, {}
+        results = self.update_prices_batch(list(pending.values()))
+        
+        if self.on_flush is not None:
+            try:
+                self.on_flush(results)
+            except Exception as e:
+                log_error(f"실시간 업데이트 콜백 실패: {str(e)}")
+        
+        return results
+    
+    def _index_add(self, stock_code: str, tracking_info: TrackingInfo):
+        """업데이트 시각/상태 인덱스에 종목 추가"""
+        self._status_index.setdefault(tracking_info.status, set()).add(stock_code)
+        tracking_info._status_listener = self._on_status_changed
+        
+        i = len(self._codes)
+        if i >= len(self._last_update_ns):
+            grown = np.empty(len(self._last_update_ns) * 2, dtype=self._last_update_ns.dtype)
+            grown[:i] = self._last_update_ns[:i]
+            self._last_update_ns = grown
+        
+        self._codes.append(stock_code)
+        self._rows[stock_code] = i
+        self._last_update_ns[i] = tracking_info.last_update
+    
+    def _index_remove(self, stock_code: str):
+        """업데이트 시각/상태 인덱스에서 종목 제거 (마지막 행을 빈 자리로 이동)"""
+        for codes in self._status_index.values():
+            codes.discard(stock_code)
+        
+        i = self._rows.pop(stock_code, None)
+        if i is None:
+            return
+        
+        last = len(self._codes) - 1
+        if i != last:
+            moved_code = self._codes[last]
+            self._codes[i] = moved_code
+            self._last_update_ns[i] = self._last_update_ns[last]
+            self._rows[moved_code] = i
+        self._codes.pop()
+    
+    def _rebuild_index(self):
+        """tracking_stocks 기준으로 업데이트 시각/상태 인덱스 재구성"""
+        self._codes = []
+        self._rows = {}
+        for codes in self._status_index.values():
+            codes.clear()
+        for stock_code, tracking_info in self.tracking_stocks.items():
+            self._index_add(stock_code, tracking_info)
+    
+    def _on_status_changed(self, stock_code: str, old_status: str, new_status: str):
+        """TrackingInfo 상태 변경 시 상태 인덱스 갱신"""
+        codes = self._status_index.get(old_status)
+        if codes is not None:
+            codes.discard(stock_code)
+        self._status_index.setdefault(new_status, set()).add(stock_code)
+    
     def get_tracking_info(self, stock_code: str) -> Optional[TrackingInfo]:
         """추적 정보 조회"""
         return self.tracking_stocks.get(stock_code)
@@ -404,11 +683,14 @@ class RiseTracker:
     
     def get_ready_stocks(self) -> List[str]:
         """투매폭 진입 준비된 종목 목록"""
-        ready_stocks = []
-        for stock_code, tracking_info in self.tracking_stocks.items():
-            if tracking_info.status == "READY":
-                ready_stocks.append(stock_code)
-        return ready_stocks
+        return list(self._status_index.get("READY", ()))
+    
+    def iter_codes_by_status(self, statuses: Iterable[str], exclude: bool = False) -> Iterator[str]:
+        """상태 인덱스에서 지정한 상태(exclude=True면 그 외 상태)의 종목코드 순회 - 전체 종목 순회 없음"""
+        statuses = set(statuses)
+        for status, codes in self._status_index.items():
+            if (status in statuses) != exclude:
+                yield from codes
     
     def get_buy_stage(self, stock_code: str, current_price: float) -> str:
         """매수 단계 판단"""
@@ -434,55 +716,153 @@ class RiseTracker:
             if stock_code in self.tracking_stocks:
                 # 메모리 업데이트
                 self.tracking_stocks[stock_code].add_bought_stage(stage)
-                # JSON 파일에 즉시 저장
-                self.save_data()
-                log_debug(f"매수 단계 영구 저장 완료: {stock_code} - {stage}")
+                # 재시작 후 같은 단계를 다시 매수하지 않도록 저널에 바로 기록하고 스냅샷 저장도 짧게 예약
+                # (고점 갱신으로 30초 스냅샷 타이머가 걸려 있어도 더 이른 저장이 따로 예약됨)
+                self.journal_update(stock_code)
+                self._schedule_save()
+                log_debug(f"매수 단계 저장 예약: {stock_code} - {stage}")
                 return True
             return False
         except Exception as e:
             log_error(f"매수 단계 저장 실패: {stock_code}, {e}")
             return False
     
+    def journal_update(self, stock_code: str) -> bool:
+        """종목 변경 내용을 저널에 한 줄 추가하고 전체 스냅샷 저장은 주기적으로 예약 (실시간 고점 갱신용)
+        
+        전체 파일을 다시 쓰지 않으므로 틱 처리 중 디스크 대기가 짧고, 재시작 시 load_tracking_data가
+        스냅샷 로드 후 저널을 재생해 마지막 기록 상태를 복구합니다.
+        """
+        tracking_info = self.tracking_stocks.get(stock_code)
+        if tracking_info is None:
+            return False
+        
+        self._dirty.add(stock_code)
+        try:
+            if not self._data_filepath:
+                raise ValueError("저장 경로 없음")
+            if self._journal_fh is None:
+                self._journal_fh = open(self._data_filepath + self.JOURNAL_SUFFIX, 'ab')
+            record = {'code': stock_code, 'data': tracking_info.to_dict()}
+            if orjson is not None:
+                line = orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                line = json.dumps(record, ensure_ascii=False).encode('utf-8')
+            self._journal_fh.write(line + b'\n')
+            self._journal_fh.flush()
+        except Exception as e:
+            # 저널 기록이 안 되면 기존 방식대로 곧바로 저장 예약
+            log_error(f"추적 데이터 저널 기록 실패: {stock_code}, {str(e)}")
+            self._schedule_save()
+            return False
+        
+        self._schedule_save(self.SNAPSHOT_INTERVAL_MS)
+        return True
+    
+    def _replay_journal(self, tracking_stocks: Dict[str, TrackingInfo]) -> set:
+        """스냅샷 이후 저널 기록을 tracking_stocks에 재생 - 재생한 종목코드 집합 반환"""
+        journal_path = self._data_filepath + self.JOURNAL_SUFFIX
+        replayed = 0
+        replayed_codes = set()
+        try:
+            with open(journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line) if orjson is not None else json.loads(line)
+                        tracking_stocks[record['code']] = TrackingInfo.from_dict(record['data'])
+                    except Exception:
+                        # 비정상 종료로 마지막 줄이 잘린 경우 등은 건너뜀
+                        continue
+                    replayed_codes.add(record['code'])
+                    replayed += 1
+        except FileNotFoundError:
+            return replayed_codes
+        
+        if replayed:
+            log_info(f"추적 데이터 저널 재생: {replayed}건")
+        return replayed_codes
+    
+    def _truncate_journal(self):
+        """스냅샷 저장 후 저널 비우기"""
+        self.close_journal()
+        if self._data_filepath and os.path.exists(self._data_filepath + self.JOURNAL_SUFFIX):
+            open(self._data_filepath + self.JOURNAL_SUFFIX, 'wb').close()
+    
+    def close_journal(self):
+        """저널 파일 닫기"""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+    
+    def _schedule_save(self, delay_ms: int = None):
+        """변경 데이터 지연 저장 예약 (이미 예약된 저장이 더 늦으면 더 이른 저장을 추가로 예약)"""
+        if delay_ms is None:
+            delay_ms = self.SAVE_DEBOUNCE_MS
+        due = time.monotonic() + delay_ms / 1000
+        if self._save_due is not None and self._save_due <= due:
+            return
+        
+        try:
+            from PyQt5.QtCore import QTimer
+            QTimer.singleShot(delay_ms, self.flush_dirty)
+            self._save_due = due
+        except ImportError:
+            # Qt 이벤트 루프가 없으면 즉시 저장
+            self.flush_dirty()
+    
+    def flush_dirty(self) -> bool:
+        """예약된 변경 데이터 저장 (먼저 저장한 뒤 늦은 타이머가 다시 호출해도 변경이 없으면 바로 반환)"""
+        self._save_due = None
+        if not self._dirty:
+            return True
+        
+        if not self._data_filepath:
+            log_warning(f"저장 경로가 없어 변경 데이터 저장 보류: {len(self._dirty)}개 종목")
+            return False
+        
+        return self.save_tracking_data(self._data_filepath)
+    
+    def get_tracking_rows(self) -> List[tuple]:
+        """추적 정보를 행 튜플 목록으로 변환 (열 순서: _TRACKING_COLUMNS)"""
+        # 매도여부는 TumepokEngine에서 필터링하여 표시하므로 여기서는 항상 '-'
+        return [
+            (
+                stock_code,
+                info.stock_name,
+                info.start_date,
+                int(info.start_price),
+                int(info.high_price),
+                int(info.current_price),
+                info.daily_change_rate,  # TumepokTrackingModel에서 포맷팅
+                info.rise_rate,
+                info.drop_rate,
+                info.rise_days,
+                info.target_drop_1st,
+                info.target_drop_2nd,
+                info.target_drop_3rd,
+                ','.join(info.get_bought_stage_list()) if info.bought_stages else '-',
+                info.status,
+                '-'
+            )
+            for stock_code, info in self.tracking_stocks.items()
+        ]
+    
     def get_tracking_dataframe(self) -> pd.DataFrame:
-        """추적 정보를 DataFrame으로 변환"""
+        """추적 정보를 DataFrame으로 변환
+        
+        표시 행이 마지막 호출과 같으면 같은 DataFrame을 그대로 반환합니다 (호출측에서 수정하지 말 것).
+        행 튜플 비교는 DataFrame 생성보다 훨씬 싸고, 행 단위 .loc/.iloc 쓰기는 전체 재생성보다 느려서
+        변경이 있을 때는 통째로 다시 만듭니다.
+        """
         try:
             if not self.tracking_stocks:
-                return pd.DataFrame(columns=[
-                    '종목코드', '종목명', '시작가', '고점', '현재가', '등락률', 
-                    '상승률', '하락률', '연속상승일', '1차선', '2차선', '3차선', '매수단계', '상태', '매도'
-                ])
+                return self._EMPTY_TRACKING_DATAFRAME
             
-            data = []
-            for stock_code, tracking_info in self.tracking_stocks.items():
-                # 매도여부 확인 (DataManager에서 확인)
-                is_sold = False
-                try:
-                    # 전역적으로 접근할 수 있는 방법이 없으므로, 일단 False로 설정
-                    # TumepokEngine에서 필터링하여 매도된 종목은 제외됨
-                    is_sold = False
-                except:
-                    is_sold = False
-                
-                data.append({
-                    '종목코드': stock_code,
-                    '종목명': tracking_info.stock_name if hasattr(tracking_info, 'stock_name') else '',
-                    '등록날짜': tracking_info.start_date,
-                    '시작가': int(tracking_info.start_price),
-                    '고점': int(tracking_info.high_price),
-                    '현재가': int(tracking_info.current_price),
-                    '등락률': tracking_info.daily_change_rate,  # TumepokTrackingModel에서 포맷팅
-                    '상승률': tracking_info.rise_rate,
-                    '하락률': tracking_info.drop_rate,
-                    '연속상승일': tracking_info.rise_days,
-                    '1차선': tracking_info.target_drop_1st,
-                    '2차선': tracking_info.target_drop_2nd,
-                    '3차선': tracking_info.target_drop_3rd,
-                    '매수단계': ','.join(tracking_info.bought_stages) if tracking_info.bought_stages else '-',
-                    '상태': tracking_info.status,
-                    '매도': '매도' if is_sold else '-'
-                })
-            
-            return pd.DataFrame(data)
+            rows = self.get_tracking_rows()
+            if self._tracking_df is None or rows != self._tracking_df_rows:
+                self._tracking_df = pd.DataFrame.from_records(rows, columns=self._TRACKING_COLUMNS)
+                self._tracking_df_rows = rows
+            return self._tracking_df
             
         except Exception as e:
             log_error(f"추적 DataFrame 생성 실패: {str(e)}")
@@ -492,11 +872,7 @@ class RiseTracker:
         """추적 통계 조회"""
         try:
             total_count = len(self.tracking_stocks)
-            status_counts = {}
-            
-            for tracking_info in self.tracking_stocks.values():
-                status = tracking_info.status
-                status_counts[status] = status_counts.get(status, 0) + 1
+            status_counts = {status: len(codes) for status, codes in self._status_index.items() if codes}
             
             return {
                 'total_tracking': total_count,
@@ -512,40 +888,76 @@ class RiseTracker:
             return {}
     
     def save_tracking_data(self, filepath: str) -> bool:
-        """추적 데이터 저장"""
+        """추적 데이터 저장
+        
+        임시 파일에 끝까지 쓴 뒤 교체하므로, 쓰는 도중 종료되어도 기존 스냅샷과 저널이 그대로 남습니다.
+        """
+        temp_path = filepath + '.tmp'
         try:
             data = {}
             for stock_code, tracking_info in self.tracking_stocks.items():
                 data[stock_code] = tracking_info.to_dict()
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # 실시간 데이터가 numpy 스칼라로 들어오는 경우도 그대로 직렬화
+                with open(temp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
             
+            if filepath != self._data_filepath:
+                self.close_journal()
+            self._data_filepath = filepath
+            self._dirty.clear()
+            # 스냅샷에 모든 변경이 반영되었으므로 저널 비우기
+            self._truncate_journal()
             log_info(f"추적 데이터 저장 완료: {filepath}")
             return True
             
         except Exception as e:
             log_error(f"추적 데이터 저장 실패: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             return False
     
     def load_tracking_data(self, filepath: str) -> bool:
-        """추적 데이터 로드"""
+        """추적 데이터 로드 (스냅샷 로드 후 저널 재생)"""
+        if filepath != self._data_filepath:
+            self.close_journal()
+        self._data_filepath = filepath
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.tracking_stocks.clear()
+            try:
+                if orjson is not None:
+                    with open(filepath, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+            except FileNotFoundError:
+                log_info("추적 데이터 파일이 없습니다")
+                data = {}
             
+            # 새 목록을 모두 만든 뒤 교체 (중간에 실패하면 기존 목록과 인덱스를 그대로 유지)
+            tracking_stocks: Dict[str, TrackingInfo] = {}
             for stock_code, tracking_data in data.items():
-                tracking_info = TrackingInfo.from_dict(tracking_data)
-                self.tracking_stocks[stock_code] = tracking_info
+                tracking_stocks[stock_code] = TrackingInfo.from_dict(tracking_data)
+            replayed_codes = self._replay_journal(tracking_stocks)
+            
+            self.tracking_stocks = tracking_stocks
+            self._rebuild_index()
+            self._dirty.update(replayed_codes)
             
             log_info(f"추적 데이터 로드 완료: {len(self.tracking_stocks)}개 종목")
             return True
             
-        except FileNotFoundError:
-            log_info("추적 데이터 파일이 없습니다")
-            return True
         except Exception as e:
             log_error(f"추적 데이터 로드 실패: {str(e)}")
             return False
@@ -556,10 +968,10 @@ class RiseTracker:
             cutoff_date = datetime.now() - timedelta(days=days)
             removed_count = 0
             
-            stocks_to_remove = []
-            for stock_code, tracking_info in self.tracking_stocks.items():
-                if tracking_info.last_update < cutoff_date:
-                    stocks_to_remove.append(stock_code)
+            # 마지막 업데이트 시각을 한 번에 비교하여 정리 대상 선정
+            n = len(self._codes)
+            stale = np.flatnonzero(self._last_update_ns[:n] < np.datetime64(cutoff_date, 'ns'))
+            stocks_to_remove = [self._codes[i] for i in stale]
             
             for stock_code in stocks_to_remove:
                 self.remove_stock(stock_code)
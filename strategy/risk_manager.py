@@ -4,25 +4,165 @@
 연속상승일수별 포지션 크기 조정 및 전체 리스크 관리를 담당합니다.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import json
+import os
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from utils.enhanced_logging import log_info, log_error, log_debug, log_warning
+from .log_level import debug_enabled
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 파이썬 구현 사용
+    njit = None
+
+
+def _risk_score_py(rise_days: float, rise_rate: float, current_positions: float,
+                   total_profit: float, daily_loss_limit: float) -> float:
+    """리스크 점수 계산식 (스칼라 전용, daily_loss_limit != 0 전제)"""
+    # 연속상승일수 (0-40점)
+    score = min(rise_days * 8.0, 40.0)
+    
+    # 상승률 (0-30점)
+    if rise_rate >= 100:
+        score += 30.0
+    elif rise_rate >= 70:
+        score += 20.0
+    elif rise_rate >= 50:
+        score += 10.0
+    
+    # 포지션 수 (0-20점)
+    score += min(current_positions * 2.0, 20.0)
+    
+    # 일일 손실 (0-10점)
+    if total_profit < 0:
+        loss_ratio = abs(total_profit / daily_loss_limit)
+        score += min(loss_ratio * 10.0, 10.0)
+    
+    return min(score, 100.0)
+
+
+if njit is not None:
+    # 스칼라 인자만 받으므로 nopython 모드로 임포트 시 컴파일
+    _risk_score = njit("float64(float64, float64, float64, float64, float64)",
+                       cache=True, fastmath=True)(_risk_score_py)
+else:
+    _risk_score = _risk_score_py
+
+
+def _numeric_keys(ratios: dict) -> Dict[float, float]:
+    """JSON에서 문자열로 읽힌 구간 키를 숫자로 복원"""
+    restored = {}
+    for key, ratio in ratios.items():
+        if isinstance(key, str):
+            try:
+                key = int(key)
+            except ValueError:
+                key = float(key)
+        restored[key] = ratio
+    return restored
+
+
+def _trade_ordinal(trade: dict) -> int:
+    """거래 기록의 날짜 서수 (date_ord가 없는 이전 기록은 date 문자열에서 계산)"""
+    ordinal = trade.get('date_ord')
+    if ordinal is None:
+        try:
+            ordinal = date.fromisoformat(trade.get('date', '')).toordinal()
+        except ValueError:
+            ordinal = 0
+    return ordinal
+
+
+@dataclass(slots=True)
+class SizingResult:
+    """포지션 크기 계산 결과
+    
+    기존 dict 결과와 호환되도록 result['final_amount'], result.get('reason') 형태의 조회를 지원합니다.
+    """
+    base_amount: float = 0
+    rise_days: int = 0
+    rise_rate: float = 0.0
+    current_positions: int = 0
+    day_ratio: float = 1.0
+    rise_ratio: float = 1.0
+    position_ratio: float = 1.0
+    final_ratio: float = 1.0
+    final_amount: int = 0
+    risk_level: str = 'LOW'
+    allowed: bool = True
+    reason: str = ''
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _SIZING_FIELDS
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장/표시용 dict 변환"""
+        return {name: getattr(self, name) for name in _SIZING_FIELDS}
+
+
+_SIZING_FIELDS = tuple(f.name for f in fields(SizingResult))
 
 
 class RiskManager:
     """리스크 관리자"""
     
-    def __init__(self):
+    # 메모리에 유지하는 최대 거래 기록 수 (초과 시 오래된 기록부터 제거)
+    TRADE_HISTORY_MAXLEN = 10000
+    # 리스크 통계에 사용하는 최근 거래 수
+    RECENT_TRADE_WINDOW = 20
+    # 로드 시 거래 로그에서 읽어오는 최근 거래 수
+    TRADE_LOG_LOAD_LINES = 100
+    
+    # 인스턴스 속성 고정 (포지션 계산 시 속성 조회 비용 및 메모리 절감)
+    __slots__ = (
+        'daily_loss_limit', 'max_tracking_stocks', 'max_position_stocks', 'max_single_position',
+        'position_ratios', 'rise_rate_ratios',
+        '_day_thresholds', '_day_ratios', '_rate_thresholds', '_rate_ratios', '_rate_min_ratio',
+        '_day_thresholds_np', '_day_ratios_np', '_rate_thresholds_np', '_rate_ratios_np',
+        '_stats_date', '_total_profit', '_total_loss', '_trade_count',
+        '_buy_count', '_sell_count', '_win_count', '_loss_count',
+        'trade_history',
+        '_recent_trades', '_recent_sell_count', '_recent_win_count',
+        '_recent_profit_sum', '_recent_min_profit', '_recent_max_profit',
+        '_summary_cache', '_today_ordinal', '_today_cache',
+        '_trade_log_path', '_trade_log_fh',
+    )
+    
+    def __init__(self) -> None:
         # 기본 리스크 설정
-        self.daily_loss_limit = -200000  # 일일 손실 한도 (원)
-        self.max_tracking_stocks = 100    # 최대 추적 종목 수
-        self.max_position_stocks = 30    # 최대 포지션 종목 수
-        self.max_single_position = 500000  # 종목별 최대 투자금액 (원)
+        self.daily_loss_limit: float = -200000  # 일일 손실 한도 (원)
+        self.max_tracking_stocks: int = 100    # 최대 추적 종목 수
+        self.max_position_stocks: int = 30    # 최대 포지션 종목 수
+        self.max_single_position: int = 500000  # 종목별 최대 투자금액 (원)
         
         # 연속상승일수별 포지션 축소율
-        self.position_ratios = {
+        self.position_ratios: Dict[float, float] = {
             1: 1.0,    # 1일 상승: 100%
             2: 1.0,    # 2일 연속: 100%
             3: 0.8,    # 3일 연속: 80%
@@ -31,154 +171,242 @@ class RiskManager:
         }
         
         # 상승률별 추가 축소율
-        self.rise_rate_ratios = {
+        self.rise_rate_ratios: Dict[float, float] = {
             50: 1.0,   # 50% 미만: 100%
             70: 0.8,   # 50-70%: 80%
             100: 0.5,  # 70-100%: 50%
             999: 0.3   # 100% 이상: 30%
         }
         
-        # 일일 통계
-        self.daily_stats = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'total_profit': 0.0,
-            'total_loss': 0.0,
-            'trade_count': 0,
-            'buy_count': 0,
-            'sell_count': 0
-        }
+        # 비율 구간 조회 테이블 (설정 변경 시에만 재구성)
+        self._rebuild_ratio_tables()
+        
+        # 일일 통계 (개별 속성으로 보관, dict는 daily_stats 속성으로 제공)
+        self._clear_daily_stats(date.today().isoformat())
         
         # 거래 기록
-        self.trade_history = []
+        self.trade_history: Deque[dict] = deque(maxlen=self.TRADE_HISTORY_MAXLEN)
+        
+        # 최근 거래 통계 (record_trade에서 누적 갱신)
+        self._recent_trades: Deque[Tuple[bool, float]] = deque(maxlen=self.RECENT_TRADE_WINDOW)  # (매도 여부, 수익)
+        self._recent_sell_count: int = 0
+        self._recent_win_count: int = 0
+        self._recent_profit_sum: float = 0.0
+        self._recent_min_profit: Optional[float] = None
+        self._recent_max_profit: Optional[float] = None
+        
+        # 일일 요약 캐시 (통계/설정 변경 시 무효화)
+        self._summary_cache: Optional[dict] = None
+        
+        # 날짜 문자열 캐시 (날짜가 바뀔 때만 다시 포맷)
+        self._today_ordinal: Optional[int] = None
+        self._today_cache: str = ''
+        
+        # 추가 전용 거래 로그 (save/load 시 설정 파일 경로 기준으로 연결)
+        self._trade_log_path: Optional[str] = None
+        self._trade_log_fh = None
         
         log_info("리스크 관리자 초기화 완료")
     
     def calculate_position_size(self, base_amount: float, rise_days: int, 
-                              rise_rate: float, current_positions: int = 0) -> dict:
+                              rise_rate: float, current_positions: int = 0) -> SizingResult:
         """포지션 크기 계산"""
         try:
+            # 입력값 검증 (하위 비율 계산 함수들은 숫자 입력을 전제로 함)
+            rise_days = int(rise_days)
+            rise_rate = float(rise_rate)
+            current_positions = int(current_positions)
+            
             # 기본 정보
-            result = {
-                'base_amount': base_amount,
-                'rise_days': rise_days,
-                'rise_rate': rise_rate,
-                'current_positions': current_positions,
-                'day_ratio': 1.0,
-                'rise_ratio': 1.0,
-                'position_ratio': 1.0,
-                'final_ratio': 1.0,
-                'final_amount': 0,
-                'risk_level': 'LOW',
-                'allowed': True,
-                'reason': ''
-            }
+            result = SizingResult(base_amount, rise_days, rise_rate, current_positions)
             
             # 1. 연속상승일수별 축소
             day_ratio = self.get_day_ratio(rise_days)
-            result['day_ratio'] = day_ratio
+            result.day_ratio = day_ratio
+            if day_ratio == 0.0:
+                # 진입 금지 구간 - 나머지 비율 계산 생략
+                return self._reject_zero_ratio(result, rise_days, rise_rate, current_positions)
             
             # 2. 상승률별 축소
             rise_ratio = self.get_rise_rate_ratio(rise_rate)
-            result['rise_ratio'] = rise_ratio
+            result.rise_ratio = rise_ratio
+            if rise_ratio == 0.0:
+                return self._reject_zero_ratio(result, rise_days, rise_rate, current_positions)
             
             # 3. 포지션 수별 축소
             position_ratio = self.get_position_ratio(current_positions)
-            result['position_ratio'] = position_ratio
+            result.position_ratio = position_ratio
             
             # 4. 최종 비율 계산
             final_ratio = day_ratio * rise_ratio * position_ratio
-            result['final_ratio'] = final_ratio
+            result.final_ratio = final_ratio
             
             # 5. 최종 금액 계산
             final_amount = int(base_amount * final_ratio)
-            result['final_amount'] = final_amount
+            result.final_amount = final_amount
             
             # 6. 리스크 레벨 판단
-            result['risk_level'] = self.get_risk_level(rise_days, rise_rate, final_ratio)
+            result.risk_level = self.get_risk_level(rise_days, rise_rate, final_ratio)
             
             # 7. 진입 허용 여부 확인
-            allowed, reason = self.check_entry_allowed(rise_days, rise_rate, final_amount, current_positions)
-            result['allowed'] = allowed
-            result['reason'] = reason
+            result.allowed, result.reason = self.check_entry_allowed(rise_days, rise_rate, final_amount, current_positions)
             
-            log_debug(f"포지션 크기 계산: {base_amount} * {final_ratio:.2f} = {final_amount}")
+            if debug_enabled():
+                log_debug(f"포지션 크기 계산: {base_amount} * {final_ratio:.2f} = {final_amount}")
             
             return result
             
         except Exception as e:
             log_error(f"포지션 크기 계산 실패: {str(e)}")
-            return {
-                'base_amount': base_amount,
-                'final_amount': 0,
-                'allowed': False,
-                'reason': f'계산 오류: {str(e)}'
-            }
+            return SizingResult(base_amount=base_amount, allowed=False, reason=f'계산 오류: {str(e)}')
     
-    def get_day_ratio(self, rise_days: int) -> float:
-        """연속상승일수별 비율"""
+    def _reject_zero_ratio(self, result: SizingResult, rise_days: int, rise_rate: float,
+                           current_positions: int) -> SizingResult:
+        """축소율 0 구간의 포지션 결과 (금액 0, 고위험, 진입 불가)"""
+        result.final_ratio = 0.0
+        result.final_amount = 0
+        result.risk_level = 'HIGH'
+        # 연속상승일수 초과가 아니면 다른 불가 사유(포지션 수/손실 한도/최소 금액)가 우선
+        result.allowed, result.reason = self.check_entry_allowed(rise_days, rise_rate, 0, current_positions)
+        return result
+    
+    def calculate_position_sizes(self, base_amounts: ArrayLike, rise_days_arr: ArrayLike,
+                                 rise_rates_arr: ArrayLike,
+                                 current_positions: ArrayLike = 0) -> Dict[str, np.ndarray]:
+        """후보 종목 포지션 크기 일괄 계산 (calculate_position_size의 배열 버전)
+        
+        Args:
+            base_amounts: 기본 금액 (스칼라 또는 배열)
+            rise_days_arr: 연속상승일수 배열
+            rise_rates_arr: 상승률 배열
+            current_positions: 현재 포지션 수 (스칼라 또는 배열)
+        
+        Returns:
+            비율/금액/리스크 레벨/진입 허용 여부 배열 dict.
+            진입 불가 사유 문자열은 포함하지 않음 (필요 시 calculate_position_size 사용)
+        """
         try:
-            # 설정된 구간에서 찾기
-            for max_days in sorted(self.position_ratios.keys()):
-                if rise_days <= max_days:
-                    return self.position_ratios[max_days]
+            rise_days_arr = np.asarray(rise_days_arr, dtype=np.float64)
+            rise_rates_arr = np.asarray(rise_rates_arr, dtype=np.float64)
+            base_amounts = np.asarray(base_amounts, dtype=np.float64)
+            current_positions = np.asarray(current_positions, dtype=np.int64)
+            
+            # 1. 연속상승일수별 비율 (rise_days <= max_days 인 첫 구간)
+            day_ratio = self._day_ratios_np[np.searchsorted(self._day_thresholds_np, rise_days_arr, side='left')]
+            
+            # 2. 상승률별 비율 (rise_rate < max_rate 인 첫 구간)
+            rise_ratio = self._rate_ratios_np[np.searchsorted(self._rate_thresholds_np, rise_rates_arr, side='right')]
+            
+            # 3. 포지션 수별 비율
+            position_ratio = np.select(
+                [current_positions >= 8, current_positions >= 5, current_positions >= 3],
+                [0.5, 0.7, 0.9],
+                1.0
+            )
+            
+            # 4-5. 최종 비율 및 금액
+            final_ratio = day_ratio * rise_ratio * position_ratio
+            final_amount = (base_amounts * final_ratio).astype(np.int64)
+            
+            # 6. 리스크 레벨
+            risk_level = np.select(
+                [
+                    (rise_days_arr >= 5) | (rise_rates_arr >= 100) | (final_ratio <= 0.3),
+                    (rise_days_arr >= 3) | (rise_rates_arr >= 70) | (final_ratio <= 0.6)
+                ],
+                ['HIGH', 'MEDIUM'],
+                'LOW'
+            )
+            
+            # 7. 진입 허용 여부 (check_entry_allowed와 같은 조건)
+            allowed = (
+                (rise_days_arr < 5)
+                & (current_positions < self.max_position_stocks)
+                & (final_amount <= self.max_single_position)
+                & (final_amount >= 50000)
+            )
+            if self._total_profit <= self.daily_loss_limit:
+                allowed = np.zeros_like(allowed)
             
-            # 최대 구간을 초과하면 0 (진입 금지)
-            return 0.0
+            return {
+                'day_ratio': day_ratio,
+                'rise_ratio': rise_ratio,
+                'position_ratio': position_ratio,
+                'final_ratio': final_ratio,
+                'final_amount': final_amount,
+                'risk_level': risk_level,
+                'allowed': allowed
+            }
             
         except Exception as e:
-            log_error(f"연속상승일수별 비율 계산 실패: {str(e)}")
-            return 0.0
+            log_error(f"포지션 크기 일괄 계산 실패: {str(e)}")
+            return {}
+    
+    def _rebuild_ratio_tables(self) -> None:
+        """연속상승일수/상승률 구간을 정렬된 조회 테이블로 변환"""
+        day_items = sorted(self.position_ratios.items())
+        self._day_thresholds = tuple(max_days for max_days, _ in day_items)
+        self._day_ratios = tuple(ratio for _, ratio in day_items)
+        
+        rate_items = sorted(self.rise_rate_ratios.items())
+        self._rate_thresholds = tuple(max_rate for max_rate, _ in rate_items)
+        self._rate_ratios = tuple(ratio for _, ratio in rate_items)
+        self._rate_min_ratio = min(self._rate_ratios) if self._rate_ratios else None
+        
+        # 일괄 계산용 배열 (마지막 원소는 최대 구간 초과 시 값)
+        self._day_thresholds_np = np.array(self._day_thresholds, dtype=np.float64)
+        self._day_ratios_np = np.array(self._day_ratios + (0.0,), dtype=np.float64)
+        self._rate_thresholds_np = np.array(self._rate_thresholds, dtype=np.float64)
+        self._rate_ratios_np = np.array(
+            list(self._rate_ratios) + [self._rate_min_ratio if self._rate_min_ratio is not None else 1.0],
+            dtype=np.float64
+        )
+    
+    def get_day_ratio(self, rise_days: int) -> float:
+        """연속상승일수별 비율"""
+        # 설정된 구간에서 찾기 (rise_days <= max_days 인 첫 구간)
+        i = bisect_left(self._day_thresholds, rise_days)
+        if i < len(self._day_thresholds):
+            return self._day_ratios[i]
+        
+        # 최대 구간을 초과하면 0 (진입 금지)
+        return 0.0
     
     def get_rise_rate_ratio(self, rise_rate: float) -> float:
         """상승률별 비율"""
-        try:
-            # 설정된 구간에서 찾기
-            for max_rate in sorted(self.rise_rate_ratios.keys()):
-                if rise_rate < max_rate:
-                    return self.rise_rate_ratios[max_rate]
-            
-            # 최대 구간을 초과하면 최소 비율
-            return min(self.rise_rate_ratios.values())
-            
-        except Exception as e:
-            log_error(f"상승률별 비율 계산 실패: {str(e)}")
-            return 1.0
+        # 설정된 구간에서 찾기 (rise_rate < max_rate 인 첫 구간)
+        i = bisect_right(self._rate_thresholds, rise_rate)
+        if i < len(self._rate_thresholds):
+            return self._rate_ratios[i]
+        
+        # 최대 구간을 초과하면 최소 비율 (구간 설정이 비어 있으면 축소 없음)
+        return self._rate_min_ratio if self._rate_min_ratio is not None else 1.0
     
     def get_position_ratio(self, current_positions: int) -> float:
         """포지션 수별 비율"""
-        try:
-            # 포지션이 많을수록 축소
-            if current_positions >= 8:
-                return 0.5
-            elif current_positions >= 5:
-                return 0.7
-            elif current_positions >= 3:
-                return 0.9
-            else:
-                return 1.0
-                
-        except Exception as e:
-            log_error(f"포지션 수별 비율 계산 실패: {str(e)}")
+        # 포지션이 많을수록 축소
+        if current_positions >= 8:
+            return 0.5
+        elif current_positions >= 5:
+            return 0.7
+        elif current_positions >= 3:
+            return 0.9
+        else:
             return 1.0
     
     def get_risk_level(self, rise_days: int, rise_rate: float, final_ratio: float) -> str:
         """리스크 레벨 판단"""
-        try:
-            # 고위험 조건
-            if rise_days >= 5 or rise_rate >= 100 or final_ratio <= 0.3:
-                return 'HIGH'
-            
-            # 중위험 조건
-            elif rise_days >= 3 or rise_rate >= 70 or final_ratio <= 0.6:
-                return 'MEDIUM'
-            
-            # 저위험
-            else:
-                return 'LOW'
-                
-        except Exception as e:
-            log_error(f"리스크 레벨 판단 실패: {str(e)}")
+        # 고위험 조건
+        if rise_days >= 5 or rise_rate >= 100 or final_ratio <= 0.3:
             return 'HIGH'
+        
+        # 중위험 조건
+        elif rise_days >= 3 or rise_rate >= 70 or final_ratio <= 0.6:
+            return 'MEDIUM'
+        
+        # 저위험
+        else:
+            return 'LOW'
     
     def check_entry_allowed(self, rise_days: int, rise_rate: float, 
                            amount: int, current_positions: int) -> Tuple[bool, str]:
@@ -197,8 +425,8 @@ class RiskManager:
                 return False, f"종목별 최대 투자금액 초과 ({amount:,}/{self.max_single_position:,})"
             
             # 4. 일일 손실 한도 확인
-            if self.daily_stats['total_profit'] <= self.daily_loss_limit:
-                return False, f"일일 손실 한도 도달 ({self.daily_stats['total_profit']:,}/{self.daily_loss_limit:,})"
+            if self._total_profit <= self.daily_loss_limit:
+                return False, f"일일 손실 한도 도달 ({self._total_profit:,}/{self.daily_loss_limit:,})"
             
             # 5. 최소 투자금액 확인
             if amount < 50000:  # 5만원 미만
@@ -214,19 +442,18 @@ class RiskManager:
         """거래 중단 여부 판단"""
         try:
             # 1. 일일 손실 한도 확인
-            if self.daily_stats['total_profit'] <= self.daily_loss_limit:
-                return True, f"일일 손실 한도 도달 ({self.daily_stats['total_profit']:,})"
+            if self._total_profit <= self.daily_loss_limit:
+                return True, f"일일 손실 한도 도달 ({self._total_profit:,})"
             
             # 2. 연속 손실 확인
-            recent_trades = self.trade_history[-5:] if len(self.trade_history) >= 5 else self.trade_history
+            recent_trades = list(islice(reversed(self.trade_history), 5))
             if len(recent_trades) >= 3:
                 recent_losses = [trade for trade in recent_trades if trade.get('profit', 0) < 0]
                 if len(recent_losses) >= 3:
                     return True, "연속 손실 발생 (3회 이상)"
             
             # 3. 시간대 확인 (장 마감 30분 전)
-            current_time = datetime.now().time()
-            if current_time.hour == 15 and current_time.minute >= 0:  # 15:00 이후
+            if datetime.now().hour >= 15:  # 15:00 이후
                 return True, "장 마감 시간 접근"
             
             return False, "거래 계속"
@@ -236,12 +463,17 @@ class RiskManager:
             return True, f"판단 오류: {str(e)}"
     
     def record_trade(self, trade_type: str, stock_code: str, amount: float, 
-                    profit: float = 0, **kwargs):
+                    profit: float = 0, **kwargs: Any) -> None:
         """거래 기록"""
         try:
+            now = datetime.now()
+            # _today_string이 _today_ordinal을 갱신하므로 레코드를 만들기 전에 먼저 계산
+            trade_date = self._today_string(now)
+            date_ord = self._today_ordinal
             trade_record = {
-                'timestamp': datetime.now().isoformat(),
-                'date': datetime.now().strftime('%Y-%m-%d'),
+                'timestamp': now.isoformat(),
+                'date': trade_date,
+                'date_ord': date_ord,
                 'type': trade_type,  # BUY, SELL
                 'stock_code': stock_code,
                 'amount': amount,
@@ -250,87 +482,189 @@ class RiskManager:
             }
             
             self.trade_history.append(trade_record)
+            self._push_recent_trade(trade_record)
+            self._append_trade_log(trade_record)
             
             # 일일 통계 업데이트
-            self.update_daily_stats(trade_type, amount, profit)
+            self.update_daily_stats(trade_type, amount, profit, now)
             
-            log_debug(f"거래 기록: {trade_type} {stock_code} {amount:,}원 (수익: {profit:+,.0f}원)")
+            if debug_enabled():
+                log_debug(f"거래 기록: {trade_type} {stock_code} {amount:,}원 (수익: {profit:+,.0f}원)")
             
         except Exception as e:
             log_error(f"거래 기록 실패: {str(e)}")
     
-    def update_daily_stats(self, trade_type: str, amount: float, profit: float):
+    def _push_recent_trade(self, trade: dict) -> None:
+        """최근 거래 통계에 거래 추가 (창을 벗어나는 거래는 통계에서 차감)"""
+        window = self._recent_trades
+        evicted = window[0] if len(window) == window.maxlen else None
+        
+        is_sell = trade.get('type') == 'SELL'
+        profit = trade.get('profit', 0)
+        window.append((is_sell, profit))
+        
+        extrema_stale = False
+        if evicted is not None and evicted[0]:
+            evicted_profit = evicted[1]
+            self._recent_sell_count -= 1
+            self._recent_win_count -= evicted_profit > 0
+            self._recent_profit_sum -= evicted_profit
+            # 제거된 값이 최소/최대였을 때만 다시 계산
+            extrema_stale = evicted_profit == self._recent_min_profit or evicted_profit == self._recent_max_profit
+        
+        if is_sell:
+            self._recent_sell_count += 1
+            self._recent_win_count += profit > 0
+            self._recent_profit_sum += profit
+        
+        if self._recent_sell_count == 0:
+            self._recent_profit_sum = 0.0
+            self._recent_min_profit = None
+            self._recent_max_profit = None
+        elif extrema_stale:
+            sell_profits = [p for s, p in window if s]
+            self._recent_min_profit = min(sell_profits)
+            self._recent_max_profit = max(sell_profits)
+        elif is_sell:
+            if self._recent_min_profit is None or profit < self._recent_min_profit:
+                self._recent_min_profit = profit
+            if self._recent_max_profit is None or profit > self._recent_max_profit:
+                self._recent_max_profit = profit
+    
+    def _rebuild_recent_trades(self) -> None:
+        """거래 기록 기준으로 최근 거래 통계 재구성"""
+        self._recent_trades.clear()
+        self._recent_sell_count = 0
+        self._recent_win_count = 0
+        self._recent_profit_sum = 0.0
+        self._recent_min_profit = None
+        self._recent_max_profit = None
+        
+        start = max(len(self.trade_history) - self.RECENT_TRADE_WINDOW, 0)
+        for trade in islice(self.trade_history, start, None):
+            self._push_recent_trade(trade)
+    
+    def _today_string(self, now: datetime) -> str:
+        """now 기준 날짜 문자열 (YYYY-MM-DD) - 같은 날이면 캐시 재사용"""
+        ordinal = now.toordinal()
+        if ordinal != self._today_ordinal:
+            self._today_ordinal = ordinal
+            self._today_cache = now.date().isoformat()
+        return self._today_cache
+    
+    def update_daily_stats(self, trade_type: str, amount: float, profit: float,
+                           now: Optional[datetime] = None) -> None:
         """일일 통계 업데이트"""
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
+            self._summary_cache = None
+            today = self._today_string(now or datetime.now())
             
             # 날짜가 바뀌면 통계 초기화
-            if self.daily_stats['date'] != today:
+            if self._stats_date != today:
                 self.reset_daily_stats()
             
             # 거래 수 증가
-            self.daily_stats['trade_count'] += 1
+            self._trade_count += 1
+            
+            # 수익 거래 수 (승률 계산용)
+            self._win_count += int(profit > 0)
             
             if trade_type == 'BUY':
-                self.daily_stats['buy_count'] += 1
+                self._buy_count += 1
             elif trade_type == 'SELL':
-                self.daily_stats['sell_count'] += 1
+                self._sell_count += 1
                 
                 # 수익/손실 누적
                 if profit > 0:
-                    self.daily_stats['total_profit'] += profit
+                    self._total_profit += profit
                 else:
-                    self.daily_stats['total_loss'] += abs(profit)
-                    self.daily_stats['total_profit'] += profit  # 전체 수익에는 음수로 반영
+                    self._loss_count += 1
+                    self._total_loss += abs(profit)
+                    self._total_profit += profit  # 전체 수익에는 음수로 반영
             
         except Exception as e:
             log_error(f"일일 통계 업데이트 실패: {str(e)}")
     
-    def reset_daily_stats(self):
+    def reset_daily_stats(self) -> None:
         """일일 통계 초기화"""
         try:
-            self.daily_stats = {
-                'date': datetime.now().strftime('%Y-%m-%d'),
-                'total_profit': 0.0,
-                'total_loss': 0.0,
-                'trade_count': 0,
-                'buy_count': 0,
-                'sell_count': 0
-            }
+            self._summary_cache = None
+            self._clear_daily_stats(date.today().isoformat())
             
             log_info("일일 통계 초기화 완료")
             
         except Exception as e:
             log_error(f"일일 통계 초기화 실패: {str(e)}")
     
-    def get_daily_summary(self) -> dict:
-        """일일 요약 정보"""
+    def _clear_daily_stats(self, stats_date: str) -> None:
+        """일일 통계 속성 초기화"""
+        self._stats_date = stats_date
+        self._total_profit = 0.0
+        self._total_loss = 0.0
+        self._trade_count = 0
+        self._buy_count = 0
+        self._sell_count = 0
+        self._win_count = 0
+        self._loss_count = 0
+    
+    @property
+    def daily_stats(self) -> Dict[str, Any]:
+        """일일 통계 dict (호출 시마다 새로 생성 - 수정해도 통계에 반영되지 않음)"""
+        return {
+            'date': self._stats_date,
+            'total_profit': self._total_profit,
+            'total_loss': self._total_loss,
+            'trade_count': self._trade_count,
+            'buy_count': self._buy_count,
+            'sell_count': self._sell_count,
+            'win_count': self._win_count,
+            'loss_count': self._loss_count
+        }
+    
+    @daily_stats.setter
+    def daily_stats(self, stats: Dict[str, Any]) -> None:
+        self._summary_cache = None
+        self._stats_date = stats.get('date', date.today().isoformat())
+        self._total_profit = stats.get('total_profit', 0.0)
+        self._total_loss = stats.get('total_loss', 0.0)
+        self._trade_count = stats.get('trade_count', 0)
+        self._buy_count = stats.get('buy_count', 0)
+        self._sell_count = stats.get('sell_count', 0)
+        self._win_count = stats.get('win_count', 0)
+        self._loss_count = stats.get('loss_count', 0)
+    
+    def get_daily_summary(self) -> Dict[str, Any]:
+        """일일 요약 정보 (캐시된 dict 반환 - 호출측에서 수정하지 말 것)"""
         try:
-            summary = self.daily_stats.copy()
+            if self._summary_cache is not None:
+                return self._summary_cache
+            
+            summary = self.daily_stats
             
             # 추가 계산
-            if summary['sell_count'] > 0:
-                summary['avg_profit'] = summary['total_profit'] / summary['sell_count']
-                summary['win_rate'] = len([t for t in self.trade_history 
-                                         if t.get('date') == summary['date'] and t.get('profit', 0) > 0]) / summary['sell_count'] * 100
+            if self._sell_count > 0:
+                summary['avg_profit'] = self._total_profit / self._sell_count
+                summary['win_rate'] = self._win_count / self._sell_count * 100
             else:
                 summary['avg_profit'] = 0.0
                 summary['win_rate'] = 0.0
             
             # 손실 한도 대비 비율
-            summary['loss_ratio'] = abs(summary['total_profit'] / self.daily_loss_limit) * 100 if self.daily_loss_limit != 0 else 0
+            summary['loss_ratio'] = abs(self._total_profit / self.daily_loss_limit) * 100 if self.daily_loss_limit != 0 else 0
             
+            self._summary_cache = summary
             return summary
             
         except Exception as e:
             log_error(f"일일 요약 조회 실패: {str(e)}")
             return {}
     
-    def update_settings(self, **kwargs):
+    def update_settings(self, **kwargs: Any) -> None:
         """설정 업데이트"""
         try:
             if 'daily_loss_limit' in kwargs:
                 self.daily_loss_limit = kwargs['daily_loss_limit']
+                self._summary_cache = None
             
             if 'max_tracking_stocks' in kwargs:
                 self.max_tracking_stocks = kwargs['max_tracking_stocks']
@@ -347,18 +681,19 @@ class RiskManager:
             if 'rise_rate_ratios' in kwargs:
                 self.rise_rate_ratios.update(kwargs['rise_rate_ratios'])
             
+            if 'position_ratios' in kwargs or 'rise_rate_ratios' in kwargs:
+                self._rebuild_ratio_tables()
+            
             log_info("리스크 관리자 설정 업데이트 완료")
             
         except Exception as e:
             log_error(f"설정 업데이트 실패: {str(e)}")
     
-    def get_risk_statistics(self) -> dict:
+    def get_risk_statistics(self) -> Dict[str, Any]:
         """리스크 통계 조회"""
         try:
-            # 최근 거래 분석
-            recent_trades = self.trade_history[-20:] if len(self.trade_history) >= 20 else self.trade_history
-            
-            if not recent_trades:
+            # 최근 거래 분석 (record_trade에서 누적된 통계 사용)
+            if not self._recent_trades:
                 return {
                     'total_trades': 0,
                     'win_rate': 0.0,
@@ -368,19 +703,16 @@ class RiskManager:
                 }
             
             # 통계 계산
-            sell_trades = [t for t in recent_trades if t.get('type') == 'SELL']
+            sell_count = self._recent_sell_count
             
-            if sell_trades:
-                profits = [t.get('profit', 0) for t in sell_trades]
-                win_count = len([p for p in profits if p > 0])
-                
+            if sell_count:
                 stats = {
-                    'total_trades': len(sell_trades),
-                    'win_rate': (win_count / len(sell_trades)) * 100,
-                    'avg_profit': sum(profits) / len(profits),
-                    'max_loss': min(profits) if profits else 0,
-                    'max_profit': max(profits) if profits else 0,
-                    'total_profit': sum(profits)
+                    'total_trades': sell_count,
+                    'win_rate': (self._recent_win_count / sell_count) * 100,
+                    'avg_profit': self._recent_profit_sum / sell_count,
+                    'max_loss': self._recent_min_profit,
+                    'max_profit': self._recent_max_profit,
+                    'total_profit': self._recent_profit_sum
                 }
                 
                 # 리스크 레벨 판단
@@ -405,9 +737,98 @@ class RiskManager:
             log_error(f"리스크 통계 조회 실패: {str(e)}")
             return {}
     
+    @staticmethod
+    def get_trade_log_path(filepath: str) -> str:
+        """설정 파일 경로에 대응하는 거래 로그(JSONL) 경로"""
+        return os.path.splitext(filepath)[0] + '_trades.jsonl'
+    
+    def _open_trade_log(self, filepath: str) -> bool:
+        """거래 로그 연결 - 새로 연결한 경우 True"""
+        log_path = self.get_trade_log_path(filepath)
+        if self._trade_log_fh is not None and self._trade_log_path == log_path:
+            return False
+        
+        self.close_trade_log()
+        self._trade_log_fh = open(log_path, 'a', encoding='utf-8', buffering=1)
+        self._trade_log_path = log_path
+        return True
+    
+    @staticmethod
+    def _trade_log_line(trade: dict) -> str:
+        """거래 로그 한 줄 (JSON)"""
+        if orjson is not None:
+            return orjson.dumps(trade).decode('utf-8')
+        return json.dumps(trade, ensure_ascii=False)
+    
+    def _append_trade_log(self, trade: dict) -> None:
+        """거래 로그에 한 줄 추가 (로그 미연결 시 무시)"""
+        if self._trade_log_fh is None:
+            return
+        self._trade_log_fh.write(self._trade_log_line(trade) + '\n')
+    
+    def _rewrite_trade_log(self, trades: List[dict]) -> None:
+        """거래 로그를 주어진 거래만으로 다시 쓰기 (로그 미연결 시 무시)
+        
+        임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 로그가 남습니다.
+        열린 파일은 교체할 수 없는 환경(Windows)이 있어 교체 전에 닫고 다시 엽니다.
+        """
+        if self._trade_log_fh is None:
+            return
+        
+        log_path = self._trade_log_path
+        temp_path = log_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for trade in trades:
+                f.write(self._trade_log_line(trade) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self.close_trade_log()
+        try:
+            os.replace(temp_path, log_path)
+        finally:
+            self._trade_log_fh = open(log_path, 'a', encoding='utf-8', buffering=1)
+    
+    def _compact_trade_log(self, trades: List[dict]) -> None:
+        """로드 시 읽는 최근 TRADE_LOG_LOAD_LINES건만 남기고 거래 로그 정리"""
+        self._rewrite_trade_log(trades[-self.TRADE_LOG_LOAD_LINES:])
+    
+    def _read_trade_log(self) -> List[dict]:
+        """거래 로그의 마지막 TRADE_LOG_LOAD_LINES건 읽기"""
+        try:
+            with open(self._trade_log_path, 'r', encoding='utf-8') as f:
+                lines = deque(f, maxlen=self.TRADE_LOG_LOAD_LINES)
+        except FileNotFoundError:
+            return []
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        trades = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                trades.append(loads(line))
+            except ValueError:
+                # 비정상 종료로 잘린 마지막 줄 등은 건너뜀
+                log_warning(f"거래 로그 손상된 줄 무시: {line[:50]}")
+        return trades
+    
+    def close_trade_log(self) -> None:
+        """거래 로그 파일 닫기"""
+        if self._trade_log_fh is not None:
+            self._trade_log_fh.close()
+            self._trade_log_fh = None
+    
     def save_risk_data(self, filepath: str) -> bool:
-        """리스크 데이터 저장"""
+        """리스크 데이터 저장 (설정/일일 통계만 저장, 거래 기록은 거래 로그에 누적 후 최근 기록만 남기고 정리)"""
         try:
+            trades = list(islice(self.trade_history, max(len(self.trade_history) - self.TRADE_LOG_LOAD_LINES, 0), None))
+            if self._open_trade_log(filepath):
+                # 로그 연결 전에 기록된 거래는 기존 로그 기록 뒤에 이어 붙임
+                trades = self._read_trade_log() + trades
+            self._compact_trade_log(trades)
+            
             data = {
                 'settings': {
                     'daily_loss_limit': self.daily_loss_limit,
@@ -418,12 +839,16 @@ class RiskManager:
                     'rise_rate_ratios': self.rise_rate_ratios
                 },
                 'daily_stats': self.daily_stats,
-                'trade_history': self.trade_history[-100:],  # 최근 100건만 저장
                 'save_time': datetime.now().isoformat()
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # 구간 비율 dict는 정수 키를 사용하므로 OPT_NON_STR_KEYS 필요
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             
             log_info(f"리스크 데이터 저장 완료: {filepath}")
             return True
@@ -433,10 +858,14 @@ class RiskManager:
             return False
     
     def load_risk_data(self, filepath: str) -> bool:
-        """리스크 데이터 로드"""
+        """리스크 데이터 로드 (거래 기록은 거래 로그의 최근 기록만 읽음)"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # 설정 복원
             settings = data.get('settings', {})
@@ -444,17 +873,37 @@ class RiskManager:
             self.max_tracking_stocks = settings.get('max_tracking_stocks', self.max_tracking_stocks)
             self.max_position_stocks = settings.get('max_position_stocks', self.max_position_stocks)
             self.max_single_position = settings.get('max_single_position', self.max_single_position)
-            self.position_ratios = settings.get('position_ratios', self.position_ratios)
-            self.rise_rate_ratios = settings.get('rise_rate_ratios', self.rise_rate_ratios)
+            self.position_ratios = _numeric_keys(settings.get('position_ratios', self.position_ratios))
+            self.rise_rate_ratios = _numeric_keys(settings.get('rise_rate_ratios', self.rise_rate_ratios))
+            self._rebuild_ratio_tables()
             
             # 일일 통계 복원 (같은 날짜인 경우만)
             daily_stats = data.get('daily_stats', {})
-            if daily_stats.get('date') == datetime.now().strftime('%Y-%m-%d'):
+            self._summary_cache = None
+            
+            # 거래 기록 복원 (설정을 읽은 뒤에 로그를 연결해 설정 로드 실패 시 로그를 건드리지 않음)
+            self._open_trade_log(filepath)
+            trades = self._read_trade_log()
+            if not trades and data.get('trade_history'):
+                # 이전 형식 파일 - 파일에 포함된 거래 기록을 거래 로그로 옮김
+                trades = data['trade_history']
+                for trade in trades:
+                    self._append_trade_log(trade)
+            self.trade_history = deque(trades, maxlen=self.TRADE_HISTORY_MAXLEN)
+            self._rebuild_recent_trades()
+            
+            if daily_stats.get('date') == date.today().isoformat():
+                # 이전 버전 파일에는 승/패 카운터가 없으므로 당일 거래 기록에서 한 번만 복원
+                if 'win_count' not in daily_stats or 'loss_count' not in daily_stats:
+                    today = daily_stats['date']
+                    todays = [t for t in self.trade_history if t.get('date') == today]
+                    daily_stats['win_count'] = sum(1 for t in todays if t.get('profit', 0) > 0)
+                    daily_stats['loss_count'] = sum(
+                        1 for t in todays
+                        if t.get('type') == 'SELL' and t.get('profit', 0) <= 0
+                    )
                 self.daily_stats = daily_stats
             
-            # 거래 기록 복원
-            self.trade_history = data.get('trade_history', [])
-            
             log_info(f"리스크 데이터 로드 완료: {len(self.trade_history)}건 거래 기록")
             return True
             
@@ -468,17 +917,18 @@ class RiskManager:
     def cleanup_old_trades(self, days: int = 30) -> int:
         """오래된 거래 기록 정리"""
         try:
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            cutoff_ord = (date.today() - timedelta(days=days)).toordinal()
             
-            original_count = len(self.trade_history)
-            self.trade_history = [
-                trade for trade in self.trade_history 
-                if trade.get('date', '') >= cutoff_date
-            ]
-            
-            removed_count = original_count - len(self.trade_history)
+            # 거래 기록은 시간순으로 쌓이므로 앞쪽의 오래된 기록만 제거
+            removed_count = 0
+            while self.trade_history and _trade_ordinal(self.trade_history[0]) < cutoff_ord:
+                self.trade_history.popleft()
+                removed_count += 1
             
             if removed_count > 0:
+                self._rebuild_recent_trades()
+                # 정리 후 남은 최근 기록만으로 거래 로그도 다시 씀
+                self._compact_trade_log(list(self.trade_history))
                 log_info(f"오래된 거래 기록 {removed_count}건 정리 완료")
             
             return removed_count
@@ -488,7 +938,7 @@ class RiskManager:
             return 0
     
     def get_position_recommendation(self, rise_days: int, rise_rate: float, 
-                                  current_positions: int) -> dict:
+                                  current_positions: int) -> Dict[str, Any]:
         """포지션 추천 정보"""
         try:
             # 포지션 크기 계산
@@ -498,10 +948,10 @@ class RiskManager:
             # 추천 메시지 생성
             recommendations = []
             
-            if not position_info['allowed']:
-                recommendations.append(f"❌ 진입 불가: {position_info['reason']}")
+            if not position_info.allowed:
+                recommendations.append(f"❌ 진입 불가: {position_info.reason}")
             else:
-                risk_level = position_info['risk_level']
+                risk_level = position_info.risk_level
                 if risk_level == 'HIGH':
                     recommendations.append("⚠️ 고위험: 신중한 진입 필요")
                 elif risk_level == 'MEDIUM':
@@ -510,7 +960,7 @@ class RiskManager:
                     recommendations.append("✅ 저위험: 안전한 진입 가능")
                 
                 # 포지션 크기 추천
-                final_ratio = position_info['final_ratio']
+                final_ratio = position_info.final_ratio
                 if final_ratio <= 0.3:
                     recommendations.append("📉 포지션 크기: 매우 작게")
                 elif final_ratio <= 0.6:
@@ -521,7 +971,7 @@ class RiskManager:
                     recommendations.append("📊 포지션 크기: 정상")
             
             return {
-                'position_info': position_info,
+                'position_info': position_info.to_dict(),
                 'recommendations': recommendations,
                 'risk_score': self.calculate_risk_score(rise_days, rise_rate, current_positions)
             }
@@ -531,32 +981,13 @@ class RiskManager:
             return {}
     
     def calculate_risk_score(self, rise_days: int, rise_rate: float, 
-                           current_positions: int) -> int:
+                           current_positions: int) -> float:
         """리스크 점수 계산 (0-100, 높을수록 위험)"""
-        try:
-            score = 0
-            
-            # 연속상승일수 (0-40점)
-            score += min(rise_days * 8, 40)
-            
-            # 상승률 (0-30점)
-            if rise_rate >= 100:
-                score += 30
-            elif rise_rate >= 70:
-                score += 20
-            elif rise_rate >= 50:
-                score += 10
-            
-            # 포지션 수 (0-20점)
-            score += min(current_positions * 2, 20)
-            
-            # 일일 손실 (0-10점)
-            if self.daily_stats['total_profit'] < 0:
-                loss_ratio = abs(self.daily_stats['total_profit'] / self.daily_loss_limit)
-                score += min(loss_ratio * 10, 10)
-            
-            return min(score, 100)
-            
-        except Exception as e:
-            log_error(f"리스크 점수 계산 실패: {str(e)}")
-            return 100  # 오류 시 최대 위험으로 설정
\ No newline at end of file
+        total_profit = self._total_profit
+        if total_profit < 0 and self.daily_loss_limit == 0:
+            return 100  # 손실 한도 미설정 상태의 손실은 최대 위험
+        
+        score = _risk_score(rise_days, rise_rate, current_positions, total_profit, self.daily_loss_limit)
+        
+        # 손실 가중치가 없으면 정수 점수
+        return score if total_profit < 0 else int(score)
\ No newline at end of file
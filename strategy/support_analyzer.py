@@ -6,16 +6,222 @@ RSI, 지지선, 거래량 3가지 지지 조건을 분석합니다.
 
 import pandas as pd
 import numpy as np
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import math
+import time
 
 from utils.enhanced_logging import log_info, log_error, log_debug, log_warning
 
+try:
+    # 미리 컴파일된 Rust 커널 (pip install native/support_kernels로 설치한 경우 - JIT 컴파일 지연 없음)
+    import support_kernels
+except ImportError:
+    support_kernels = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 시 파이썬 구현 사용
+    njit = None
+    prange = range
+
+# 이 개수를 넘는 지지선 목록만 배열 커널로 확인 (적은 개수는 파이썬 루프가 더 빠름)
+_PARALLEL_SUPPORT_MIN = 256
+
+
+def _rsi_last_py(close, period):
+    """마지막 시점 RSI (최근 period개 변화량의 단순 평균 기준, 기존 rolling mean 계산과 동일)"""
+    n = close.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        delta = close[i] - close[i - 1]
+        # NaN 변화량은 상승/하락 어느 쪽에도 포함하지 않음 (기존 where(...) 처리와 동일)
+        if delta > 0:
+            gain += delta
+        elif delta < 0:
+            loss -= delta
+    
+    avg_gain = gain / period
+    avg_loss = loss / period
+    if avg_loss == 0.0:
+        return 50.0 if avg_gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+# 모의 데이터용 난수 생성기 (호출마다 random 모듈 임포트/생성 방지)
+_rng = np.random.default_rng()
+
+
+def _minute_bucket() -> int:
+    """캐시 키용 분 단위 시각 (단조 시계 기준 분 수 - 시스템 시각 조정에 영향받지 않음)"""
+    return int(time.monotonic()) // 60
+
+
+def _rsi_batch(close2d: np.ndarray, period: int) -> np.ndarray:
+    """종목별 마지막 시점 RSI 일괄 계산 (행: 종목, 열: 시간순 종가, 열 수 >= period + 1)"""
+    delta = np.diff(close2d[:, -(period + 1):], axis=1)
+    # fmax는 NaN을 0으로 취급 (기존 where(...) 처리와 동일)
+    avg_gain = np.fmax(delta, 0.0).sum(axis=1, dtype=np.float64) / period
+    avg_loss = np.fmax(-delta, 0.0).sum(axis=1, dtype=np.float64) / period
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0.0, np.where(avg_gain == 0.0, 50.0, 100.0), rsi)
+
+
+def _rsi_last_np(close, period):
+    """_rsi_last_py의 NumPy 벡터 버전 (numba 미설치 시 사용)"""
+    return float(_rsi_batch(close[np.newaxis, :], period)[0])
+
+
+def _price_array(values) -> np.ndarray:
+    """커널 입력용 C 연속 가격 배열 (float32 데이터는 변환 없이 그대로, 그 외는 float64)"""
+    array = np.asarray(values)
+    dtype = np.float32 if array.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def _near_support_py(price, levels, tolerance):
+    """허용 오차 내 지지선 존재 여부 (병렬 루프에서 조기 반환이 불가하므로 개수로 집계)"""
+    hits = 0
+    for i in prange(levels.shape[0]):
+        if abs(price - levels[i]) / levels[i] <= tolerance:
+            hits += 1
+    return hits > 0
+
+
+def _near_support_np(price, levels, tolerance):
+    """_near_support_py의 NumPy 벡터 버전 (numba 미설치 시 사용)"""
+    return bool(np.any(np.abs(price - levels) / levels <= tolerance))
+
+
+def _rolling_min_py(values, window):
+    """구간 최솟값 (out[j] = min(values[j:j + window])) - 단조 덱으로 원소당 상수 시간"""
+    n = values.shape[0]
+    out = np.empty(n - window + 1, values.dtype)
+    # 덱 저장소 (head~tail 구간이 값이 증가하는 인덱스 목록, tail은 최대 n까지만 증가)
+    queue = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        value = values[i]
+        while tail > head and values[queue[tail - 1]] >= value:
+            tail -= 1
+        queue[tail] = i
+        tail += 1
+        if queue[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i - window + 1] = values[queue[head]]
+    return out
+
+
+def _support_pivots_deque(lows, lookback):
+    """앞뒤 lookback 구간의 최저점인 저점 인덱스 (구간 최솟값 1회 계산으로 양쪽 모두 사용)"""
+    n = lows.shape[0]
+    window_min = _rolling_min(lows, lookback)  # window_min[j] = min(lows[j:j + lookback])
+    current_lows = lows[lookback:n - lookback]
+    left_min = window_min[:n - 2 * lookback]            # i 기준 lows[i - lookback:i]
+    right_min = window_min[lookback + 1:n - lookback + 1]  # i 기준 lows[i + 1:i + lookback + 1]
+    return np.flatnonzero((current_lows <= left_min) & (current_lows <= right_min)) + lookback
+
+
+def _support_pivots_window(lows, lookback):
+    """_support_pivots_deque의 NumPy 윈도우 버전 (numba 미설치 시 사용)"""
+    windows = np.lib.stride_tricks.sliding_window_view(lows, 2 * lookback + 1)
+    current_lows = windows[:, lookback]
+    left_min = windows[:, :lookback].min(axis=1)
+    right_min = windows[:, lookback + 1:].min(axis=1)
+    return np.flatnonzero((current_lows <= left_min) & (current_lows <= right_min)) + lookback
+
+
+if support_kernels is not None:
+    # Rust 커널 사용 (numba 컴파일 생략, float32 입력은 커널에서 float64로 변환)
+    _rsi_last = support_kernels.rsi_last
+    _near_support = support_kernels.near_support
+    _support_pivots = support_kernels.find_pivots
+elif njit is not None:
+    # 단일 루프 커널 - 임포트 시 컴파일 (NaN 비교 결과 유지를 위해 fastmath 미사용)
+    # pandas에서 꺼낸 배열은 읽기 전용일 수 있으므로 두 시그니처 모두 등록
+    # (호출측에서 _price_array로 C 연속 배열을 넘김 - 'A' 레이아웃이면 쓰기 가능 배열이 모호해짐)
+    # float32 가격 배열도 그대로 받되 누적은 float64로 수행
+    _rsi_last = njit(["float64(float64[::1], int64)",
+                      "float64(Array(float64, 1, 'C', readonly=True), int64)",
+                      "float64(float32[::1], int64)",
+                      "float64(Array(float32, 1, 'C', readonly=True), int64)"],
+                     cache=True)(_rsi_last_py)
+    _near_support = njit("boolean(float64, float64[:], float64)",
+                         cache=True, parallel=True)(_near_support_py)
+    _rolling_min = njit(["float64[::1](float64[::1], int64)",
+                         "float64[::1](Array(float64, 1, 'C', readonly=True), int64)",
+                         "float32[::1](float32[::1], int64)",
+                         "float32[::1](Array(float32, 1, 'C', readonly=True), int64)"],
+                        cache=True)(_rolling_min_py)
+    _support_pivots = _support_pivots_deque
+else:
+    _rsi_last = _rsi_last_np
+    _near_support = _near_support_np
+    # 파이썬 덱 루프보다 NumPy 윈도우 연산이 빠르므로 윈도우 버전 사용
+    _support_pivots = _support_pivots_window
+
+
+class _MinuteCache(OrderedDict):
+    """(종목코드, 분) 키 LRU 캐시 - 종목별 캐시 항목 수를 함께 관리"""
+    
+    def __init__(self):
+        super().__init__()
+        self.stock_counts: Dict[str, int] = {}
+    
+    def lookup(self, key: tuple) -> Optional[dict]:
+        """항목 조회 (조회된 항목은 최근 사용으로 이동)"""
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return None
+        return self[key]
+    
+    def put(self, key: tuple, value: dict, max_size: int):
+        """항목 저장 (최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if key in self:
+            self.move_to_end(key)
+        else:
+            self.stock_counts[key[0]] = self.stock_counts.get(key[0], 0) + 1
+        self[key] = value  # 새 항목은 삽입만으로 맨 뒤에 위치
+        if len(self) > max_size:
+            evicted_key, _ = self.popitem(last=False)
+            self._decrement(evicted_key[0])
+    
+    def discard(self, key: tuple):
+        """항목 제거"""
+        if self.pop(key, None) is not None:
+            self._decrement(key[0])
+    
+    def clear(self):
+        super().clear()
+        self.stock_counts.clear()
+    
+    def _decrement(self, stock_code: str):
+        remaining = self.stock_counts[stock_code] - 1
+        if remaining:
+            self.stock_counts[stock_code] = remaining
+        else:
+            del self.stock_counts[stock_code]
+
 
 class SupportAnalyzer:
     """지지 조건 분석기"""
     
+    # 캐시별 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+    CACHE_MAX_SIZE = 4096
+    # RSI 기간 및 RSI 계산용 분봉 요청 개수
+    RSI_PERIOD = 14
+    RSI_DATA_PERIOD = 30
+    # 지지선 탐색 구간 및 분봉 주기별 조회 개수
+    SUPPORT_LOOKBACK = 20
+    SUPPORT_INTERVALS = {5: 100, 15: 50}
+    
     def __init__(self, main_window=None):
         self.main_window = main_window
         
@@ -24,10 +230,13 @@ class SupportAnalyzer:
         self.volume_ratio_threshold = 0.25
         self.support_tolerance = 0.01
         
-        # 캐시
-        self.rsi_cache = {}
-        self.support_cache = {}
-        self.volume_cache = {}
+        # 캐시 (키에 분 단위 시각이 포함되어 지난 분의 항목은 조회되지 않고 LRU로 밀려남)
+        self.rsi_cache = _MinuteCache()
+        self.support_cache = _MinuteCache()
+        self.volume_cache = _MinuteCache()
+        
+        # 종목별 분봉 저가/고가 버퍼 (0행 저가, 1행 고가) - 지지선 확인 때마다 새로 할당하지 않고 재사용
+        self._bar_buffers: Dict[str, np.ndarray] = {}
         
         log_info("지지 조건 분석기 초기화 완료")
 
@@ -56,155 +265,243 @@ class SupportAnalyzer:
         except Exception as e:
             log_error(f"SupportAnalyzer 설정 업데이트 실패: {str(e)}")
     
-    def check_all_conditions(self, stock_code: str, tracking_info: dict, condition_confirmed: bool = False) -> dict:
-        """3가지 지지 조건 종합 확인"""
+    def check_all_conditions(self, stock_code: str, tracking_info: dict, condition_confirmed: bool = False,
+                             required_count: Optional[int] = None) -> dict:
+        """3가지 지지 조건 종합 확인
+        
+        required_count를 주면 남은 조건을 모두 만족해도 요구 개수에 못 미치는 시점에 나머지 확인을 생략합니다.
+        (생략된 조건은 미충족으로 집계되고 details에 'skipped'로 표시)
+        """
         try:
-            results = {
+            bucket = _minute_bucket()  # 세 조건이 같은 분 단위 캐시 키 사용
+            bonus = 0.5 if condition_confirmed else 0
+            checks = (
+                # 1. RSI 과매도 확인
+                (lambda: self.check_rsi_oversold(stock_code, _bucket=bucket), 'is_oversold'),
+                # 2. 지지선 확인
+                (lambda: self.check_support_level(stock_code, tracking_info.get('current_price', 0),
+                                                  _bucket=bucket), 'has_support'),
+                # 3. 거래량 급감 확인
+                (lambda: self.check_volume_dried(stock_code, tracking_info, _bucket=bucket), 'is_dried'),
+            )
+            
+            check_results = []
+            satisfied = 0
+            for index, (check, flag) in enumerate(checks):
+                remaining = len(checks) - index
+                if required_count is not None and satisfied + remaining + bonus < required_count:
+                    check_results.append({flag: False, 'skipped': True})
+                    continue
+                result = check()
+                satisfied += bool(result[flag])
+                check_results.append(result)
+            
+            return self._combine_results(stock_code, *check_results, condition_confirmed)
+            
+        except Exception as e:
+            log_error(f"지지 조건 확인 실패 {stock_code}: {str(e)}")
+            return {
                 'rsi_oversold': False,
                 'support_level': False,
                 'volume_dried': False,
                 'satisfied_count': 0,
-                'details': {}
+                'details': {'error': str(e)}
             }
-            
-            # 1. RSI 과매도 확인
-            rsi_result = self.check_rsi_oversold(stock_code)
-            results['rsi_oversold'] = rsi_result['is_oversold']
-            results['details']['rsi'] = rsi_result
-            
-            # 2. 지지선 확인
-            support_result = self.check_support_level(stock_code, tracking_info.get('current_price', 0))
-            results['support_level'] = support_result['has_support']
-            results['details']['support'] = support_result
-            
-            # 3. 거래량 급감 확인
-            volume_result = self.check_volume_dried(stock_code, tracking_info)
-            results['volume_dried'] = volume_result['is_dried']
-            results['details']['volume'] = volume_result
-            
-            # 만족된 조건 수 계산
-            satisfied_conditions = [
-                results['rsi_oversold'],
-                results['support_level'],
-                results['volume_dried']
-            ]
-            results['satisfied_count'] = sum(satisfied_conditions)
-            
-            # 조건식 확인 시 지지 조건 완화 적용
-            if condition_confirmed:
-                # 조건식 신호가 있으면 지지 조건을 더 관대하게 적용
-                results['condition_confirmed'] = True
-                results['original_satisfied_count'] = results['satisfied_count']
-                
-                # 조건식 확인 보너스: 만족 조건 수에 0.5 추가 (반올림으로 1개 조건 완화 효과)
-                results['satisfied_count'] = min(3, results['satisfied_count'] + 0.5)
-                
-                log_debug(f"{stock_code} 조건식 확인 지지조건 완화: "
-                         f"{results['original_satisfied_count']} → {results['satisfied_count']}/3개")
-            else:
-                results['condition_confirmed'] = False
-                log_debug(f"{stock_code} 지지조건 확인: {results['satisfied_count']}/3개 만족")
+    
+    def check_all_conditions_batch(self, stocks: Dict[str, dict],
+                                   condition_confirmed: bool = False) -> Dict[str, dict]:
+        """여러 종목의 지지 조건 일괄 확인 (RSI는 전 종목을 한 번의 배열 연산으로 계산)
+        
+        Args:
+            stocks: {종목코드: tracking_info}
+            condition_confirmed: 조건식 확인 여부 (전 종목 공통)
+        
+        Returns:
+            {종목코드: check_all_conditions와 같은 형식의 결과}
+        """
+        try:
+            bucket = _minute_bucket()
+            rsi_results = self.check_rsi_oversold_batch(list(stocks), _bucket=bucket)
+            
+            results = {}
+            for stock_code, tracking_info in stocks.items():
+                # 지지선(종목별 구간 수 상이)과 거래량(단일 값 조회)은 종목별로 확인
+                support_result = self.check_support_level(stock_code, tracking_info.get('current_price', 0),
+                                                          _bucket=bucket)
+                volume_result = self.check_volume_dried(stock_code, tracking_info, _bucket=bucket)
+                results[stock_code] = self._combine_results(
+                    stock_code, rsi_results[stock_code], support_result, volume_result, condition_confirmed
+                )
             
             return results
             
         except Exception as e:
-            log_error(f"지지 조건 확인 실패 {stock_code}: {str(e)}")
+            log_error(f"지지 조건 일괄 확인 실패: {str(e)}")
             return {
-                'rsi_oversold': False,
-                'support_level': False,
-                'volume_dried': False,
-                'satisfied_count': 0,
-                'details': {'error': str(e)}
+                stock_code: self.check_all_conditions(stock_code, tracking_info, condition_confirmed)
+                for stock_code, tracking_info in stocks.items()
             }
     
-    def check_rsi_oversold(self, stock_code: str) -> dict:
+    def _combine_results(self, stock_code: str, rsi_result: dict, support_result: dict,
+                         volume_result: dict, condition_confirmed: bool) -> dict:
+        """개별 조건 결과를 종합 결과로 변환"""
+        results = {
+            'rsi_oversold': rsi_result['is_oversold'],
+            'support_level': support_result['has_support'],
+            'volume_dried': volume_result['is_dried'],
+            'satisfied_count': 0,
+            'details': {
+                'rsi': rsi_result,
+                'support': support_result,
+                'volume': volume_result
+            }
+        }
+        
+        # 만족된 조건 수 계산
+        satisfied_conditions = [
+            results['rsi_oversold'],
+            results['support_level'],
+            results['volume_dried']
+        ]
+        results['satisfied_count'] = sum(satisfied_conditions)
+        
+        # 조건식 확인 시 지지 조건 완화 적용
+        if condition_confirmed:
+            # 조건식 신호가 있으면 지지 조건을 더 관대하게 적용
+            results['condition_confirmed'] = True
+            results['original_satisfied_count'] = results['satisfied_count']
+            
+            # 조건식 확인 보너스: 만족 조건 수에 0.5 추가 (반올림으로 1개 조건 완화 효과)
+            results['satisfied_count'] = min(3, results['satisfied_count'] + 0.5)
+            
+            log_debug(f"{stock_code} 조건식 확인 지지조건 완화: "
+                     f"{results['original_satisfied_count']} → {results['satisfied_count']}/3개")
+        else:
+            results['condition_confirmed'] = False
+            log_debug(f"{stock_code} 지지조건 확인: {results['satisfied_count']}/3개 만족")
+        
+        return results
+    
+    def check_rsi_oversold(self, stock_code: str, _bucket: Optional[int] = None) -> dict:
         """RSI 과매도 확인"""
         try:
             # 캐시 확인
-            cache_key = f"{stock_code}_{datetime.now().strftime('%Y%m%d_%H%M')}"
-            if cache_key in self.rsi_cache:
-                return self.rsi_cache[cache_key]
+            cache_key = (stock_code, _minute_bucket() if _bucket is None else _bucket)
+            cached_result = self._cache_get(self.rsi_cache, cache_key)
+            if cached_result is not None:
+                return cached_result
             
             # 분봉 데이터 요청 (실제로는 TR 요청)
-            minute_data = self.get_minute_data(stock_code, period=30)
+            minute_data = self.get_minute_data(stock_code, period=self.RSI_DATA_PERIOD)
             
-            if minute_data is None or len(minute_data) < 14:
-                result = {
-                    'is_oversold': False,
-                    'rsi_value': None,
-                    'threshold': self.rsi_threshold,
-                    'error': '데이터 부족'
-                }
+            if minute_data is None or len(minute_data) < self.RSI_PERIOD:
+                result = self._rsi_result(None, '데이터 부족')
             else:
                 # RSI 계산
-                rsi_value = self.calculate_rsi(minute_data['close'], period=14)
-                
-                result = {
-                    'is_oversold': rsi_value <= self.rsi_threshold,
-                    'rsi_value': rsi_value,
-                    'threshold': self.rsi_threshold,
-                    'error': None
-                }
+                rsi_value = self.calculate_rsi(minute_data['close'], period=self.RSI_PERIOD)
+                result = self._rsi_result(rsi_value)
             
             # 캐시 저장 (1분간 유효)
-            self.rsi_cache[cache_key] = result
+            self._cache_put(self.rsi_cache, cache_key, result)
             
             return result
             
         except Exception as e:
             log_error(f"RSI 과매도 확인 실패 {stock_code}: {str(e)}")
-            return {
-                'is_oversold': False,
-                'rsi_value': None,
-                'threshold': self.rsi_threshold,
-                'error': str(e)
-            }
+            return self._rsi_result(None, str(e))
     
-    def check_support_level(self, stock_code: str, current_price: float) -> dict:
+    def check_rsi_oversold_batch(self, stock_codes: List[str],
+                                 _bucket: Optional[int] = None) -> Dict[str, dict]:
+        """여러 종목 RSI 과매도 일괄 확인 (캐시에 없는 종목의 RSI를 한 번에 계산)"""
+        bucket = _minute_bucket() if _bucket is None else _bucket
+        period = self.RSI_PERIOD
+        results = {}
+        pending_codes = []
+        pending_closes = []
+        
+        for stock_code in stock_codes:
+            cache_key = (stock_code, bucket)
+            cached_result = self._cache_get(self.rsi_cache, cache_key)
+            if cached_result is not None:
+                results[stock_code] = cached_result
+                continue
+            
+            minute_data = self.get_minute_data(stock_code, period=self.RSI_DATA_PERIOD)
+            if minute_data is None or len(minute_data) < period:
+                result = self._rsi_result(None, '데이터 부족')
+            elif len(minute_data) < period + 1:
+                result = self._rsi_result(50.0)  # calculate_rsi 기본값과 동일
+            else:
+                # 마지막 period + 1개 종가만 모아 2차원 배열로 계산
+                pending_codes.append(stock_code)
+                pending_closes.append(minute_data['close'].to_numpy(dtype=np.float64)[-(period + 1):])
+                continue
+            
+            self._cache_put(self.rsi_cache, cache_key, result)
+            results[stock_code] = result
+        
+        if pending_codes:
+            rsi_values = _rsi_batch(np.vstack(pending_closes), period)
+            for stock_code, rsi_value in zip(pending_codes, rsi_values.tolist()):
+                result = self._rsi_result(rsi_value)
+                self._cache_put(self.rsi_cache, (stock_code, bucket), result)
+                results[stock_code] = result
+        
+        return results
+    
+    def _rsi_result(self, rsi_value: Optional[float], error: Optional[str] = None) -> dict:
+        """RSI 과매도 확인 결과 dict 생성"""
+        return {
+            'is_oversold': rsi_value is not None and rsi_value <= self.rsi_threshold,
+            'rsi_value': rsi_value,
+            'threshold': self.rsi_threshold,
+            'error': error
+        }
+    
+    def check_support_level(self, stock_code: str, current_price: float,
+                            _bucket: Optional[int] = None) -> dict:
         """분봉 지지선 확인"""
         try:
             # 캐시 확인
-            cache_key = f"{stock_code}_{datetime.now().strftime('%Y%m%d_%H%M')}"
-            if cache_key in self.support_cache:
-                cached_result = self.support_cache[cache_key]
-                # 현재가 기준으로 지지선 재확인
-                cached_result['has_support'] = self.is_near_support_level(
-                    current_price, cached_result.get('support_levels', [])
-                )
+            cache_key = (stock_code, _minute_bucket() if _bucket is None else _bucket)
+            cached_result = self._cache_get(self.support_cache, cache_key)
+            if cached_result is not None:
+                # 현재가 기준으로 지지선 재확인 (미리 계산한 허용 구간과 비교만 수행)
+                cached_result['has_support'] = self._in_support_band(current_price, cached_result['support_bands'])
                 return cached_result
             
-            # 5분봉과 15분봉 데이터 요청
-            minute5_data = self.get_minute_data(stock_code, period=100, interval=5)
-            minute15_data = self.get_minute_data(stock_code, period=50, interval=15)
-            
             support_levels = []
             
-            # 5분봉 지지선 찾기
-            if minute5_data is not None and len(minute5_data) > 20:
-                support5 = self.find_support_levels(minute5_data, lookback=20)
-                support_levels.extend(support5)
-            
-            # 15분봉 지지선 찾기
-            if minute15_data is not None and len(minute15_data) > 20:
-                support15 = self.find_support_levels(minute15_data, lookback=20)
-                support_levels.extend(support15)
-            
-            # 중복 제거 및 정렬
-            support_levels = sorted(list(set(support_levels)))
+            # 1분봉을 한 번만 요청해 5분봉과 15분봉 저가/고가로 변환 후 지지선 찾기
+            base_period = max(period * interval for interval, period in self.SUPPORT_INTERVALS.items())
+            base_data = self.get_minute_data(stock_code, period=base_period, interval=1)
+            if base_data is not None:
+                lows = _price_array(base_data['low'].values)
+                highs = _price_array(base_data['high'].values)
+                for interval, period in self.SUPPORT_INTERVALS.items():
+                    # 변환 결과는 종목 버퍼를 덮어쓰므로 지지선 가격을 꺼낸 뒤 다음 주기로 넘어감
+                    bar_lows, bar_highs = self._resample_lows_highs(stock_code, lows, highs, interval, period)
+                    if bar_lows.shape[0] > self.SUPPORT_LOOKBACK:
+                        support_levels.extend(self._support_prices(bar_lows, bar_highs, self.SUPPORT_LOOKBACK))
+            
+            # 중복 제거 및 정렬 (허용 오차 이내로 붙어 있는 지지선은 하나로 병합)
+            support_levels = self.merge_support_levels(support_levels)
             
             # 현재가 근처 지지선 확인
-            has_support = self.is_near_support_level(current_price, support_levels)
+            support_bands = self._support_bands(support_levels)
+            has_support = self._in_support_band(current_price, support_bands)
             
             result = {
                 'has_support': has_support,
                 'support_levels': support_levels,
+                'support_bands': support_bands,
                 'current_price': current_price,
                 'tolerance': self.support_tolerance,
                 'error': None
             }
             
             # 캐시 저장 (5분간 유효)
-            self.support_cache[cache_key] = result
+            self._cache_put(self.support_cache, cache_key, result)
             
             return result
             
@@ -213,18 +510,21 @@ class SupportAnalyzer:
             return {
                 'has_support': False,
                 'support_levels': [],
+                'support_bands': ([], []),
                 'current_price': current_price,
                 'tolerance': self.support_tolerance,
                 'error': str(e)
             }
     
-    def check_volume_dried(self, stock_code: str, tracking_info: dict) -> dict:
+    def check_volume_dried(self, stock_code: str, tracking_info: dict,
+                           _bucket: Optional[int] = None) -> dict:
         """거래량 급감 확인"""
         try:
             # 캐시 확인
-            cache_key = f"{stock_code}_{datetime.now().strftime('%Y%m%d_%H%M')}"
-            if cache_key in self.volume_cache:
-                return self.volume_cache[cache_key]
+            cache_key = (stock_code, _minute_bucket() if _bucket is None else _bucket)
+            cached_result = self._cache_get(self.volume_cache, cache_key)
+            if cached_result is not None:
+                return cached_result
             
             # 현재 거래량 조회
             current_volume = self.get_current_volume(stock_code)
@@ -257,7 +557,7 @@ class SupportAnalyzer:
                 }
             
             # 캐시 저장 (1분간 유효)
-            self.volume_cache[cache_key] = result
+            self._cache_put(self.volume_cache, cache_key, result)
             
             return result
             
@@ -272,99 +572,114 @@ class SupportAnalyzer:
                 'error': str(e)
             }
     
+    def _cache_get(self, cache: _MinuteCache, key: tuple) -> Optional[dict]:
+        """캐시 조회 (조회된 항목은 최근 사용으로 이동)"""
+        return cache.lookup(key)
+    
+    def _cache_put(self, cache: _MinuteCache, key: tuple, value: dict):
+        """캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        cache.put(key, value, self.CACHE_MAX_SIZE)
+    
     def calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
         """RSI 계산"""
-        try:
-            if len(prices) < period + 1:
-                return 50.0  # 기본값
-            
-            # 가격 변화 계산
-            delta = prices.diff()
-            
-            # 상승분과 하락분 분리
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
-            
-            # 평균 계산
-            avg_gain = gain.rolling(window=period).mean()
-            avg_loss = loss.rolling(window=period).mean()
-            
-            # RS 계산
-            rs = avg_gain / avg_loss
-            
-            # RSI 계산
-            rsi = 100 - (100 / (1 + rs))
-            
-            return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
-            
-        except Exception as e:
-            log_error(f"RSI 계산 실패: {str(e)}")
-            return 50.0
+        if len(prices) < period + 1:
+            return 50.0  # 기본값
+        
+        # 중간 Series 생성 없이 마지막 구간만 한 번에 계산
+        close = _price_array(prices)
+        return float(_rsi_last(close, period))
     
     def find_support_levels(self, data: pd.DataFrame, lookback: int = 20) -> List[float]:
         """지지선 찾기"""
-        try:
-            if len(data) < lookback:
-                return []
-            
-            support_levels = []
-            lows = data['low'].values
-            
-            for i in range(lookback, len(lows) - lookback):
-                # 현재 저점이 앞뒤 구간의 최저점인지 확인
-                left_min = min(lows[i-lookback:i])
-                right_min = min(lows[i+1:i+lookback+1])
-                current_low = lows[i]
-                
-                if current_low <= left_min and current_low <= right_min:
-                    # 지지선으로 인정되는 조건 확인
-                    if self.is_valid_support_level(data, i, lookback):
-                        support_levels.append(current_low)
-            
-            return support_levels
-            
-        except Exception as e:
-            log_error(f"지지선 찾기 실패: {str(e)}")
+        if len(data) < lookback:
             return []
+        
+        return self._support_prices(_price_array(data['low'].values), _price_array(data['high'].values), lookback)
+    
+    @staticmethod
+    def _support_prices(lows: np.ndarray, highs: np.ndarray, lookback: int) -> List[float]:
+        """저가/고가 배열에서 지지선 가격 찾기 (find_support_levels의 배열 버전)"""
+        window = 2 * lookback + 1
+        if lookback <= 0 or len(lows) < window:
+            return []
+        
+        # 현재 저점이 앞뒤 구간의 최저점인지 한 번에 확인 (i - lookback ~ i + lookback 윈도우)
+        pivots = _support_pivots(lows, lookback)
+        if pivots.size == 0:
+            return []
+        
+        # 후보 저점 이후 lookback개 고가의 최댓값으로 반등률 일괄 확인 (is_valid_support_level과 같은 기준)
+        # fmax는 pandas max()처럼 NaN 고가를 건너뜀
+        right_highs = np.lib.stride_tricks.sliding_window_view(highs, lookback)[pivots + 1]
+        max_bounce = np.fmax.reduce(right_highs, axis=1)
+        support_prices = lows[pivots]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bounce_rate = (max_bounce - support_prices) / support_prices
+        
+        return support_prices[bounce_rate >= 0.02].tolist()
     
     def is_valid_support_level(self, data: pd.DataFrame, index: int, lookback: int) -> bool:
         """유효한 지지선인지 확인"""
-        try:
-            # 지지선 근처에서 반등이 있었는지 확인
-            support_price = data['low'].iloc[index]
-            
-            # 이후 데이터에서 반등 확인
-            future_data = data.iloc[index+1:index+lookback+1]
-            if len(future_data) == 0:
-                return False
-            
-            # 반등률 확인 (지지선 대비 2% 이상 상승)
-            max_bounce = future_data['high'].max()
-            bounce_rate = (max_bounce - support_price) / support_price
-            
-            return bounce_rate >= 0.02
-            
-        except Exception as e:
-            log_error(f"지지선 유효성 확인 실패: {str(e)}")
+        # 지지선 근처에서 반등이 있었는지 확인
+        support_price = data['low'].iloc[index]
+        
+        # 이후 데이터에서 반등 확인
+        future_data = data.iloc[index+1:index+lookback+1]
+        if len(future_data) == 0:
             return False
+        
+        # 반등률 확인 (지지선 대비 2% 이상 상승)
+        max_bounce = future_data['high'].max()
+        bounce_rate = (max_bounce - support_price) / support_price
+        
+        return bounce_rate >= 0.02
+    
+    def merge_support_levels(self, support_levels: List[float]) -> List[float]:
+        """지지선 정렬 및 병합 - 상대 간격 support_tolerance 격자로 묶어 구간별 최저 지지선만 유지"""
+        if not support_levels:
+            return []
+        
+        levels = np.unique(np.asarray(support_levels, dtype=np.float64))  # 정렬 + 완전 중복 제거
+        if levels.size < 2 or self.support_tolerance <= 0 or levels[0] <= 0:
+            return levels.tolist()
+        
+        buckets = np.round(np.log(levels) / np.log1p(self.support_tolerance))
+        _, first_index = np.unique(buckets, return_index=True)
+        return levels[np.sort(first_index)].tolist()
     
     def is_near_support_level(self, current_price: float, support_levels: List[float]) -> bool:
         """현재가가 지지선 근처인지 확인"""
-        try:
-            if not support_levels:
-                return False
-            
-            for support_level in support_levels:
-                # 지지선 대비 허용 오차 내에 있는지 확인
-                price_diff = abs(current_price - support_level) / support_level
-                if price_diff <= self.support_tolerance:
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            log_error(f"지지선 근처 확인 실패: {str(e)}")
+        if not support_levels:
             return False
+        
+        if len(support_levels) > _PARALLEL_SUPPORT_MIN:
+            levels = np.asarray(support_levels, dtype=np.float64)
+            return bool(_near_support(float(current_price), levels, float(self.support_tolerance)))
+        
+        for support_level in support_levels:
+            # 지지선 대비 허용 오차 내에 있는지 확인
+            price_diff = abs(current_price - support_level) / support_level
+            if price_diff <= self.support_tolerance:
+                return True
+        
+        return False
+    
+    def _support_bands(self, support_levels: List[float]) -> Tuple[List[float], List[float]]:
+        """정렬된 지지선별 허용 가격 구간 (하한 목록, 상한 목록)"""
+        tolerance = self.support_tolerance
+        return ([level - level * tolerance for level in support_levels],
+                [level + level * tolerance for level in support_levels])
+    
+    @staticmethod
+    def _in_support_band(current_price: float, support_bands: Tuple[List[float], List[float]]) -> bool:
+        """현재가가 지지선 허용 구간 안에 있는지 확인
+        
+        하한/상한 모두 지지선 순서대로 증가하므로 하한이 현재가 이하인 마지막 구간의
+        상한만 넘지 않으면 됨 (그보다 아래 구간의 상한은 더 낮음)
+        """
+        lows, highs = support_bands
+        index = bisect_right(lows, current_price) - 1
+        return index >= 0 and current_price <= highs[index]
     
     def get_minute_data(self, stock_code: str, period: int = 30, interval: int = 1) -> Optional[pd.DataFrame]:
         """분봉 데이터 조회"""
@@ -387,49 +702,89 @@ class SupportAnalyzer:
     def generate_mock_minute_data(self, period: int) -> pd.DataFrame:
         """모의 분봉 데이터 생성 (테스트용)"""
         try:
-            import random
+            rng = _rng
             
             # 기준가 설정
             base_price = 10000
             
-            data = []
-            current_price = base_price
-            
-            for i in range(period):
-                # 랜덤한 가격 변동
-                change_rate = random.uniform(-0.02, 0.02)
-                
-                open_price = current_price
-                high_price = open_price * (1 + abs(change_rate) + random.uniform(0, 0.01))
-                low_price = open_price * (1 - abs(change_rate) - random.uniform(0, 0.01))
-                close_price = open_price * (1 + change_rate)
-                
-                volume = random.randint(1000, 10000)
-                
-                data.append({
-                    'datetime': datetime.now() - timedelta(minutes=period-i),
-                    'open': open_price,
-                    'high': high_price,
-                    'low': low_price,
-                    'close': close_price,
-                    'volume': volume
-                })
-                
-                current_price = close_price
-            
-            return pd.DataFrame(data)
+            # 랜덤한 가격 변동 (컬럼별 배열로 한 번에 생성)
+            # 가격은 float32, 거래량은 int32로 보관 (분봉 가격/거래량 범위에 충분한 정밀도)
+            change_rate = rng.uniform(-0.02, 0.02, period)
+            close_price = base_price * np.cumprod(1 + change_rate)
+            open_price = np.concatenate(([base_price], close_price))[:period]
+            high_price = open_price * (1 + np.abs(change_rate) + rng.uniform(0, 0.01, period))
+            low_price = open_price * (1 - np.abs(change_rate) - rng.uniform(0, 0.01, period))
+            volume = rng.integers(1000, 10000, period, dtype=np.int32, endpoint=True)
+            
+            return pd.DataFrame({
+                'datetime': pd.date_range(end=datetime.now() - timedelta(minutes=1), periods=period, freq='min'),
+                'open': open_price.astype(np.float32),
+                'high': high_price.astype(np.float32),
+                'low': low_price.astype(np.float32),
+                'close': close_price.astype(np.float32),
+                'volume': volume
+            })
             
         except Exception as e:
             log_error(f"모의 분봉 데이터 생성 실패: {str(e)}")
             return None
     
+    def _resample_lows_highs(self, stock_code: str, lows: np.ndarray, highs: np.ndarray,
+                             interval: int, period: int) -> Tuple[np.ndarray, np.ndarray]:
+        """1분봉 저가/고가의 마지막 period * interval개를 interval분봉 저가/고가로 변환
+        
+        resample_minute_data와 같은 기준으로 묶되 DataFrame 대신 종목별 버퍼에 기록해 반환합니다
+        (반환 배열은 같은 종목의 다음 변환 때 덮어써짐).
+        """
+        lows = lows[-period * interval:]
+        highs = highs[-period * interval:]
+        n = lows.shape[0]
+        starts = np.arange(n % interval, n, interval)
+        
+        buffer = self._bar_buffers.get(stock_code)
+        if buffer is None or buffer.dtype != lows.dtype or buffer.shape[1] < starts.size:
+            capacity = max(max(self.SUPPORT_INTERVALS.values()), starts.size)
+            buffer = np.empty((2, capacity), dtype=lows.dtype)
+            self._bar_buffers[stock_code] = buffer
+        
+        bar_lows = buffer[0, :starts.size]
+        bar_highs = buffer[1, :starts.size]
+        if starts.size:
+            # NaN 건너뜀 (resample_minute_data와 동일)
+            np.fmin.reduceat(lows, starts, out=bar_lows)
+            np.fmax.reduceat(highs, starts, out=bar_highs)
+        return bar_lows, bar_highs
+    
+    def resample_minute_data(self, minute_data: pd.DataFrame, interval: int) -> pd.DataFrame:
+        """1분봉을 interval분봉으로 변환 (마지막 봉 기준으로 묶고 앞쪽 자투리 봉은 제외)"""
+        n = len(minute_data)
+        starts = np.arange(n % interval, n, interval)
+        if starts.size == 0:
+            return minute_data.iloc[:0]
+        ends = starts + interval - 1
+        
+        resampled = {}
+        for column in minute_data.columns:
+            values = minute_data[column].to_numpy()
+            if column == 'open':
+                resampled[column] = values[starts]
+            elif column in ('datetime', 'close'):
+                resampled[column] = values[ends]
+            elif column == 'high':
+                resampled[column] = np.fmax.reduceat(values, starts)  # NaN 건너뜀
+            elif column == 'low':
+                resampled[column] = np.fmin.reduceat(values, starts)
+            elif column == 'volume':
+                resampled[column] = np.add.reduceat(values, starts)
+        
+        return pd.DataFrame(resampled)
+    
     def get_current_volume(self, stock_code: str) -> Optional[int]:
         """현재 거래량 조회"""
         try:
             # 실제로는 실시간 데이터에서 조회
             # 여기서는 모의 데이터 반환
-            import random
-            return random.randint(1000, 5000)
+            return int(_rng.integers(1000, 5000, endpoint=True))
             
         except Exception as e:
             log_error(f"현재 거래량 조회 실패 {stock_code}: {str(e)}")
@@ -440,8 +795,7 @@ class SupportAnalyzer:
         try:
             # 실제로는 추적 시작일부터 현재까지의 최대 거래량 조회
             # 여기서는 모의 데이터 반환
-            import random
-            return random.randint(10000, 50000)
+            return int(_rng.integers(10000, 50000, endpoint=True))
             
         except Exception as e:
             log_error(f"급등 기간 최대 거래량 조회 실패 {stock_code}: {str(e)}")
@@ -475,6 +829,7 @@ class SupportAnalyzer:
             self.rsi_cache.clear()
             self.support_cache.clear()
             self.volume_cache.clear()
+            self._bar_buffers.clear()
             
             log_debug("지지 조건 분석기 캐시 초기화 완료")
             
@@ -489,9 +844,9 @@ class SupportAnalyzer:
                 'stock_code': stock_code,
                 'last_analysis_time': datetime.now().isoformat(),
                 'cache_status': {
-                    'rsi_cached': len([k for k in self.rsi_cache.keys() if stock_code in k]),
-                    'support_cached': len([k for k in self.support_cache.keys() if stock_code in k]),
-                    'volume_cached': len([k for k in self.volume_cache.keys() if stock_code in k])
+                    'rsi_cached': self.rsi_cache.stock_counts.get(stock_code, 0),
+                    'support_cached': self.support_cache.stock_counts.get(stock_code, 0),
+                    'volume_cached': self.volume_cache.stock_counts.get(stock_code, 0)
                 },
                 'settings': {
                     'rsi_threshold': self.rsi_threshold,
@@ -509,31 +864,18 @@ class SupportAnalyzer:
     def cleanup_old_cache(self, hours: int = 1):
         """오래된 캐시 정리"""
         try:
-            current_time = datetime.now()
-            cutoff_time = current_time - timedelta(hours=hours)
+            cutoff_bucket = _minute_bucket() - hours * 60
             
-            # 시간 기반 캐시 키 정리
+            # 캐시 키 (종목코드, 분 단위 시각) 기준 정리
             for cache_dict in [self.rsi_cache, self.support_cache, self.volume_cache]:
-                keys_to_remove = []
-                
-                for key in cache_dict.keys():
-                    try:
-                        # 캐시 키에서 시간 정보 추출
-                        time_part = key.split('_')[-1]  # HHMM 형식
-                        cache_hour = int(time_part[:2])
-                        cache_minute = int(time_part[2:])
-                        
-                        cache_time = current_time.replace(hour=cache_hour, minute=cache_minute, second=0, microsecond=0)
-                        
-                        if cache_time < cutoff_time:
-                            keys_to_remove.append(key)
-                            
-                    except (ValueError, IndexError):
-                        # 잘못된 형식의 키는 제거
-                        keys_to_remove.append(key)
+                keys_to_remove = [key for key in cache_dict if key[1] < cutoff_bucket]
                 
                 for key in keys_to_remove:
-                    del cache_dict[key]
+                    cache_dict.discard(key)
+            
+            # 지지선 캐시가 모두 정리된 종목(더 이상 확인하지 않는 종목)의 분봉 버퍼 제거
+            for stock_code in [code for code in self._bar_buffers if code not in self.support_cache.stock_counts]:
+                del self._bar_buffers[stock_code]
             
             log_debug(f"오래된 캐시 정리 완료: {hours}시간 이전 데이터 제거")
             
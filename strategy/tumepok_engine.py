@@ -7,23 +7,132 @@ Tumepok Engine for Tumepok Trading System
 import pandas as pd
 import json
 import os
+import sys
+import time
+from bisect import bisect_right
+from itertools import chain, islice
+from queue import Empty
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from utils.enhanced_logging import log_info, log_error, log_debug, log_trading, log_warning
 from utils.calculator import TumepokCalculator
 from utils.sold_stocks_manager import SoldStocksManager
 from config.constants import TRACKING_STATUS, BUY_STAGES, SELL_REASONS, TUMEPOK_MATRIX
-from .rise_tracker import RiseTracker
+from .rise_tracker import RiseTracker, BUY_STAGE_BITS
 from .support_analyzer import SupportAnalyzer
 
 
+@dataclass(slots=True)
+class TrackingInfo:
+    """투매폭 추적 종목 상태 (실시간 틱마다 갱신되므로 슬롯 속성으로 보관)
+    
+    기존 dict 추적 정보와 호환되도록 info['high_price'], info.get('base_price', 0) 형태의 조회를 지원합니다.
+    값이 None인 항목은 dict에 키가 없던 경우와 같이 get()/setdefault()에서 기본값을 사용합니다.
+    """
+    stock_code: str
+    stock_name: str = ''
+    start_price: float = 0
+    high_price: float = 0
+    current_price: float = 0
+    rise_days: int = 1
+    rise_rate: float = 0.0
+    drop_rate: float = 0.0
+    daily_change_rate: Optional[float] = None
+    cumulative_rise_rate: Optional[float] = None
+    status: str = 'TRACKING'
+    condition_name: Optional[str] = None
+    condition_idx: Optional[int] = None
+    waiting_days: int = 0
+    bought_stages: int = 0  # 매수 완료 단계 비트마스크 (BUY_STAGE_BITS)
+    target_drop_info: Optional[dict] = None
+    created_time: datetime = field(default_factory=datetime.now)
+    base_price: Optional[float] = None
+    start_date: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _TRACKING_FIELDS and getattr(self, key) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None)
+        return default if value is None else value
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key)
+        if value is None:
+            setattr(self, key, default)
+            value = default
+        return value
+    
+    def add_bought_stage(self, stage: str) -> None:
+        """매수 단계 추가"""
+        self.bought_stages |= BUY_STAGE_BITS[stage]
+    
+    def has_bought_stage(self, stage: str) -> bool:
+        """해당 단계 매수 여부"""
+        return bool(self.bought_stages & BUY_STAGE_BITS.get(stage, 0))
+    
+    def get_bought_stage_list(self) -> List[str]:
+        """매수 완료 단계 목록 (1차, 2차, 3차 순)"""
+        return [stage for stage, bit in BUY_STAGE_BITS.items() if self.bought_stages & bit]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """저장/표시용 dict 변환"""
+        return {name: getattr(self, name) for name in _TRACKING_FIELDS}
+
+
+_TRACKING_FIELDS = tuple(f.name for f in fields(TrackingInfo))
+
+
+def _intern_code(stock_code):
+    """수신한 종목코드 문자열을 intern (추적/포지션 dict 조회 시 같은 객체로 비교)"""
+    return sys.intern(stock_code) if type(stock_code) is str else stock_code
+
+
+# 매수선 도달 개수(0~3)별 매수 단계
+_STAGE_BY_REACHED = ('WAIT', '1차', '2차', '3차')
+# 1~3차 모두 매수 완료한 비트마스크
+_ALL_STAGES_BOUGHT = BUY_STAGE_BITS['1차'] | BUY_STAGE_BITS['2차'] | BUY_STAGE_BITS['3차']
+
+
+class _DropRates(dict):
+    """매수선별 하락률 dict + 정렬된 (1차, 2차, 3차) 매수선 튜플 (단계 판정 시 이분 탐색용)"""
+    __slots__ = ('lines',)
+
+
+def _to_change_rate(change_rate):
+    """실시간 등락률을 float로 변환 (대부분 이미 숫자이므로 문자열 정리는 변환 실패 시에만)"""
+    if type(change_rate) is float:
+        return change_rate
+    try:
+        return float(change_rate)  # '+1.5', '-0.3' 같은 부호 문자열도 그대로 변환됨
+    except (TypeError, ValueError):
+        try:
+            return float(str(change_rate).replace('+', '').replace('%', ''))
+        except ValueError:
+            return 0.0
+
+
 class TumepokEngine:
     """투매폭 전략 메인 엔진 (기존 큐 시스템 통합)"""
     
+    # 실시간 큐 한 번 비울 때 처리하는 최대 메시지 수 (테이블 갱신은 묶음당 한 번)
+    REALTIME_BATCH_SIZE = 200
+    
     def __init__(self, main_window, queue_manager=None):
         """투매폭 엔진 초기화"""
         self.main_window = main_window
         self.config = main_window.tumepok_config if hasattr(main_window, 'tumepok_config') else None
+        self.reload_config()
         
         # 큐 시스템 연결
         self.queue_manager = queue_manager
@@ -68,7 +177,7 @@ class TumepokEngine:
         log_info("매도 종목 관리자 초기화 완료")
         
         # 추적 중인 종목들 (기존 호환성 유지)
-        self.tracking_stocks = {}  # {종목코드: TrackingInfo}
+        self.tracking_stocks: Dict[str, TrackingInfo] = {}  # {종목코드: TrackingInfo}
         
         # 포지션 관리 중인 종목들
         self.positions = {}  # {종목코드: PositionInfo}
@@ -81,6 +190,20 @@ class TumepokEngine:
         self.last_scan_time = None
         self.scanned_stocks = set()  # 이미 스캔된 종목 (중복 방지)
         
+        # 실시간 묶음 처리 중 공통 시각 (묶음 시작 시 한 번만 조회, 묶음 밖에서는 None)
+        self._batch_now = None
+        self._batch_time = None
+        
+        # 추적현황 테이블 갱신 캐시 (내용이 바뀌지 않으면 같은 DataFrame을 재사용하고 패널 갱신 생략)
+        self._sold_view_source = None  # 매도완료 표시 전 RiseTracker DataFrame
+        self._sold_view_key = None     # 매도완료 표시에 쓴 종목 집합
+        self._sold_view = None         # 매도완료 표시를 반영한 사본
+        self._last_panel_df = None     # 마지막으로 패널에 전달한 DataFrame
+        
+        # 틱마다 쓰는 UI 참조 (메인 윈도우가 나중에 패널을 만들 수 있으므로 없으면 다시 조회)
+        self._panel = getattr(main_window, 'tumepok_panel', None)
+        self._update_account_table = getattr(main_window, 'update_account_table', None)
+        
         # 성능 통계
         self.stats = {
             'total_scanned': 0,
@@ -92,6 +215,44 @@ class TumepokEngine:
         
         log_info("투매폭 엔진 초기화 완료")
     
+    def reload_config(self):
+        """실시간 처리에서 매번 쓰는 설정값을 다시 읽어 보관 (설정 변경 시 호출)"""
+        self._rise_threshold = self.config.get_rise_threshold() if self.config else 20.0
+        self._max_tracking = self.config.get_max_tracking_stocks() if self.config else 10
+        self._build_drop_rate_table()
+    
+    def _build_drop_rate_table(self):
+        """투매폭 매트릭스 구간별 매수선 하락률을 미리 계산 (틱마다 매트릭스를 순회하지 않도록)"""
+        def make_drops(row):
+            drop_min = row['drop_min']
+            drop_max = row['drop_max']
+            # 3단계 매수선 계산 (적정 하락폭 범위 내에서만)
+            # 1차: 최소 하락폭 진입
+            # 2차: 중간 지점
+            # 3차: 최대 하락폭의 90% (여유 10% 확보)
+            drops = _DropRates({
+                '1차': drop_min,                                # 1차선: 최소 하락폭
+                '2차': drop_min + (drop_max - drop_min) * 0.5,  # 2차선: 중간 하락폭
+                '3차': drop_min + (drop_max - drop_min) * 0.9,  # 3차선: 최대 하락폭의 90%
+                '손절': drop_max                                # 손절선: 최대 하락폭 초과
+            })
+            drops.lines = (drops['1차'], drops['2차'], drops['3차'])
+            return drops
+        
+        rows = sorted(TUMEPOK_MATRIX, key=lambda row: row['rise_min'])
+        self._drop_rise_mins = [row['rise_min'] for row in rows]
+        self._drop_rise_maxs = [row['rise_max'] for row in rows]
+        self._drop_rows = [make_drops(row) for row in rows]
+        # 범위를 벗어나는 경우(구간 사이 포함) 마지막 구간 사용
+        self._drop_fallback = make_drops(TUMEPOK_MATRIX[-1])
+        
+        # 구간이 겹치면 첫 번째 일치 구간 규칙을 이분 탐색으로 보장할 수 없으므로 순차 탐색 유지
+        self._drop_bisect = all(
+            self._drop_rise_maxs[i] < self._drop_rise_mins[i + 1] for i in range(len(rows) - 1)
+        )
+        if not self._drop_bisect:
+            self._drop_rows_ordered = [(row['rise_min'], row['rise_max'], make_drops(row)) for row in TUMEPOK_MATRIX]
+    
     def start_engine(self):
         """투매폭 엔진 시작"""
         try:
@@ -122,35 +283,16 @@ class TumepokEngine:
             
             # 연속상승 추적기의 추적 종목들 (상위 몇 개만)
             if self.rise_tracker:
-                tracking_stocks = self.rise_tracker.tracking_stocks
-                total_stocks += len(tracking_stocks)
+                total_stocks += len(self.rise_tracker.tracking_stocks)
                 
-                # 중요한 상태(BUYING, TRACKING) 종목 우선 등록
-                priority_stocks = []
-                normal_stocks = []
-                
-                for stock_code, data in tracking_stocks.items():
-                    status = getattr(data, 'status', 'READY')
-                    if status in ['BUYING', 'TRACKING']:
-                        priority_stocks.append(stock_code)
-                    else:
-                        normal_stocks.append(stock_code)
-                
-                # 우선순위 종목 먼저 등록
-                for stock_code in priority_stocks[:max_realtime_stocks]:
-                    if registered_stocks >= max_realtime_stocks:
-                        break
-                    self.websocket_req_queue.put({
-                        'action_id': '실시간등록',
-                        '종목코드': stock_code,
-                        'data_type': '0B'  # 주식체결
-                    })
-                    log_info(f"기존 추적 종목 실시간 등록 재요청: {stock_code}")
-                    registered_stocks += 1
+                # 중요한 상태(BUYING, TRACKING) 종목 우선, 남은 자리에 일반 종목 등록 (상태 인덱스 사용)
+                priority_statuses = ('BUYING', 'TRACKING')
+                candidate_codes = chain(
+                    self.rise_tracker.iter_codes_by_status(priority_statuses),
+                    self.rise_tracker.iter_codes_by_status(priority_statuses, exclude=True)
+                )
                 
-                # 남은 자리에 일반 종목 등록
-                remaining_slots = max_realtime_stocks - registered_stocks
-                for stock_code in normal_stocks[:remaining_slots]:
+                for stock_code in islice(candidate_codes, max_realtime_stocks):
                     self.websocket_req_queue.put({
                         'action_id': '실시간등록',
                         '종목코드': stock_code,
@@ -160,7 +302,7 @@ class TumepokEngine:
                     registered_stocks += 1
             
             # 투매폭 추적 종목들 (이미 등록된 것 제외)
-            for stock_code in list(self.tracking_stocks.keys())[:5]:  # 최대 5개만
+            for stock_code in islice(self.tracking_stocks, 5):  # 최대 5개만
                 if registered_stocks >= max_realtime_stocks:
                     break
                 self.websocket_req_queue.put({
@@ -184,8 +326,9 @@ class TumepokEngine:
         try:
             self.is_active = False
             
-            # 연속상승 추적 데이터 최종 저장
+            # 연속상승 추적 데이터 최종 저장 (저장 후 저널 정리)
             self.save_rise_tracker_data()
+            self.rise_tracker.close_journal()
             
             log_info("투매폭 엔진 중지됨")
             
@@ -228,14 +371,111 @@ class TumepokEngine:
     
     def on_realtime_data(self, data):
         """실시간 데이터 처리"""
+        tracking_updated, position_updated = self._handle_realtime_data(data)
+        if tracking_updated:
+            self._refresh_tracking_panel()
+        if position_updated:
+            self._refresh_account_table()
+    
+    def on_realtime_data_batch(self, data_list):
+        """실시간 데이터 묶음 처리 (장 시작 직후 등 틱이 몰릴 때 사용)
+        
+        틱별 가격/상태 갱신은 순서대로 처리하고 추적현황 테이블(DataFrame 재생성)과
+        계좌 테이블은 묶음 끝에서 한 번만 갱신합니다.
+        """
+        any_tracking_updated = False
+        any_position_updated = False
+        self._batch_time = time.time()
+        self._batch_now = datetime.fromtimestamp(self._batch_time)
+        try:
+            for data in data_list:
+                tracking_updated, position_updated = self._handle_realtime_data(data)
+                any_tracking_updated = any_tracking_updated or tracking_updated
+                any_position_updated = any_position_updated or position_updated
+        finally:
+            self._batch_now = None
+            self._batch_time = None
+        
+        if any_tracking_updated:
+            self._refresh_tracking_panel()
+        if any_position_updated:
+            self._refresh_account_table()
+    
+    def drain_realtime_queue(self, realtime_queue, max_messages: int = REALTIME_BATCH_SIZE) -> int:
+        """실시간 체결 큐에 쌓인 메시지를 최대 max_messages개까지 꺼내 한 묶음으로 처리
+        
+        Args:
+            realtime_queue: 실시간 체결 메시지만 담긴 전용 큐 (다른 메시지가 섞인 websocket_result_queue는 사용 불가 -
+                체결이 아닌 메시지는 여기서 버려져 원래 처리하는 곳에 전달되지 않음)
+            max_messages: 한 번에 처리할 최대 메시지 수
+        
+        Returns:
+            처리한 메시지 수
+        """
+        data_list = []
+        for _ in range(max_messages):
+            try:
+                data_list.append(realtime_queue.get_nowait())
+            except Empty:
+                break
+        
+        if data_list:
+            self.on_realtime_data_batch(data_list)
+        return len(data_list)
+    
+    def _now(self):
+        """현재 시각 (실시간 묶음 처리 중이면 묶음 시작 시각을 재사용)"""
+        return self._batch_now or datetime.now()
+    
+    def _now_ts(self):
+        """현재 epoch 초 (실시간 묶음 처리 중이면 묶음 시작 시각을 재사용)"""
+        return self._batch_time or time.time()
+    
+    def bind_panel(self, panel):
+        """추적현황 패널 지정 (메인 윈도우가 패널을 교체/생성한 뒤 호출)"""
+        self._panel = panel
+        self._last_panel_df = None
+    
+    def _refresh_account_table(self):
+        """계좌 테이블 갱신 (베이스코드 방식)"""
+        update_account_table = self._update_account_table
+        if update_account_table is None:
+            update_account_table = self._update_account_table = getattr(self.main_window, 'update_account_table', None)
+        if update_account_table is not None:
+            try:
+                update_account_table()
+            except Exception as update_error:
+                log_debug(f"계좌 테이블 즉시 업데이트 실패: {update_error}")
+    
+    def _refresh_tracking_panel(self):
+        """추적현황 테이블 갱신"""
+        panel = self._panel
+        if panel is None:
+            panel = self._panel = getattr(self.main_window, 'tumepok_panel', None)
+        if panel:
+            try:
+                tracking_df = self.get_tracking_dataframe()
+                # 표시 내용이 그대로면 같은 DataFrame이 반환되므로 패널 갱신 생략
+                if tracking_df is self._last_panel_df:
+                    return
+                panel.update_tracking_data(tracking_df)
+                self._last_panel_df = tracking_df
+            except Exception as update_error:
+                log_debug(f"추적현황 테이블 즉시 업데이트 실패: {update_error}")
+    
+    def _handle_realtime_data(self, data):
+        """실시간 데이터 1건 처리 - (추적 종목 갱신 여부, 포지션 갱신 여부) 반환"""
+        tracking_updated = False
+        position_updated = False
+        stock_code = None
         try:
             if not self.is_active:
                 log_debug(f"[DEBUG] 투매폭 엔진 비활성 상태로 실시간 데이터 스킵: {data.get('종목코드')}")
-                return
+                return False, False
             
-            stock_code = data.get('종목코드')
+            stock_code = _intern_code(data.get('종목코드'))
             current_price = data.get('현재가', 0)
-            change_rate = data.get('등락률', data.get('전일대비율', 0))  # WebSocket에서 등락률로 전송됨
+            change_rate = _to_change_rate(data.get('등락률', data.get('전일대비율', 0)))  # WebSocket에서 등락률로 전송됨
             high_price = data.get('고가', None)  # 당일 고가 (키움 API 필드 17)
             
             # 디버그: 모든 실시간 데이터 수신 확인
@@ -243,10 +483,15 @@ class TumepokEngine:
             
             if not stock_code or current_price <= 0:
                 log_debug(f"[DEBUG] 유효하지 않은 데이터로 스킵: stock_code={stock_code}, current_price={current_price}")
-                return
+                return False, False
+            
+            # 종목별 소속(추적/포지션)은 틱당 한 번씩만 조회
+            # (포지션은 체결 콜백에서만 추가/삭제되므로 틱 처리 중 바뀌지 않음, update_position에서 재확인)
+            is_tracked = stock_code in self.tracking_stocks
+            has_position = stock_code in self.positions
             
             # 디버그: 보유 포지션 실시간 데이터 수신 확인
-            if stock_code in self.positions:
+            if has_position:
                 log_info(f"[포지션] 실시간 데이터 수신: {stock_code}, 현재가: {current_price:,}원, 등락률: {change_rate:.2f}%")
             
             # 타입 변환 (필요시)
@@ -258,9 +503,10 @@ class TumepokEngine:
                     change_rate = 0.0
             
             # 급등주 감지 (20% 이상) - 신규 추적 추가 (재매수 제한 확인 포함)
-            rise_threshold = self.config.get_rise_threshold() if self.config else 20.0
-            if change_rate >= rise_threshold and stock_code not in self.tracking_stocks:
+            rise_threshold = self._rise_threshold
+            if change_rate >= rise_threshold and not is_tracked:
                 if self.add_to_tracking(stock_code, current_price, change_rate):
+                    is_tracked = True
                     log_info(f"신규 급등주 발견: {stock_code}, 등락률: {change_rate:.2f}%")
                 # add_to_tracking에서 재매수 제한 확인하므로 실패 시 자동으로 스킵됨
             
@@ -272,67 +518,49 @@ class TumepokEngine:
                 if tracking_info:
                     stock_name = tracking_info.stock_name or f"종목{stock_code}"
                     
-                    # 주요 업데이트만 로깅 (5분마다)
-                    import time
-                    current_minute = int(time.time()) // 300  # 5분 단위
-                    cache_key = f"{stock_code}_{current_minute}"
-                    
-                    if not hasattr(self, 'last_log_cache'):
-                        self.last_log_cache = {}
-                    
-                    if cache_key not in self.last_log_cache:
+                    # 주요 업데이트만 로깅 (종목별 5분마다)
+                    current_minute = int(self._now_ts()) // 300  # 5분 단위
+                    if tracking_info.last_log_minute != current_minute:
                         log_info(f"연속상승 업데이트: {stock_name}({stock_code}) - "
                                 f"현재가: {current_price:,}원, 등락률: {change_rate:.2f}%, "
                                 f"상승률: {tracking_info.rise_rate:.1f}%, 하락률: {tracking_info.drop_rate:.1f}%, "
                                 f"상태: {tracking_info.status}")
-                        self.last_log_cache[cache_key] = True
+                        tracking_info.last_log_minute = current_minute
                     
-                    # 고점 갱신 시 데이터 저장
+                    # 고점 갱신 시 저널에 기록 (전체 저장은 주기적 스냅샷으로)
                     if update_result == "HIGH_UPDATED":
-                        self.save_rise_tracker_data()
+                        self.rise_tracker.journal_update(stock_code)
                         log_info(f"고점 갱신: {stock_name}({stock_code}) - 새 고점: {current_price:,}원")
                     
                     # 투매폭 연동 처리 - 연속상승 추적기 데이터 기반
                     if tracking_info.status in ['READY', 'WAITING']:
                         self.process_tumepok_signal(stock_code, tracking_info)
                     
-                    # RiseTracker 업데이트 시 추적현황 테이블 즉시 업데이트
-                    if hasattr(self.main_window, 'tumepok_panel') and self.main_window.tumepok_panel:
-                        try:
-                            tracking_df = self.get_tracking_dataframe()
-                            self.main_window.tumepok_panel.update_tracking_data(tracking_df)
-                        except Exception as update_error:
-                            log_debug(f"RiseTracker 추적현황 테이블 즉시 업데이트 실패: {update_error}")
+                    # RiseTracker 업데이트 시 추적현황 테이블 갱신
+                    tracking_updated = True
             
             # 전용 추적 종목 업데이트 (하위 호환성)
-            elif stock_code in self.tracking_stocks:
+            elif is_tracked:
                 self.update_tracking_stock(stock_code, current_price, change_rate)
                 
-                # 추적 종목 테이블 즉시 업데이트
-                if hasattr(self.main_window, 'tumepok_panel') and self.main_window.tumepok_panel:
-                    try:
-                        tracking_df = self.get_tracking_dataframe()
-                        self.main_window.tumepok_panel.update_tracking_data(tracking_df)
-                    except Exception as update_error:
-                        log_debug(f"추적 테이블 즉시 업데이트 실패: {update_error}")
+                # 추적 종목 테이블 갱신
+                tracking_updated = True
             
             # 포지션 관리 중인 종목 업데이트
-            if stock_code in self.positions:
+            if has_position:
                 log_debug(f"포지션 업데이트 호출: {stock_code}, 현재가: {current_price:,}원, 등락률: {change_rate:.2f}%")
                 self.update_position(stock_code, current_price)
                 
-                # 즉시 테이블 업데이트 (베이스코드 방식)
-                if hasattr(self.main_window, 'update_account_table'):
-                    try:
-                        self.main_window.update_account_table()
-                    except Exception as update_error:
-                        log_debug(f"계좌 테이블 즉시 업데이트 실패: {update_error}")
+                # 계좌 테이블 갱신 (묶음 처리 시 묶음 끝에서 한 번)
+                position_updated = True
                 
                 # 포지션 테이블은 0.5초 정기 업데이트에서 처리 (포트폴리오 방식)
                 log_debug(f"포지션 업데이트 완료: {stock_code} (정기 업데이트에서 테이블 반영)")
                 
         except Exception as e:
             log_error(f"실시간 데이터 처리 실패: {stock_code}, {str(e)}")
+        
+        return tracking_updated, position_updated
     
     def on_condition_signal(self, data):
         """조건식 편입/편출 신호 처리 - 비활성화"""
@@ -360,6 +588,7 @@ class TumepokEngine:
     def on_condition_entry(self, stock_code, condition_idx):
         """조건식 편입 처리"""
         try:
+            stock_code = _intern_code(stock_code)
             # 조건식 연동 관리자를 통한 처리
             if hasattr(self.main_window, 'condition_integration_manager'):
                 integration_manager = self.main_window.condition_integration_manager
@@ -386,7 +615,7 @@ class TumepokEngine:
             tracking_info = self.tracking_stocks[stock_code]
             
             # 현재 가격 정보 확인
-            current_price = tracking_info.get('current_price', 0)
+            current_price = tracking_info.current_price
             if current_price <= 0:
                 log_debug(f"유효하지 않은 현재가: {stock_code}")
                 return
@@ -400,14 +629,14 @@ class TumepokEngine:
             # 조건식 신호를 추가 확신 요소로 활용하여 매수 실행
             log_info(f"조건식 확인 매수: {stock_code} - {buy_stage}단계 (조건식: {condition_idx})")
             
+            # 조건식 확인이 있으므로 지지 조건 요구사항 완화
+            required_conditions = max(1, self.config.get_condition_requirements(buy_stage) - 1)
+            
             # 지지 조건 확인 (조건식 신호가 있으므로 완화된 조건 적용)
             support_result = self.support_analyzer.check_all_conditions(
-                stock_code, tracking_info, condition_confirmed=True
+                stock_code, tracking_info, condition_confirmed=True, required_count=required_conditions
             )
             
-            # 조건식 확인이 있으므로 지지 조건 요구사항 완화
-            required_conditions = max(1, self.config.get_condition_requirements(buy_stage) - 1)
-            
             if support_result['satisfied_count'] >= required_conditions:
                 self.execute_buy_order(stock_code, buy_stage, condition_confirmed=condition_idx)
             else:
@@ -428,7 +657,7 @@ class TumepokEngine:
                 return
             
             # 최대 추적 종목 수 확인
-            max_tracking = self.config.get_max_tracking_stocks()
+            max_tracking = self._max_tracking
             if len(self.tracking_stocks) >= max_tracking:
                 log_debug(f"최대 추적 종목 수 초과: {len(self.tracking_stocks)}/{max_tracking}")
                 return
@@ -452,11 +681,11 @@ class TumepokEngine:
             tracking_info = self.tracking_stocks[stock_code]
             
             # 투매폭 진입 조건 확인
-            if tracking_info.get('status') == 'READY':
+            if tracking_info.status == 'READY':
                 # 조건식 신호를 추가 확인 요소로 활용
                 self._process_condition_confirmed_buy(stock_code, condition_idx)
             else:
-                log_debug(f"투매폭 진입 대기 상태가 아님: {stock_code} (상태: {tracking_info.get('status')})")
+                log_debug(f"투매폭 진입 대기 상태가 아님: {stock_code} (상태: {tracking_info.status})")
             
         except Exception as e:
             log_error(f"조건식 매수 신호 처리 실패: {str(e)}")
@@ -520,7 +749,7 @@ class TumepokEngine:
     def add_tracking_from_basic_info(self, data):
         """기본정보로부터 추적 추가"""
         try:
-            stock_code = data.get('종목코드')
+            stock_code = _intern_code(data.get('종목코드'))
             stock_name = data.get('종목명')
             current_price = data.get('현재가', 0)
             condition_idx = data.get('condition_idx', 0)
@@ -535,24 +764,17 @@ class TumepokEngine:
                 return
             
             # 추적 정보 생성
-            tracking_info = {
-                'stock_code': stock_code,
-                'stock_name': stock_name,
-                'start_date': datetime.now().strftime('%Y%m%d'),
-                'start_price': current_price,
-                'high_price': current_price,
-                'current_price': current_price,
-                'rise_days': 1,
-                'rise_rate': 0.0,
-                'drop_rate': 0.0,
-                'status': TRACKING_STATUS['TRACKING'],
-                'condition_name': self.main_window.get_condition_name(condition_idx),
-                'condition_idx': condition_idx,
-                'waiting_days': 0,
-                'bought_stages': set(),
-                'target_drop_info': None,
-                'created_time': datetime.now()
-            }
+            tracking_info = TrackingInfo(
+                stock_code=stock_code,
+                stock_name=stock_name,
+                start_date=datetime.now().strftime('%Y%m%d'),
+                start_price=current_price,
+                high_price=current_price,
+                current_price=current_price,
+                status=TRACKING_STATUS['TRACKING'],
+                condition_name=self.main_window.get_condition_name(condition_idx),
+                condition_idx=condition_idx
+            )
             
             self.tracking_stocks[stock_code] = tracking_info
             
@@ -573,18 +795,12 @@ class TumepokEngine:
             if not self.is_active:
                 return
             
+            stock_code = _intern_code(stock_code)
+            
             current_price = price_data.get('현재가', 0)
-            change_rate = price_data.get('등락률', 0.0)
+            change_rate = _to_change_rate(price_data.get('등락률', 0.0))
             high_price = price_data.get('고가', 0)  # 실시간 고가 정보
             
-            # 등락률 숫자 변환
-            if isinstance(change_rate, str):
-                change_rate = change_rate.replace('+', '').replace('%', '')
-                try:
-                    change_rate = float(change_rate)
-                except ValueError:
-                    change_rate = 0.0
-            
             # 추적 중이 아닌 종목이면 자동 추가 (실시간 체결 기반) - 재매수 제한 확인 포함
             if stock_code not in self.tracking_stocks:
                 # 등락률이 15% 이상인 종목을 자동 추적에 추가 (강한 상승세)
@@ -611,59 +827,40 @@ class TumepokEngine:
         """추적 종목 업데이트"""
         try:
             tracking_info = self.tracking_stocks[stock_code]
-            tracking_info['current_price'] = current_price
+            tracking_info.current_price = current_price
 
             # 실시간 등락률이 있으면 업데이트 (당일 등락률만 저장)
             if change_rate is not None:
-                tracking_info['daily_change_rate'] = change_rate
+                tracking_info.daily_change_rate = change_rate
                 # 상승률은 누적 계산이므로 여기서는 업데이트하지 않음
 
-            base_price = tracking_info.get('base_price', tracking_info.get('start_price', 0))
-
-            # 고가 갱신 로직 통합
-            high_updated = False
-            final_high_price = tracking_info['high_price']
-
-            # 실시간 고가 정보가 있으면 우선 사용
-            if high_price is not None and high_price > 0:
-                # 키움 고가가 현재 고점보다 높으면 업데이트
-                if high_price > tracking_info['high_price']:
-                    old_high = tracking_info['high_price']
-                    tracking_info['high_price'] = high_price
-                    final_high_price = high_price
-                    high_updated = True
-                    log_info(f"실시간 고가 갱신: {stock_code} {old_high:,}원 → {high_price:,}원")
-                # 현재가가 키움 고가보다도 높으면 현재가로 갱신
-                elif current_price > high_price and current_price > tracking_info['high_price']:
-                    old_high = tracking_info['high_price']
-                    tracking_info['high_price'] = current_price
-                    final_high_price = current_price
-                    high_updated = True
-                    log_info(f"현재가가 키움고가 초과: {stock_code} {old_high:,}원 → {current_price:,}원 (키움고가: {high_price:,}원)")
-            else:
-                # 고가 정보가 없으면 현재가로만 고점 갱신
-                if current_price > tracking_info['high_price']:
-                    old_high = tracking_info['high_price']
-                    tracking_info['high_price'] = current_price
-                    final_high_price = current_price
-                    high_updated = True
-                    log_info(f"현재가 고점 갱신: {stock_code} {old_high:,}원 → {current_price:,}원")
+            base_price = tracking_info.base_price
+            if base_price is None:
+                base_price = tracking_info.start_price
+
+            # 고가 갱신: 기존 고점, 키움 실시간 고가, 현재가 중 최댓값
+            old_high = tracking_info.high_price
+            final_high_price = old_high
+            if high_price and high_price > final_high_price:
+                final_high_price = high_price
+            if current_price > final_high_price:
+                final_high_price = current_price
 
             # 고가가 갱신되었으면 상승일수 증가
-            if high_updated:
-                tracking_info['rise_days'] += 1
-                tracking_info.setdefault('waiting_days', 0)
-                tracking_info['waiting_days'] = 0
-                tracking_info['status'] = TRACKING_STATUS['TRACKING']
+            if final_high_price != old_high:
+                tracking_info.high_price = final_high_price
+                log_info(f"고점 갱신: {stock_code} {old_high:,}원 → {final_high_price:,}원 (현재가: {current_price:,}원, 키움고가: {high_price or 0:,}원)")
+                tracking_info.rise_days += 1
+                tracking_info.waiting_days = 0
+                tracking_info.status = TRACKING_STATUS['TRACKING']
             
             # 하락률 계산 (고점 대비)
-            final_high_price = tracking_info['high_price']
             if final_high_price > 0:
                 drop_rate = (final_high_price - current_price) / final_high_price * 100
-                tracking_info['drop_rate'] = drop_rate
+                tracking_info.drop_rate = drop_rate
             else:
                 drop_rate = 0
-                tracking_info['drop_rate'] = 0
+                tracking_info.drop_rate = 0
 
             # 현재 상승률 계산 (기준가 대비)
             if base_price > 0:
@@ -673,7 +870,7 @@ class TumepokEngine:
             
             # 누적 상승률을 현재 상승률로 설정 (고점 기준 상승률)
             cumulative_rise_rate = current_rise_rate
-            tracking_info['cumulative_rise_rate'] = cumulative_rise_rate
+            tracking_info.cumulative_rise_rate = cumulative_rise_rate
             
             # 투매폭 진입 조건 확인 (누적 상승률에 따른 적정 하락폭)
             target_drops = self._get_target_drop_rates(cumulative_rise_rate)
@@ -683,7 +880,7 @@ class TumepokEngine:
             # 손절 체크 (최대 하락폭 초과 시)
             if drop_rate > stop_loss_rate:
                 # 포지션이 있으면 손절, 없으면 추적 중단
-                if tracking_info.get('bought_stages'):
+                if tracking_info.bought_stages:
                     # 중복 손절 실행 방지 체크
                     position = self.positions.get(stock_code, {})
                     if not position.get('stop_loss_executed', False):
@@ -693,12 +890,12 @@ class TumepokEngine:
                         log_debug(f"손절 이미 실행됨 - 스킵: {stock_code}")
                 else:
                     log_info(f"추적 중단: {stock_code} - 적정 하락폭 이탈 (하락률: {drop_rate:.1f}%)")
-                    tracking_info['status'] = TRACKING_STATUS.get('STOPPED', 'STOPPED')
+                    tracking_info.status = TRACKING_STATUS.get('STOPPED', 'STOPPED')
                 return
             
             # 적정 하락폭 범위 내에서 매수 검토
             if min_drop_rate <= drop_rate <= stop_loss_rate:
-                tracking_info['status'] = TRACKING_STATUS['READY']
+                tracking_info.status = TRACKING_STATUS['READY']
                 
                 # 매수 단계 확인 후 조건 검토
                 buy_stage = self._get_buy_stage(stock_code, current_price)
@@ -709,15 +906,14 @@ class TumepokEngine:
                 else:
                     log_debug(f"투매폭 대기: {stock_code}, 하락률: {drop_rate:.1f}% "
                              f"(범위: {min_drop_rate:.1f}% ~ {stop_loss_rate:.1f}%)")
-            elif tracking_info['status'] == TRACKING_STATUS['TRACKING']:
+            elif tracking_info.status == TRACKING_STATUS['TRACKING']:
                 # 반등 대기 시작
-                tracking_info['status'] = TRACKING_STATUS['WAITING']
-                tracking_info.setdefault('waiting_days', 0)
-                tracking_info['waiting_days'] += 1
+                tracking_info.status = TRACKING_STATUS['WAITING']
+                tracking_info.waiting_days += 1
                 
                 # 3일 대기 후 강제 진입
-                if tracking_info['waiting_days'] >= 3:
-                    tracking_info['status'] = TRACKING_STATUS['READY']
+                if tracking_info.waiting_days >= 3:
+                    tracking_info.status = TRACKING_STATUS['READY']
                     
                     # 강제 진입 시에도 매수 단계 확인
                     buy_stage = self._get_buy_stage(stock_code, current_price)
@@ -734,45 +930,22 @@ class TumepokEngine:
     
     def _get_min_drop_rate(self, cumulative_rise_rate):
         """누적 상승률에 따른 최소 하락률 반환 (투매폭 매트릭스 기준)"""
-        for matrix_row in TUMEPOK_MATRIX:
-            if matrix_row['rise_min'] <= cumulative_rise_rate <= matrix_row['rise_max']:
-                return matrix_row['drop_min']
-        
-        # 범위를 벗어나는 경우 마지막 구간 사용
-        return TUMEPOK_MATRIX[-1]['drop_min']
+        return self._get_target_drop_rates(cumulative_rise_rate)['1차']
     
     def _get_target_drop_rates(self, cumulative_rise_rate):
-        """누적 상승률에 따른 투매폭 매수선별 하락률 반환"""
-        # 투매폭 매트릭스에서 해당 구간 찾기
-        for matrix_row in TUMEPOK_MATRIX:
-            if matrix_row['rise_min'] <= cumulative_rise_rate <= matrix_row['rise_max']:
-                drop_min = matrix_row['drop_min']
-                drop_max = matrix_row['drop_max']
-                # 3단계 매수선 계산 (적정 하락폭 범위 내에서만)
-                # 1차: 최소 하락폭 진입
-                # 2차: 중간 지점
-                # 3차: 최대 하락폭의 90% (여유 10% 확보)
-                drop_mid = drop_min + (drop_max - drop_min) * 0.5
-                drop_3rd = drop_min + (drop_max - drop_min) * 0.9  # 최대 하락폭의 90%
-                return {
-                    '1차': drop_min,      # 1차선: 최소 하락폭
-                    '2차': drop_mid,      # 2차선: 중간 하락폭  
-                    '3차': drop_3rd,      # 3차선: 최대 하락폭의 90%
-                    '손절': drop_max      # 손절선: 최대 하락폭 초과
-                }
+        """누적 상승률에 따른 투매폭 매수선별 하락률 반환 (미리 계산된 표 조회, 반환값은 수정하지 말 것)"""
+        if self._drop_bisect:
+            # 투매폭 매트릭스에서 해당 구간 찾기 (rise_min 기준 이분 탐색)
+            idx = bisect_right(self._drop_rise_mins, cumulative_rise_rate) - 1
+            if idx >= 0 and cumulative_rise_rate <= self._drop_rise_maxs[idx]:
+                return self._drop_rows[idx]
+        else:
+            for rise_min, rise_max, drops in self._drop_rows_ordered:
+                if rise_min <= cumulative_rise_rate <= rise_max:
+                    return drops
         
         # 범위를 벗어나는 경우 마지막 구간 사용
-        last_row = TUMEPOK_MATRIX[-1]
-        drop_min = last_row['drop_min']
-        drop_max = last_row['drop_max']
-        drop_mid = drop_min + (drop_max - drop_min) * 0.5
-        drop_3rd = drop_min + (drop_max - drop_min) * 0.9
-        return {
-            '1차': drop_min,
-            '2차': drop_mid,
-            '3차': drop_3rd,
-            '손절': drop_max
-        }
+        return self._drop_fallback
     
     def check_buy_conditions(self, stock_code):
         """매수 조건 확인"""
@@ -786,9 +959,9 @@ class TumepokEngine:
                     return
             
             tracking_info = self.tracking_stocks[stock_code]
-            current_price = tracking_info['current_price']
-            high_price = tracking_info['high_price']
-            rise_rate = tracking_info['rise_rate']
+            current_price = tracking_info.current_price
+            high_price = tracking_info.high_price
+            rise_rate = tracking_info.rise_rate
             
             # 매수 단계 판단
             buy_stage = TumepokCalculator.determine_buy_stage(current_price, high_price, rise_rate)
@@ -797,16 +970,16 @@ class TumepokEngine:
                 return
             
             # 이미 해당 단계를 매수했는지 확인
-            if buy_stage in tracking_info['bought_stages']:
+            if tracking_info.has_bought_stage(buy_stage):
                 return
             
-            # 지지 조건 확인
-            conditions_met = self.check_support_conditions(stock_code, tracking_info)
-            
             # 단계별 조건 완화 적용
             condition_requirements = self.config.get_condition_requirements()
             required_conditions = condition_requirements.get(buy_stage, 2)
             
+            # 지지 조건 확인
+            conditions_met = self.check_support_conditions(stock_code, tracking_info, required_conditions)
+            
             # 투매폭 계산기를 이용한 매수 단계 검증
             buy_stage_calculated = self._get_buy_stage(stock_code, current_price)
             if buy_stage != buy_stage_calculated:
@@ -814,9 +987,9 @@ class TumepokEngine:
                 return
             
             if conditions_met >= required_conditions:
-                log_info(f"매수 조건 충족: {tracking_info.get('stock_name', stock_code)}({stock_code}) "
+                log_info(f"매수 조건 충족: {tracking_info.stock_name or stock_code}({stock_code}) "
                         f"{buy_stage} - 지지조건 {conditions_met}/{required_conditions}개, "
-                        f"하락률 {tracking_info.get('drop_rate', 0):.1f}%")
+                        f"하락률 {tracking_info.drop_rate:.1f}%")
                 self.execute_buy_order(stock_code, buy_stage)
             else:
                 log_debug(f"지지조건 부족: {stock_code}, 충족: {conditions_met}/{required_conditions}")
@@ -831,27 +1004,21 @@ class TumepokEngine:
                 return 'WAIT'
             
             tracking_info = self.tracking_stocks[stock_code]
-            high_price = tracking_info['high_price']
-            drop_rate = tracking_info.get('drop_rate', 0)
-            cumulative_rise_rate = tracking_info.get('cumulative_rise_rate', tracking_info.get('rise_rate', 0))
+            high_price = tracking_info.high_price
+            drop_rate = tracking_info.drop_rate
+            cumulative_rise_rate = tracking_info.cumulative_rise_rate
+            if cumulative_rise_rate is None:
+                cumulative_rise_rate = tracking_info.rise_rate
             
             # 투매폭 매트릭스에 따른 단계별 하락률 기준
             target_drops = self._get_target_drop_rates(cumulative_rise_rate)
+            reached = self._count_reached_lines(drop_rate, target_drops)
             
-            # 이미 매수한 단계 확인
-            bought_stages = tracking_info.get('bought_stages', set())
-            
-            # 1차: 최소 하락폭 도달
-            if drop_rate >= target_drops['1차'] and '1차' not in bought_stages:
-                return '1차'
-            
-            # 2차: 중간 하락폭 도달
-            if drop_rate >= target_drops['2차'] and '2차' not in bought_stages:
-                return '2차'
-            
-            # 3차: 최대 하락폭의 90% 도달
-            if drop_rate >= target_drops['3차'] and '3차' not in bought_stages:
-                return '3차'
+            # 도달한 매수선(1차 → 2차 → 3차) 중 아직 매수하지 않은 첫 단계
+            bought_stages = tracking_info.bought_stages
+            for stage in _STAGE_BY_REACHED[1:reached + 1]:
+                if not bought_stages & BUY_STAGE_BITS[stage]:
+                    return stage
             
             return 'WAIT'
             
@@ -859,8 +1026,8 @@ class TumepokEngine:
             log_error(f"매수 단계 결정 실패: {stock_code}, {str(e)}")
             return 'WAIT'
     
-    def check_support_conditions(self, stock_code, tracking_info):
-        """지지 조건 확인 (SupportAnalyzer 활용)"""
+    def check_support_conditions(self, stock_code, tracking_info, required_count=None):
+        """지지 조건 확인 (SupportAnalyzer 활용, required_count 미달이 확정되면 나머지 조건 확인 생략)"""
         try:
             if not self.support_analyzer:
                 log_warning(f"지지 조건 분석기 없음: {stock_code}")
@@ -868,7 +1035,7 @@ class TumepokEngine:
             
             # 지지 조건 분석 실행
             analysis_result = self.support_analyzer.check_all_conditions(
-                stock_code, tracking_info, condition_confirmed=False
+                stock_code, tracking_info, condition_confirmed=False, required_count=required_count
             )
             
             satisfied_count = analysis_result.get('satisfied_count', 0)
@@ -898,8 +1065,8 @@ class TumepokEngine:
         """매수 주문 실행"""
         try:
             tracking_info = self.tracking_stocks[stock_code]
-            current_price = tracking_info['current_price']
-            rise_days = tracking_info['rise_days']
+            current_price = tracking_info.current_price
+            rise_days = tracking_info.rise_days
             
             # 포지션 크기 계산
             base_amount = self.config.get_base_buy_amount()
@@ -954,7 +1121,7 @@ class TumepokEngine:
                 return
             
             # 매수 단계 기록 (메모리)
-            tracking_info['bought_stages'].add(buy_stage)
+            tracking_info.add_bought_stage(buy_stage)
             
             # 매수 단계 기록 (영구 저장 - RiseTracker에 기록)
             if hasattr(self, 'rise_tracker') and self.rise_tracker:
@@ -968,7 +1135,7 @@ class TumepokEngine:
             if hasattr(self.main_window, 'data_manager'):
                 self.main_window.data_manager.add_auto_trade_info(
                     종목코드=stock_code,
-                    종목명=tracking_info['stock_name'],
+                    종목명=tracking_info.stock_name,
                     매수매도="매수",
                     수량=quantity,
                     가격=order_price,
@@ -981,7 +1148,7 @@ class TumepokEngine:
             
             # 조건식 확인 정보 포함 로깅
             condition_info = f" (조건식확인: {condition_confirmed})" if condition_confirmed else ""
-            log_trading(f"투매폭 {buy_stage} 매수주문: {tracking_info['stock_name']}({stock_code}), "
+            log_trading(f"투매폭 {buy_stage} 매수주문: {tracking_info.stock_name}({stock_code}), "
                        f"수량: {quantity:,}주, 금액: {stage_amount:,}원{condition_info}")
             
         except Exception as e:
@@ -1022,8 +1189,7 @@ class TumepokEngine:
                 buy_stage = self._get_buy_stage_from_drop_rate(drop_rate, target_drops)
                 
                 # 이미 매수한 단계인지 확인
-                bought_stages = getattr(tracking_info, 'bought_stages', [])
-                if buy_stage in bought_stages:
+                if tracking_info.has_bought_stage(buy_stage):
                     log_debug(f"이미 매수한 단계: {stock_code} - {buy_stage}")
                     return
                 
@@ -1035,9 +1201,7 @@ class TumepokEngine:
                                 f"{buy_stage} 단계, 하락률: {drop_rate:.1f}%")
                         
                         # 매수 단계 기록
-                        if not hasattr(tracking_info, 'bought_stages'):
-                            tracking_info.bought_stages = set()
-                        tracking_info.bought_stages.add(buy_stage)
+                        tracking_info.add_bought_stage(buy_stage)
                         
                         # 데이터 저장
                         self.save_rise_tracker_data()
@@ -1049,17 +1213,20 @@ class TumepokEngine:
         except Exception as e:
             log_error(f"투매폭 신호 처리 실패: {stock_code}, {str(e)}")
     
+    @staticmethod
+    def _count_reached_lines(drop_rate, target_drops):
+        """하락률이 도달한 매수선 개수 (1차 ≤ 2차 ≤ 3차 정렬 기준, bisect로 한 번에 판정)"""
+        if drop_rate != drop_rate:  # NaN이면 어떤 매수선에도 도달하지 않음
+            return 0
+        lines = getattr(target_drops, 'lines', None)
+        if lines is None:
+            lines = (target_drops['1차'], target_drops['2차'], target_drops['3차'])
+        return bisect_right(lines, drop_rate)
+    
     def _get_buy_stage_from_drop_rate(self, drop_rate, target_drops):
         """하락률에 따른 매수 단계 결정"""
         try:
-            if drop_rate >= target_drops['3차']:
-                return '3차'
-            elif drop_rate >= target_drops['2차']:
-                return '2차'
-            elif drop_rate >= target_drops['1차']:
-                return '1차'
-            else:
-                return 'WAIT'
+            return _STAGE_BY_REACHED[self._count_reached_lines(drop_rate, target_drops)]
         except Exception as e:
             log_error(f"매수 단계 결정 실패: {str(e)}")
             return 'WAIT'
@@ -1076,17 +1243,17 @@ class TumepokEngine:
                 'rise_rate': tracking_info.rise_rate,
                 'drop_rate': tracking_info.drop_rate,
                 'rise_days': tracking_info.rise_days,
-                'bought_stages': getattr(tracking_info, 'bought_stages', set()),
+                'bought_stages': set(tracking_info.get_bought_stage_list()),
                 'status': getattr(tracking_info, 'status', 'READY')
             }
             
-            # 지지 조건 확인
-            conditions_met = self.check_support_conditions(stock_code, legacy_tracking_info)
-            
             # 단계별 요구 사항 확인
             condition_requirements = self.config.get_condition_requirements() if self.config else {'1차': 1, '2차': 2, '3차': 2}
             required_conditions = condition_requirements.get(buy_stage, 2)
             
+            # 지지 조건 확인
+            conditions_met = self.check_support_conditions(stock_code, legacy_tracking_info, required_conditions)
+            
             if conditions_met >= required_conditions:
                 # 매수 실행
                 self.execute_buy_order_direct(stock_code, buy_stage, legacy_tracking_info)
@@ -1314,7 +1481,7 @@ class TumepokEngine:
 
             # 추적 및 포지션 정리
             if stock_code in self.tracking_stocks:
-                self.tracking_stocks[stock_code]['status'] = TRACKING_STATUS.get('STOPPED', 'STOPPED')
+                self.tracking_stocks[stock_code].status = TRACKING_STATUS.get('STOPPED', 'STOPPED')
 
             # 포지션을 매도 대기 상태로 변경 (중복 실행 완전 방지)
             position['status'] = 'SELLING'
@@ -1540,8 +1707,8 @@ class TumepokEngine:
             # 추적에서 포지션으로 이동 (3단계 완료 시)
             if stock_code in self.tracking_stocks:
                 tracking_info = self.tracking_stocks[stock_code]
-                if len(tracking_info['bought_stages']) >= 3:
-                    tracking_info['status'] = TRACKING_STATUS['COMPLETED']
+                if tracking_info.bought_stages & _ALL_STAGES_BOUGHT == _ALL_STAGES_BOUGHT:
+                    tracking_info.status = TRACKING_STATUS['COMPLETED']
                     # 추적에서 제거하지 않고 완료 상태로 유지
 
             # stage_key 생성
@@ -1672,7 +1839,7 @@ class TumepokEngine:
             if position.get('sell_order_sent', False):
                 # 매도 주문 후 30초 경과 시 플래그 리셋 (주문 실패/체결 누락 대비)
                 sell_order_time = position.get('sell_order_time')
-                if sell_order_time and (datetime.now() - sell_order_time).total_seconds() > 30:  # 30초로 단축
+                if sell_order_time and (self._now() - sell_order_time).total_seconds() > 30:  # 30초로 단축
                     log_warning(f"매도 주문 30초 경과 - 플래그 리셋: {stock_code}")
                     position['sell_order_sent'] = False
                     position.pop('sell_order_time', None)
@@ -1977,7 +2144,15 @@ class TumepokEngine:
                 
                 # 매도된 종목이 있으면 상태를 '매도완료'로 표시
                 if sold_stocks and '종목코드' in full_tracking_df.columns:
-                    sold_mask = full_tracking_df['종목코드'].isin(sold_stocks)
+                    # RiseTracker DataFrame과 매도 종목이 그대로면 이전에 만든 사본 재사용
+                    sold_key = frozenset(sold_stocks)
+                    if full_tracking_df is self._sold_view_source and sold_key == self._sold_view_key:
+                        return self._sold_view
+                    source_df = full_tracking_df
+                    
+                    # RiseTracker가 재사용하는 DataFrame이므로 사본에 표시
+                    full_tracking_df = full_tracking_df.copy()
+                    sold_mask = full_tracking_df['종목코드'].isin(sold_key)
                     if '상태' not in full_tracking_df.columns:
                         full_tracking_df['상태'] = '추적중'
                     
@@ -1988,6 +2163,10 @@ class TumepokEngine:
                     sold_count = sold_mask.sum()
                     if sold_count > 0:
                         log_info(f"📊 추적현황에 매도 완료된 종목 {sold_count}개 상태 표시")
+                    
+                    self._sold_view_source = source_df
+                    self._sold_view_key = sold_key
+                    self._sold_view = full_tracking_df
             
             return full_tracking_df
             
@@ -2220,9 +2399,9 @@ class TumepokEngine:
                             'drop_rate': tracking_info.drop_rate,
                             'rise_rate': tracking_info.rise_rate,
                             'buy_stage': buy_stage,
-                            'bought_stages': getattr(tracking_info, 'bought_stages', []),
+                            'bought_stages': tracking_info.get_bought_stage_list(),
                             'status': getattr(tracking_info, 'status', 'UNKNOWN'),
-                            'target_drops': target_drops
+                            'target_drops': dict(target_drops)
                         })
             
             return ready_stocks
@@ -2234,6 +2413,7 @@ class TumepokEngine:
     def add_to_tracking(self, stock_code, current_price, change_rate=None):
         """추적 목록에 추가 (재매수 제한 확인 및 가격 필터 포함)"""
         try:
+            stock_code = _intern_code(stock_code)
             if stock_code in self.tracking_stocks:
                 return False
 
@@ -2255,25 +2435,22 @@ class TumepokEngine:
                     log_info(f"❌ 재매수 제한 종목 자동추가 스킵: {stock_code} - {restriction_days}일 제한 중")
                     return False
 
-            max_tracking = self.config.get_max_tracking_stocks()
+            max_tracking = self._max_tracking
             if len(self.tracking_stocks) >= max_tracking:
                 return False
             
             # 추적 정보 생성 (간소화)
-            self.tracking_stocks[stock_code] = {
-                'stock_code': stock_code,
-                'stock_name': f'종목{stock_code}',
-                'start_price': current_price,
-                'current_price': current_price,
-                'high_price': current_price,
-                'daily_change_rate': change_rate if change_rate is not None else 0.0,  # 당일 등락률
-                'rise_rate': 0.0,  # 누적 상승률 (시작시에는 0)
-                'drop_rate': 0.0,
-                'rise_days': 1,
-                'status': 'TRACKING',
-                'bought_stages': set(),
-                'start_time': datetime.now()
-            }
+            self.tracking_stocks[stock_code] = TrackingInfo(
+                stock_code=stock_code,
+                stock_name=f'종목{stock_code}',
+                start_price=current_price,
+                current_price=current_price,
+                high_price=current_price,
+                daily_change_rate=change_rate if change_rate is not None else 0.0,  # 당일 등락률
+                rise_rate=0.0,  # 누적 상승률 (시작시에는 0)
+                status='TRACKING',
+                created_time=self._now()
+            )
             
             log_debug(f"추적 목록 추가: {stock_code} @ {current_price:,}원")
             return True
@@ -2289,13 +2466,13 @@ class TumepokEngine:
                 return
             
             tracking_info = self.tracking_stocks[stock_code]
-            tracking_info['current_price'] = current_price
+            tracking_info.current_price = current_price
             
             # 간단한 상승률 계산
-            start_price = tracking_info['start_price']
+            start_price = tracking_info.start_price
             if start_price > 0:
                 rise_rate = ((current_price - start_price) / start_price) * 100
-                tracking_info['rise_rate'] = rise_rate
+                tracking_info.rise_rate = rise_rate
             
             log_debug(f"추적 종목 업데이트: {stock_code} @ {current_price:,}원")
             
@@ -2325,7 +2502,7 @@ class TumepokEngine:
             
             # 각 급등주에 대해 처리
             for stock_info in rising_stocks:
-                stock_code = stock_info.get('종목코드')
+                stock_code = _intern_code(stock_info.get('종목코드'))
                 stock_name = stock_info.get('종목명', '')
                 current_price = stock_info.get('현재가', 0)
                 change_rate = stock_info.get('등락률', 0)
@@ -2352,7 +2529,7 @@ class TumepokEngine:
                     continue
                 
                 # 최대 추적 종목 수 확인
-                max_tracking = self.config.get_max_tracking_stocks() if self.config else 10
+                max_tracking = self._max_tracking
                 if len(self.tracking_stocks) >= max_tracking:
                     log_debug(f"최대 추적 종목 수 초과: {len(self.tracking_stocks)}/{max_tracking}")
                     break
@@ -2441,61 +2618,61 @@ class TumepokEngine:
         """테스트용 추적 데이터 추가"""
         try:
             # 테스트 데이터 1: 이화전기 (가상)
-            self.tracking_stocks['123456'] = {
-                'stock_code': '123456',
-                'stock_name': '이화전기',
-                'start_date': '20250903',
-                'start_price': 1000,  # 시작가
-                'base_price': 1000,   # 기준가
-                'high_price': 1450,   # 고점 (45% 상승)
-                'current_price': 1300, # 현재가 (고점에서 10% 하락)
-                'rise_days': 3,
-                'rise_rate': 45.0,    # 상승률
-                'drop_rate': 10.3,    # 하락률
-                'status': 'READY',
-                'waiting_days': 0,
-                'bought_stages': set(),
-                'target_drop_info': None,
-                'created_time': datetime.now()
-            }
+            self.tracking_stocks['123456'] = TrackingInfo(
+                stock_code='123456',
+                stock_name='이화전기',
+                start_date='20250903',
+                start_price=1000,  # 시작가
+                base_price=1000,   # 기준가
+                high_price=1450,   # 고점 (45% 상승)
+                current_price=1300, # 현재가 (고점에서 10% 하락)
+                rise_days=3,
+                rise_rate=45.0,    # 상승률
+                drop_rate=10.3,    # 하락률
+                status='READY',
+                waiting_days=0,
+                bought_stages=0,
+                target_drop_info=None,
+                created_time=datetime.now()
+            )
             
             # 테스트 데이터 2: 이아이디 (가상)
-            self.tracking_stocks['234567'] = {
-                'stock_code': '234567',
-                'stock_name': '이아이디',
-                'start_date': '20250903',
-                'start_price': 2000,
-                'base_price': 2000,
-                'high_price': 2900,   # 45% 상승
-                'current_price': 2600, # 고점에서 10% 하락
-                'rise_days': 2,
-                'rise_rate': 45.0,
-                'drop_rate': 10.3,
-                'status': 'TRACKING',
-                'waiting_days': 0,
-                'bought_stages': set(),
-                'target_drop_info': None,
-                'created_time': datetime.now()
-            }
+            self.tracking_stocks['234567'] = TrackingInfo(
+                stock_code='234567',
+                stock_name='이아이디',
+                start_date='20250903',
+                start_price=2000,
+                base_price=2000,
+                high_price=2900,   # 45% 상승
+                current_price=2600, # 고점에서 10% 하락
+                rise_days=2,
+                rise_rate=45.0,
+                drop_rate=10.3,
+                status='TRACKING',
+                waiting_days=0,
+                bought_stages=0,
+                target_drop_info=None,
+                created_time=datetime.now()
+            )
             
             # 테스트 데이터 3: 이트론 (가상)
-            self.tracking_stocks['345678'] = {
-                'stock_code': '345678',
-                'stock_name': '이트론',
-                'start_date': '20250903',
-                'start_price': 1500,
-                'base_price': 1500,
-                'high_price': 2175,   # 45% 상승
-                'current_price': 1950, # 고점에서 10% 하락
-                'rise_days': 4,
-                'rise_rate': 45.0,
-                'drop_rate': 10.3,
-                'status': 'READY',
-                'waiting_days': 0,
-                'bought_stages': {'1차'},
-                'target_drop_info': None,
-                'created_time': datetime.now()
-            }
+            self.tracking_stocks['345678'] = TrackingInfo(
+                stock_code='345678',
+                stock_name='이트론',
+                start_date='20250903',
+                start_price=1500,
+                base_price=1500,
+                high_price=2175,   # 45% 상승
+                current_price=1950, # 고점에서 10% 하락
+                rise_days=4,
+                rise_rate=45.0,
+                drop_rate=10.3,
+                status='READY',
+                waiting_days=0,
+                bought_stages=BUY_STAGE_BITS['1차'],
+                target_drop_info=None,
+                created_time=datetime.now()
+            )
             
             log_info("테스트 추적 데이터 3개 추가 완료")
             
@@ -2618,6 +2795,7 @@ class TumepokEngine:
         """투매폭 설정 업데이트"""
         try:
             self.config = new_config
+            self.reload_config()
 
             # RiseTracker에도 설정 업데이트
             if hasattr(self, 'rise_tracker') and self.rise_tracker:
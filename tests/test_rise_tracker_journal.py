@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+RiseTracker 저장 경로(스냅샷 + 저널) 복구 테스트
+실행: python -m pytest tests
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class _FakeQTimer:
+    """singleShot 예약만 기록하고 실행하지 않는 QTimer (타이머가 돌기 전에 종료된 상황)"""
+    scheduled = []
+
+    @classmethod
+    def singleShot(cls, delay_ms, callback):
+        cls.scheduled.append((delay_ms, callback))
+
+
+@pytest.fixture
+def rise_tracker(monkeypatch):
+    qtcore = types.ModuleType('PyQt5.QtCore')
+    qtcore.QTimer = _FakeQTimer
+    pyqt5 = types.ModuleType('PyQt5')
+    pyqt5.QtCore = qtcore
+    monkeypatch.setitem(sys.modules, 'PyQt5', pyqt5)
+    monkeypatch.setitem(sys.modules, 'PyQt5.QtCore', qtcore)
+    monkeypatch.setattr(_FakeQTimer, 'scheduled', [])
+
+    from strategy import rise_tracker
+    return rise_tracker
+
+
+def _new_tracker(rise_tracker, filepath):
+    tracker = rise_tracker.RiseTracker()
+    assert tracker.load_tracking_data(filepath)
+    return tracker
+
+
+def test_bought_stage_survives_crash_after_high_update(rise_tracker, tmp_path):
+    filepath = str(tmp_path / 'tracking.json')
+    tracker = _new_tracker(rise_tracker, filepath)
+    assert tracker.add_stock('005930', 10000.0)
+    assert tracker.flush_dirty()
+
+    # 고점 갱신으로 30초 스냅샷 타이머가 먼저 걸린 상태에서 매수 단계 기록
+    assert tracker.journal_update('005930')
+    assert tracker.update_bought_stages('005930', '1차')
+
+    delays = [delay for delay, _ in _FakeQTimer.scheduled]
+    assert tracker.SNAPSHOT_INTERVAL_MS in delays
+    assert tracker.SAVE_DEBOUNCE_MS in delays
+
+    # 어떤 타이머도 실행되기 전에 종료 -> 재시작 시 저널 재생으로 매수 단계 복구
+    tracker.close_journal()
+    restarted = _new_tracker(rise_tracker, filepath)
+    assert restarted.tracking_stocks['005930'].has_bought_stage('1차')
+
+
+def test_shorter_delay_replaces_pending_snapshot_timer(rise_tracker, tmp_path):
+    tracker = _new_tracker(rise_tracker, str(tmp_path / 'tracking.json'))
+
+    tracker._schedule_save(tracker.SNAPSHOT_INTERVAL_MS)
+    tracker._schedule_save()
+    tracker._schedule_save(tracker.SNAPSHOT_INTERVAL_MS)
+
+    delays = [delay for delay, _ in _FakeQTimer.scheduled]
+    assert delays == [tracker.SNAPSHOT_INTERVAL_MS, tracker.SAVE_DEBOUNCE_MS]
+
+
+def test_failed_snapshot_keeps_previous_snapshot_and_journal(rise_tracker, tmp_path, monkeypatch):
+    filepath = str(tmp_path / 'tracking.json')
+    tracker = _new_tracker(rise_tracker, filepath)
+    assert tracker.add_stock('005930', 10000.0)
+    assert tracker.save_tracking_data(filepath)
+    assert tracker.update_bought_stages('005930', '1차')
+    with open(filepath, 'rb') as f:
+        snapshot = f.read()
+
+    # 임시 파일을 쓰고 교체하기 전에 실패
+    def fail_replace(src, dst):
+        raise OSError("디스크 가득 참")
+    with monkeypatch.context() as patch:
+        patch.setattr(rise_tracker.os, 'replace', fail_replace)
+        assert not tracker.save_tracking_data(filepath)
+
+    with open(filepath, 'rb') as f:
+        assert f.read() == snapshot
+    assert not os.path.exists(filepath + '.tmp')
+    assert os.path.getsize(filepath + tracker.JOURNAL_SUFFIX) > 0
+
+    tracker.close_journal()
+    restarted = _new_tracker(rise_tracker, filepath)
+    assert restarted.tracking_stocks['005930'].has_bought_stage('1차')